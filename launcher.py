@@ -7,7 +7,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "src
 import logging
 import random
 import time
-from dataclasses import asdict
+from dataclasses import asdict, replace
 from pathlib import Path
 from typing import Any, Dict, List, NoReturn, Optional
 
@@ -29,7 +29,7 @@ except ImportError as e:
     USING_NEW_SYSTEMS = False
     logger.info("Using legacy systems")
 
-from main import SimulacraGame, run_simulacra, select_trait_loadout
+from main import RunServices, SimulacraGame, run_simulacra, select_trait_loadout
 from modules.achievements import AchievementManager
 from modules.config_manager import ConfigurationManager, GameConfig
 from modules.constants import *
@@ -37,6 +37,8 @@ from modules.credits import display_credits
 from modules.error_handler import GameError, handle_error
 from modules.highlights import HighlightManager
 from modules.logger import logger, setup_logging
+from modules.metrics import start_exporters_from_env
+from modules.save_load import SaveManager
 from modules.vault import VaultManager
 from simulacra.core.player import Player, PlayerConfig  # Use this instead
 from simulacra.ui.menu import MenuScreen
@@ -50,6 +52,7 @@ class SimulacraLauncher:
         self.vault_manager: Optional[VaultManager] = None
         self.achievement_manager: Optional[AchievementManager] = None
         self.highlight_manager: Optional[HighlightManager] = None
+        self.save_manager: Optional[SaveManager] = None
         self.game_config: Optional[GameConfig] = None
         self.trait_system = TraitSystem() if USING_NEW_SYSTEMS else None
         self.mutation_system = MutationSystem() if USING_NEW_SYSTEMS else None
@@ -62,6 +65,8 @@ class SimulacraLauncher:
             # Set up logging first
             setup_logging()
             logger.info("Starting Simulacra initialization...")
+            # Headless fleets set SIMULACRA_METRICS_FILE / SIMULACRA_METRICS_PORT
+            start_exporters_from_env()
 
             # Create required directories
             self._create_directories()
@@ -75,6 +80,9 @@ class SimulacraLauncher:
             self.game_config = self.config_manager.load_config()
             if not self.game_config:
                 raise RuntimeError("Failed to load game configuration")
+            if self.game_config.debug_mode:
+                # SIMULACRA_DEBUG enables it too; neither can turn the other off
+                logger.set_debug(True)
 
             self.vault_manager = VaultManager()
             if not self.vault_manager:
@@ -88,6 +96,8 @@ class SimulacraLauncher:
             if not self.highlight_manager:
                 raise RuntimeError("Failed to initialize HighlightManager")
 
+            self.save_manager = SaveManager()
+
             # Initialize trait system
             if USING_NEW_SYSTEMS:
                 self._load_test_data()
@@ -139,9 +149,11 @@ class SimulacraLauncher:
 
         try:
             from modules.shop import show_shop
+            # Cheap now: the config service only re-reads after the file changes
+            self.game_config = self.config_manager.load_config()
             new_rp = show_shop(self.game_config.reflection_points)
             if new_rp != self.game_config.reflection_points:
-                self.game_config.reflection_points = new_rp
+                self.game_config = replace(self.game_config, reflection_points=new_rp)
                 self.config_manager.save(self.game_config)
         except Exception as e:
             logger.error(f"Shop interface failed: {e}")
@@ -154,6 +166,7 @@ class SimulacraLauncher:
             return
 
         try:
+            self.game_config = self.config_manager.load_config()
             print(f"\n{CYAN}🧬 Player Profile{RESET}")
             print(f"{WHITE}{'='*44}{RESET}")
             print(f"Trait Slots: {self.game_config.trait_slots}")
@@ -171,6 +184,8 @@ class SimulacraLauncher:
                 print("\nAchievements: Not available")
 
             print(f"{WHITE}{'='*44}{RESET}")
+            if self.save_manager:
+                self.save_manager.display_stats()
         except Exception as e:
             logger.error(f"Profile display failed: {e}")
             print(f"\n{RED}Error displaying profile: {e}{RESET}")
@@ -286,6 +301,7 @@ class SimulacraLauncher:
                         input("\nPress Enter to return...")
 
                     case "0":  # Exit
+                        self.achievement_manager.flush()
                         print(f"\n{RED}Breathing terminated. See you next cycle.{RESET}")
                         break
 
@@ -334,6 +350,8 @@ def main() -> None:
         trait_system = TraitSystem()
         mutation_system = MutationSystem()
         mutation_system._initialize_mutations()
+        # One set of managers for the session; every finished run saves through it
+        services = RunServices(SaveManager(), AchievementManager(), HighlightManager())
         logger.info("Game initialized successfully")
 
         while True:
@@ -341,7 +359,7 @@ def main() -> None:
 
             if choice == 1:
                 os.system('cls' if os.name == 'nt' else 'clear')
-                game = SimulacraGame(trait_system, mutation_system)
+                game = SimulacraGame(trait_system, mutation_system, services=services)
                 game.run()
                 input(f"\n{Fore.YELLOW}Press Enter to continue...{Style.RESET_ALL}")
             elif choice == 2:
@@ -1,4 +1,8 @@
-from typing import List, Dict, Optional
+from typing import TYPE_CHECKING, List, Dict, Optional
+from dataclasses import dataclass
+from copy import deepcopy
+from datetime import datetime
+from functools import partial
 import time
 import random
 from colorama import Fore, Style
@@ -21,13 +25,29 @@ from simulacra.core.constants import (
 )
 
 # UI imports
-from simulacra.ui.hud import HUDManager
+from simulacra.ui.hud import HUDManager, HUDSnapshot
+from simulacra.ui.scheduler import RenderScheduler
 from simulacra.ui.sound import SoundManager
 from simulacra.ui.start_screen import StartScreen
 
 # Logging
 from modules.logger import logger
 
+# Persistence
+from modules.persistence_worker import Priority, persistence_worker
+from modules.config_manager import load_game_config
+from modules.lazy_import import lazy_import
+from modules.metrics import (DAMAGE_TAKEN, DISASTERS, HUD_FRAME_SECONDS, HUD_FRAMES_DROPPED,
+                             MUTATIONS, PLAYER_HP, RUNS, TICKS)
+
+if TYPE_CHECKING:
+    from modules.achievements import AchievementManager
+    from modules.highlights import HighlightManager
+    from modules.save_load import SaveManager
+
+# Event files need NumPy; load it when a run starts, not when the menu opens
+event_log = lazy_import("modules.event_log")
+
 
 def normalize_trait(trait: Dict) -> Dict:
     """Ensure trait has required structure"""
@@ -54,7 +74,8 @@ def normalize_trait(trait: Dict) -> Dict:
 
 class SimulacraGame:
 
-    def __init__(self, trait_system: TraitSystem, mutation_system: MutationSystem):
+    def __init__(self, trait_system: TraitSystem, mutation_system: MutationSystem,
+                 tick_interval: float = 1.0, services: Optional['RunServices'] = None):
         self.trait_system = trait_system
         self.mutation_system = mutation_system
         self.disaster_system = DisasterSystem()  # Add disaster system
@@ -72,6 +93,14 @@ class SimulacraGame:
         self.disaster_count = 0  # Add disaster counter
         self.is_running = False
         self.game_over = False
+        # Simulation speed is independent of the HUD frame rate
+        self.tick_interval = tick_interval
+        # Finished runs are saved through these; None leaves no trace on disk
+        self.services = services
+        self.hud = RenderScheduler(HUDManager.draw, fps=HUDManager.config.TARGET_FPS,
+                                   animating=lambda: HUDManager.animations.active,
+                                   frame_seconds=HUD_FRAME_SECONDS,
+                                   frames_dropped=HUD_FRAMES_DROPPED)
         self._initialize_game()
 
         # Ensure player starts with full health
@@ -114,21 +143,23 @@ class SimulacraGame:
             self.mutation_system.add_mutation(mutation)
 
     def _update_display(self) -> None:
-        """Update game display"""
-        HUDManager.update_hud(
+        """Hand the current state to the HUD; drawing happens on its own thread"""
+        self.hud.submit(HUDSnapshot.capture(
             self.player,
             self.trait_system,
             self.mutation_system,
             self.survival_seconds,
             self.entropy_drain,
             self.recent_disasters
-        )
+        ))
 
     def run(self) -> None:
         """Run the game loop"""
         StartScreen.show_title()
         logger.info("Starting new game")
         self.is_running = True
+        HUDManager.clear_overlay()
+        self.hud.start()
 
         while self.is_running:
             try:
@@ -138,6 +169,7 @@ class SimulacraGame:
                     break
 
                 self.survival_seconds += 1
+                TICKS.inc()
 
                 # Handle grace period
                 if self.survival_seconds > self.grace_period:
@@ -151,9 +183,10 @@ class SimulacraGame:
 
                 # Process mutations and update display
                 self._handle_mutations()
+                PLAYER_HP.set(self.player.health)
                 self._update_display()
 
-                time.sleep(1)
+                time.sleep(self.tick_interval)
 
             except KeyboardInterrupt:
                 self.is_running = False
@@ -163,11 +196,41 @@ class SimulacraGame:
                 self.is_running = False
                 break
 
-        # Show game over screen if health reached 0
+        # Show game over screen if health reached 0; the render thread plays it
         if self.game_over:
+            if self.services is not None:
+                persist_run(self._capture_run(), self.services)
             self._show_game_over()
+            # Frames are only drawn once a snapshot exists
+            self._update_display()
+            self.hud.wait_idle()
+
+        self.hud.stop()
+        stats = self.hud.stats()
+        logger.debug("HUD: %d frames, %d dropped, avg %.2fms", stats.frames_rendered,
+                     stats.frames_dropped, stats.avg_frame_time * 1000)
+        if self.game_over:
             logger.info(f"Game Over! Survived for {self.survival_seconds} seconds")
 
+    def _capture_run(self) -> 'RunRecord':
+        """Snapshot the finished run for the end-of-run jobs"""
+        stats = {
+            'current_hp': self.player.health,
+            'max_hp': self.player.config.max_health,
+            'mutation_rate': self.player.mutation_rate,
+            'entropy_drain': self.entropy_drain,
+            'resistances': self.player.resistances,
+            'immunities': self.player.immunities
+        }
+        traits = [trait for tid in sorted(self.player.active_traits)
+                  if (trait := self.trait_system.get_trait(tid)) is not None]
+        mutations = [
+            {'id': mutation.id, 'name': mutation.name, 'effect': mutation.description}
+            for mid in sorted(self.mutation_system.active_mutations)
+            if (mutation := self.mutation_system.get_mutation(mid)) is not None
+        ]
+        return RunRecord.capture(stats, traits, mutations, self.survival_seconds)
+
     def _handle_mutations(self) -> None:
         """Process mutation effects"""
         self.regen_tick += 1
@@ -191,6 +254,7 @@ class SimulacraGame:
             final_damage = self._calculate_disaster_damage(disaster, scaled_damage)
 
             self._handle_damage(final_damage)
+            DISASTERS.inc(type=disaster.type.value)
             self._update_disaster_history(disaster, final_damage)
             self._handle_mutation_chance(disaster)
 
@@ -229,6 +293,7 @@ class SimulacraGame:
         damage_dealt = old_health - self.player.health
 
         if damage_dealt > 0:
+            DAMAGE_TAKEN.observe(damage_dealt)
             HUDManager.flash_damage(damage_dealt)
             SoundManager.play('damage')
 
@@ -262,13 +327,85 @@ class SimulacraGame:
         )
 
 
+@dataclass(frozen=True)
+class RunRecord:
+    """Immutable end-of-run snapshot handed to the persistence worker"""
+    timestamp: str
+    survival_seconds: int
+    stats: Dict
+    traits: List[Dict]
+    mutations: List[Dict]
+
+    @classmethod
+    def capture(cls, stats: Dict, traits: List[Dict], mutations: List[Dict],
+                survival_seconds: int) -> 'RunRecord':
+        """Deep-copy run state so later game-thread changes cannot leak in"""
+        return cls(
+            timestamp=datetime.now().isoformat(),
+            survival_seconds=survival_seconds,
+            stats=deepcopy(stats),
+            traits=deepcopy(traits),
+            mutations=deepcopy(mutations)
+        )
+
+
+@dataclass(frozen=True)
+class RunServices:
+    """The launcher's long-lived managers, shared by every end-of-run job
+
+    Jobs must not build their own: a second SaveManager starts another
+    run-history compactor, and a second AchievementManager is overwritten
+    by the launcher's stale copy when it flushes on exit.
+    """
+    save_manager: 'SaveManager'
+    achievement_manager: 'AchievementManager'
+    highlight_manager: 'HighlightManager'
+
+
+def _save_run_history(save_manager: 'SaveManager', record: RunRecord) -> None:
+    from modules.save_load import RunData
+    save_manager.save_run(RunData(
+        timestamp=record.timestamp,
+        traits=record.traits,
+        mutations=record.mutations,
+        reflection_points=record.stats.get('reflection_points', 0),
+        survival_seconds=record.survival_seconds
+    ))
+
+
+def _save_run_highlight(highlight_manager: 'HighlightManager', record: RunRecord) -> None:
+    highlight_manager.save_highlight(record.stats, record.survival_seconds,
+                                     record.mutations, record.traits)
+
+
+def _save_run_achievements(services: RunServices, record: RunRecord) -> None:
+    # Runs after the CRITICAL history job, so the count includes this run
+    services.achievement_manager.check_run_achievements({
+        **record.stats,
+        "health": record.stats.get("current_hp"),
+        "survival_time": record.survival_seconds,
+        "mutations": record.mutations,
+        "total_runs": len(services.save_manager.history)
+    })
+
+
+def persist_run(record: RunRecord, services: RunServices) -> None:
+    """Queue every end-of-run write; returns without touching the disk"""
+    persistence_worker.submit("run history", partial(_save_run_history, services.save_manager),
+                              record, Priority.CRITICAL)
+    persistence_worker.submit("achievements",
+                              partial(_save_run_achievements, services), record)
+    persistence_worker.submit("highlight",
+                              partial(_save_run_highlight, services.highlight_manager), record)
+
+
 def run_simulacra(loadout: List[Dict]) -> None:
     """Run main game simulation"""
     if not loadout:
         logger.error("No loadout provided!")
         return
 
-    logger.info("Starting new run...", Fore.CYAN)
+    logger.info("Starting new run...", color=Fore.CYAN)
 
     # Process traits and calculate initial stats
     processed_loadout = [normalize_trait(trait) for trait in loadout]
@@ -279,15 +416,17 @@ def run_simulacra(loadout: List[Dict]) -> None:
     mutations = []
     recent_disasters = []
     mutation_system = MutationSystem()
+    events = event_log.EventRecorder.for_run()
 
     try:
         while stats['current_hp'] > 0:
             survival_seconds += 1
+            TICKS.inc()
 
             # Check for mutations
             if mutation := mutation_system.check_mutation(stats['mutation_rate']):
                 mutations.append(mutation)
-                logger.info(f"🧬 New mutation: {mutation['name']} - {mutation['effect']}", Fore.GREEN)
+                logger.info("🧬 New mutation: %s - %s", mutation["name"], mutation["effect"], color=Fore.GREEN)
 
                 # Apply mutation effects
                 effect = mutation['mechanical_effect']
@@ -302,6 +441,8 @@ def run_simulacra(loadout: List[Dict]) -> None:
                 elif effect['type'] == 'resistance_all':
                     for key in stats['resistances'].keys():
                         stats['resistances'][key] = min(100, stats['resistances'].get(key, 0) + effect['value'])
+                events.mutation(survival_seconds, stats['current_hp'])
+                MUTATIONS.inc()
 
             # Apply entropy drain with reduction
             entropy_reduction = stats.get('entropy_reduction', 0) / 100
@@ -312,7 +453,9 @@ def run_simulacra(loadout: List[Dict]) -> None:
             if survival_seconds % DISASTER_INTERVAL == 0:
                 disaster = DisasterSystem().generate_disaster()
                 if disaster["type"].lower() in stats["immunities"]:
-                    logger.info(f"🛡️ Immune to {disaster['type']} disasters!", Fore.GREEN)
+                    logger.info("🛡️ Immune to %s disasters!", disaster["type"], color=Fore.GREEN)
+                    events.record(survival_seconds, event_log.EventType.IMMUNE, hp_after=stats['current_hp'],
+                                  disaster_type=disaster["type"])
                 else:
                     base_damage = DisasterSystem().calculate_base_damage(disaster)
                     resistance = stats['resistances'].get(disaster['type'].lower(), 0) / 100
@@ -322,15 +465,24 @@ def run_simulacra(loadout: List[Dict]) -> None:
                         stats['current_hp'] = max(0, stats['current_hp'] - actual_damage)
                         recent_disasters.append(disaster)
                         recent_disasters = recent_disasters[-MAX_RECENT_DISASTERS:]
-                        logger.debug(f"Disaster damage after resistance: {actual_damage:.1f}")
-
-            update_hud(stats, processed_loadout, mutations, survival_seconds, entropy_drain, recent_disasters)
+                        logger.debug("Disaster damage after resistance: %.1f", actual_damage)
+                        events.disaster(survival_seconds, disaster["type"], actual_damage,
+                                        stats['current_hp'])
+                        DISASTERS.inc(type=disaster["type"].lower())
+                        DAMAGE_TAKEN.observe(actual_damage)
+
+            PLAYER_HP.set(stats['current_hp'])
+            with HUD_FRAME_SECONDS.time():
+                update_hud(stats, processed_loadout, mutations, survival_seconds, entropy_drain, recent_disasters)
             time.sleep(1)
 
     except Exception as e:
         logger.error(f"Main loop error: {str(e)}")
 
     finally:
+        events.record(survival_seconds, event_log.EventType.COLLAPSE, hp_after=stats['current_hp'])
+        events.close()
+        RUNS.inc()
         show_collapse_summary(
             hp_end=stats['current_hp'],
             mutation_rate_end=stats['mutation_rate'],
@@ -349,8 +501,7 @@ def select_trait_loadout(vault_manager) -> Optional[List[Dict]]:
         print(f"\n{Fore.RED}You need to unlock traits in the RP Shop first!{Style.RESET_ALL}")
         return None
 
-    config = ConfigurationManager().load_config()
-    slot_count = config.trait_slots
+    slot_count = load_game_config().trait_slots
 
     choice = input("\nChoose a loadout:\n"
                   "1. Pick traits manually\n"
@@ -0,0 +1,168 @@
+# modules/achievement_rules.py
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, Final, List, Mapping, Optional, Sequence
+from enum import IntEnum
+import math
+
+from modules.lazy_import import lazy_import
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+np = lazy_import("numpy")
+
+
+class Comparator(IntEnum):
+    """Comparison operators, stored as small ints in the compiled arrays"""
+    LT = 0
+    LE = 1
+    GT = 2
+    GE = 3
+    EQ = 4
+    NE = 5
+
+
+COMPARATOR_SYMBOLS: Final[Dict[str, Comparator]] = {
+    "<": Comparator.LT,
+    "<=": Comparator.LE,
+    ">": Comparator.GT,
+    ">=": Comparator.GE,
+    "==": Comparator.EQ,
+    "!=": Comparator.NE
+}
+
+# NumPy ufunc names, looked up on use so importing this module stays cheap
+_VECTOR_OPS: Final[Dict[Comparator, str]] = {
+    Comparator.LT: "less",
+    Comparator.LE: "less_equal",
+    Comparator.GT: "greater",
+    Comparator.GE: "greater_equal",
+    Comparator.EQ: "equal",
+    Comparator.NE: "not_equal"
+}
+
+
+def _vector_op(op: Comparator) -> Any:
+    return getattr(np, _VECTOR_OPS[op])
+
+
+@dataclass(frozen=True)
+class AchievementRule:
+    """Declarative unlock condition: stat <comparator> threshold"""
+    stat: str
+    comparator: str
+    threshold: float
+
+    def __post_init__(self):
+        if self.comparator not in COMPARATOR_SYMBOLS:
+            raise ValueError(f"Unknown comparator: {self.comparator}")
+
+    @property
+    def op(self) -> Comparator:
+        return COMPARATOR_SYMBOLS[self.comparator]
+
+    def evaluate(self, stats: Mapping[str, Any]) -> bool:
+        """Evaluate the rule against a single stats mapping"""
+        value = stat_value(stats.get(self.stat))
+        if math.isnan(value):
+            return False
+        return bool(_vector_op(self.op)(value, self.threshold))
+
+
+def stat_value(value: Any) -> float:
+    """Coerce a run stat to a number; collections count their items"""
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, (list, tuple, set, dict)):
+        return float(len(value))
+    return math.nan
+
+
+class CompiledRules:
+    """Rules for a set of achievements packed into NumPy arrays
+
+    Row i of every array belongs to the i-th achievement. Achievements
+    without a rule point at a sentinel stat slot that is always NaN,
+    so they never match.
+    """
+
+    def __init__(self, rules: Sequence[Optional[AchievementRule]]):
+        self.stat_keys: List[str] = []
+        self.stat_slots: Dict[str, int] = {}
+        count = len(rules)
+        stat_ids = np.empty(count, dtype=np.int32)
+        self.ops: NDArray[np.int8] = np.empty(count, dtype=np.int8)
+        self.thresholds: NDArray[np.float64] = np.empty(count, dtype=np.float64)
+
+        for idx, rule in enumerate(rules):
+            if rule is None:
+                stat_ids[idx] = -1
+                self.ops[idx] = Comparator.EQ
+                self.thresholds[idx] = 0.0
+                continue
+            slot = self.stat_slots.get(rule.stat)
+            if slot is None:
+                slot = self.stat_slots[rule.stat] = len(self.stat_keys)
+                self.stat_keys.append(rule.stat)
+            stat_ids[idx] = slot
+            self.ops[idx] = rule.op
+            self.thresholds[idx] = rule.threshold
+
+        # Sentinel slot at the end of the stat vector for rule-less rows
+        stat_ids[stat_ids < 0] = len(self.stat_keys)
+        self.stat_ids: NDArray[np.int32] = stat_ids
+        self._op_rows = {
+            op: np.flatnonzero(self.ops == op)
+            for op in Comparator
+            if np.any(self.ops == op)
+        }
+
+    def __len__(self) -> int:
+        return len(self.thresholds)
+
+    def stat_vector(self, stats: Mapping[str, Any]) -> NDArray[np.float64]:
+        """Build the stat vector (plus NaN sentinel) for a stats mapping"""
+        vector = np.full(len(self.stat_keys) + 1, np.nan)
+        for key, slot in self.stat_slots.items():
+            if key in stats:
+                vector[slot] = stat_value(stats[key])
+        return vector
+
+    def evaluate(self, stats: Mapping[str, Any]) -> NDArray[np.bool_]:
+        """Return a mask of achievements whose rule holds for the stats"""
+        return self.evaluate_vector(self.stat_vector(stats))
+
+    def rows_by_stat(self) -> Dict[str, NDArray[np.intp]]:
+        """Reverse index: stat key -> rows whose rule reads that stat"""
+        order = np.argsort(self.stat_ids, kind="stable")
+        bounds = np.searchsorted(self.stat_ids[order], np.arange(len(self.stat_keys) + 1))
+        return {
+            key: order[bounds[slot]:bounds[slot + 1]]
+            for slot, key in enumerate(self.stat_keys)
+        }
+
+    def evaluate_rows(self, vector: NDArray[np.float64],
+                      rows: NDArray[np.intp]) -> NDArray[np.bool_]:
+        """Evaluate only the given rows against a prepared stat vector"""
+        values = vector[self.stat_ids[rows]]
+        thresholds = self.thresholds[rows]
+        ops = self.ops[rows]
+        satisfied = np.zeros(len(rows), dtype=bool)
+        for op in np.unique(ops):
+            mask = ops == op
+            satisfied[mask] = _vector_op(Comparator(op))(values[mask], thresholds[mask])
+        satisfied &= ~np.isnan(values)
+        return satisfied
+
+    def evaluate_vector(self, vector: NDArray[np.float64]) -> NDArray[np.bool_]:
+        """Return a mask of satisfied rules for a prepared stat vector"""
+        values = vector[self.stat_ids]
+        satisfied = np.zeros(len(self), dtype=bool)
+        for op, rows in self._op_rows.items():
+            satisfied[rows] = _vector_op(op)(values[rows], self.thresholds[rows])
+        # Missing stats never satisfy a rule, not even "!="
+        satisfied &= ~np.isnan(values)
+        return satisfied
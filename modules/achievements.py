@@ -1,20 +1,30 @@
 # modules/achievements.py
 
+from __future__ import annotations
+
 from dataclasses import dataclass, asdict, field
-from typing import Dict, Optional, List, Final, Set
+from typing import TYPE_CHECKING, Dict, Optional, List, Final, Set, Mapping, Any, Tuple
 from pathlib import Path
 import json
+import math
 import os
+import time
 from enum import Enum, auto, IntEnum
 from datetime import datetime
 from functools import lru_cache
 from collections import defaultdict
-import numpy as np
-from numpy.typing import NDArray
 
 from colorama import Fore, Style
+from modules.lazy_import import lazy_import
 from modules.logger import logger
-from modules.constants import DATA_DIR
+from modules.constants import DATA_DIR, ACHIEVEMENT_FLUSH_INTERVAL
+from modules.achievement_rules import AchievementRule, CompiledRules, stat_value
+from modules.storage import storage
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+np = lazy_import("numpy")
 
 
 class AchievementCategory(IntEnum):
@@ -38,6 +48,32 @@ class Achievement:
     unlock_date: Optional[str] = None
     progress: int = 0
     max_progress: int = 1
+    rule: Optional[AchievementRule] = None
+    depends_on: List[str] = field(default_factory=list)
+
+    def __post_init__(self):
+        """Accept rules loaded from JSON"""
+        if isinstance(self.rule, dict):
+            self.rule = AchievementRule(**self.rule)
+
+    def effective_rule(self) -> Optional[AchievementRule]:
+        """Explicit rule, or the legacy condition implied by the category"""
+        if self.rule is not None:
+            return self.rule
+        match self.category:
+            case AchievementCategory.SURVIVAL:
+                return AchievementRule("health", "<", 10)
+            case AchievementCategory.MUTATION:
+                return AchievementRule("mutations", ">=", self.max_progress)
+            case AchievementCategory.COLLECTION:
+                return AchievementRule("items", ">=", self.max_progress)
+        return None
+
+    def dependencies(self) -> Tuple[str, ...]:
+        """Stat keys whose changes can affect this achievement"""
+        rule = self.effective_rule()
+        keys = [rule.stat] if rule is not None else []
+        return tuple(dict.fromkeys(keys + list(self.depends_on)))
 
     def validate(self) -> bool:
         """Validate achievement data"""
@@ -48,6 +84,7 @@ class Achievement:
             isinstance(self.category, AchievementCategory),
             isinstance(self.progress, int),
             isinstance(self.max_progress, int),
+            self.rule is None or isinstance(self.rule, AchievementRule),
             self.progress <= self.max_progress
         ])
 
@@ -68,11 +105,23 @@ class AchievementManager:
     """Manages game achievements"""
     ACHIEVEMENTS_PATH: Final[Path] = DATA_DIR / "achievements.json"
 
-    def __init__(self):
+    def __init__(self, flush_interval: float = ACHIEVEMENT_FLUSH_INTERVAL):
         self.achievements: Dict[str, Achievement] = {}
+        # Write-behind state: changes stay in memory until flush()
+        self.flush_interval = flush_interval
+        self._dirty: Set[str] = set()
+        self._last_flush = time.monotonic()
         # Array-based storage for vectorized operations
+        self._ids: List[str] = []
+        self._index: Dict[str, int] = {}
         self._category_array: NDArray[np.int32] = np.array([], dtype=np.int32)
         self._unlocked_array: NDArray[np.bool_] = np.array([], dtype=bool)
+        self._rules: CompiledRules = CompiledRules([])
+        # Incremental evaluation: stat key -> dependent rows, last seen stats
+        self._dependents: Dict[str, NDArray[np.intp]] = {}
+        self._stat_values: Dict[str, float] = {}
+        self._stat_vector: NDArray[np.float64] = np.full(1, np.nan)
+        self._pending: Set[int] = set()
         # Cache-based storage for lookups
         self._category_cache: Dict[AchievementCategory, List[str]] = defaultdict(list)
         self._unlocked_cache: Set[str] = set()
@@ -81,17 +130,17 @@ class AchievementManager:
     def _load_achievements(self) -> None:
         """Load achievements from file"""
         try:
-            if self.ACHIEVEMENTS_PATH.exists():
-                with open(self.ACHIEVEMENTS_PATH, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.achievements = {
-                        id: Achievement(
-                            **{**ach_data,
-                               'category': AchievementCategory[ach_data['category']]
-                            }
-                        )
-                        for id, ach_data in data.items()
-                    }
+            data = storage.read_json(self.ACHIEVEMENTS_PATH)
+            if data is not None:
+                self.achievements = {
+                    id: Achievement(
+                        **{**ach_data,
+                           'category': AchievementCategory[ach_data['category']]
+                        }
+                    )
+                    for id, ach_data in data.items()
+                }
+                self._migrate_rules()
             else:
                 self._initialize_default_achievements()
         except Exception as e:
@@ -100,31 +149,63 @@ class AchievementManager:
 
         self._update_caches()
 
-    def _save_achievements(self) -> None:
-        """Save achievements to file"""
+    def _save_achievements(self, durable: bool = False) -> bool:
+        """Stage achievements with the storage service"""
         try:
-            self.ACHIEVEMENTS_PATH.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.ACHIEVEMENTS_PATH, 'w', encoding='utf-8') as f:
-                data = {
-                    id: achievement.to_dict()
-                    for id, achievement in self.achievements.items()
-                }
-                json.dump(data, f, indent=2)
+            data = {
+                id: achievement.to_dict()
+                for id, achievement in self.achievements.items()
+            }
+            return storage.put_json(self.ACHIEVEMENTS_PATH, data, durable=durable)
         except Exception as e:
             logger.error(f"Failed to save achievements: {e}")
+            return False
 
-    def _initialize_default_achievements(self) -> None:
-        """Initialize default achievements"""
-        self.achievements = {
+    def flush(self, durable: bool = True) -> bool:
+        """Write pending achievement changes in one atomic save
+
+        Periodic flushes pass durable=False and ride along with the next
+        storage group commit instead of forcing one.
+        """
+        if not self._dirty:
+            return False
+        if not self._save_achievements(durable=durable):
+            return False
+        self._dirty.clear()
+        self._last_flush = time.monotonic()
+        return True
+
+    def _maybe_flush(self) -> None:
+        """Flush when the write-behind interval has elapsed"""
+        if self._dirty and time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush(durable=False)
+
+    @staticmethod
+    def _default_achievements() -> Dict[str, Achievement]:
+        """Built-in achievement catalogue"""
+        return {
             "first_run": Achievement(
                 id="first_run",
                 name="First Steps",
                 description="Complete your first run",
-                category=AchievementCategory.SPECIAL
+                category=AchievementCategory.SPECIAL,
+                rule=AchievementRule("total_runs", ">=", 1)
             )
         }
+
+    def _initialize_default_achievements(self) -> None:
+        """Initialize default achievements"""
+        self.achievements = self._default_achievements()
         self._save_achievements()
 
+    def _migrate_rules(self) -> None:
+        """Give built-in achievements saved before rules existed their rule"""
+        for aid, default in self._default_achievements().items():
+            achievement = self.achievements.get(aid)
+            if achievement is not None and achievement.rule is None:
+                achievement.rule = default.rule
+                self._dirty.add(aid)
+
     def unlock(self, achievement_id: str) -> bool:
         """Unlock achievement and update caches"""
         if achievement_id not in self.achievements:
@@ -136,11 +217,15 @@ class AchievementManager:
 
         achievement.unlocked = True
         achievement.unlock_date = datetime.now().isoformat()
+        self._dirty.add(achievement_id)
 
         # Update both storage types
         self._unlocked_cache.add(achievement_id)
-        idx = list(self.achievements.keys()).index(achievement_id)
+        if achievement_id not in self._index:
+            self._update_arrays()
+        idx = self._index[achievement_id]
         self._unlocked_array[idx] = True
+        self._pending.discard(idx)
 
         return True
 
@@ -155,55 +240,62 @@ class AchievementManager:
             if achievement.unlocked:
                 self._unlocked_cache.add(aid)
 
-        # Update numpy arrays
-        achievement_count = len(self.achievements)
-        self._category_array = np.zeros(achievement_count, dtype=np.int32)
-        self._unlocked_array = np.zeros(achievement_count, dtype=bool)
+        self._update_arrays()
 
-        for idx, achievement in enumerate(self.achievements.values()):
-            self._category_array[idx] = achievement.category
-            self._unlocked_array[idx] = achievement.unlocked
-
-    def _batch_check_achievements(self, stats: dict) -> Set[str]:
-        """Batch check multiple achievements at once"""
-        to_unlock = set()
-
-        # Check all achievements in one pass
-        for achievement_id, achievement in self.achievements.items():
-            if not achievement.unlocked:
-                if (
-                    (achievement.category == AchievementCategory.SURVIVAL and stats.get("health", 0) < 10) or
-                    (achievement.category == AchievementCategory.MUTATION and stats.get("mutations", 0) >= achievement.max_progress) or
-                    (achievement.category == AchievementCategory.COLLECTION and stats.get("items", 0) >= achievement.max_progress)
-                ):
-                    to_unlock.add(achievement_id)
-
-        return to_unlock
-
-    def check_run_achievements(self, stats: dict) -> None:
-        """Vectorized achievement checking"""
-        # Update arrays if needed
-        if len(self._category_array) != len(self.achievements):
+    def _sync_arrays(self) -> None:
+        """Rebuild arrays when achievements were added outside the manager"""
+        if len(self._ids) != len(self.achievements):
             self._update_arrays()
 
-        # Create condition masks
-        survival_mask = (self._category_array == AchievementCategory.SURVIVAL) & ~self._unlocked_array
-        mutation_mask = (self._category_array == AchievementCategory.MUTATION) & ~self._unlocked_array
-        collection_mask = (self._category_array == AchievementCategory.COLLECTION) & ~self._unlocked_array
-
-        # Check conditions
-        if stats.get("health", 100) < 10:
-            to_unlock = np.where(survival_mask)[0]
-            for idx in to_unlock:
-                self.unlock(list(self.achievements.keys())[idx])
-
-        mutations = stats.get("mutations", 0)
-        if mutations > 0:
-            to_unlock = np.where(mutation_mask)[0]
-            for idx in to_unlock:
-                achievement = list(self.achievements.values())[idx]
-                if mutations >= achievement.max_progress:
-                    self.unlock(achievement.id)
+    def _apply_stat_changes(self, stats: Mapping[str, Any]) -> None:
+        """Record stat updates and re-evaluate only the dependent achievements
+
+        Stats are treated as updates: keys that are absent keep their last
+        value, and keys whose value did not change trigger no work.
+        """
+        rows = []
+        for key, raw in stats.items():
+            value = stat_value(raw)
+            old = self._stat_values.get(key)
+            if old is not None and (old == value or (math.isnan(old) and math.isnan(value))):
+                continue
+            self._stat_values[key] = value
+            slot = self._rules.stat_slots.get(key)
+            if slot is not None:
+                self._stat_vector[slot] = value
+            if key in self._dependents:
+                rows.append(self._dependents[key])
+
+        if not rows:
+            return
+        rows = np.unique(np.concatenate(rows)) if len(rows) > 1 else rows[0]
+        rows = rows[~self._unlocked_array[rows]]
+        satisfied = self._rules.evaluate_rows(self._stat_vector, rows)
+        self._pending.update(rows[satisfied].tolist())
+        self._pending.difference_update(rows[~satisfied].tolist())
+
+    def _batch_check_achievements(self, stats: dict) -> Set[str]:
+        """Return locked achievements satisfied after applying the stats"""
+        self._sync_arrays()
+        self._apply_stat_changes(stats)
+        return {self._ids[idx] for idx in self._pending}
+
+    def update_stats(self, stats: Mapping[str, Any]) -> Set[str]:
+        """Per-tick check: unlock achievements that depend on changed stats"""
+        unlocked = self._batch_check_achievements(stats)
+        for achievement_id in unlocked:
+            self.unlock(achievement_id)
+        self._maybe_flush()
+        return unlocked
+
+    def check_run_achievements(self, stats: dict) -> Set[str]:
+        """Unlock every achievement satisfied by the run stats and flush"""
+        unlocked = self._batch_check_achievements(stats)
+        for achievement_id in unlocked:
+            self.unlock(achievement_id)
+        # End of run is the write-behind save point
+        self.flush()
+        return unlocked
 
     def display_achievements(self) -> None:
         """Display all achievements"""
@@ -226,21 +318,34 @@ class AchievementManager:
             logger.error(f"Achievement {achievement_id} not found")
             return False
 
-        achievement = self.achievements[achievement_id]
-        achievement.progress += progress
+        self.apply_progress({achievement_id: progress})
+        return True
 
-        # Cap progress at max_progress
-        achievement.progress = min(achievement.progress, achievement.max_progress)
+    def apply_progress(self, deltas: Dict[str, int]) -> List[str]:
+        """Apply progress deltas in memory; returns newly unlocked ids
+
+        Changes are only marked dirty here. They reach disk on flush(),
+        which runs at end of run or once flush_interval has elapsed.
+        """
+        newly_unlocked = []
+        for achievement_id, delta in deltas.items():
+            achievement = self.achievements.get(achievement_id)
+            if achievement is None:
+                logger.error(f"Achievement {achievement_id} not found")
+                continue
 
-        # Auto-unlock if max progress reached
-        if achievement.progress >= achievement.max_progress:
-            achievement.unlocked = True
-            achievement.unlock_date = datetime.now().isoformat()
-            logger.info(f"Achievement unlocked: {achievement.name}")
-            self._save_achievements()
-            self._update_caches()
+            # Cap progress at max_progress
+            achievement.progress = min(achievement.progress + delta, achievement.max_progress)
+            self._dirty.add(achievement_id)
 
-        return True
+            # Auto-unlock if max progress reached
+            if achievement.progress >= achievement.max_progress and not achievement.unlocked:
+                self.unlock(achievement_id)
+                logger.info(f"Achievement unlocked: {achievement.name}")
+                newly_unlocked.append(achievement_id)
+
+        self._maybe_flush()
+        return newly_unlocked
 
     @lru_cache(maxsize=128)
     def get_unlocked_achievements(self) -> List[Achievement]:
@@ -253,11 +358,28 @@ class AchievementManager:
         return [ach for ach in self.achievements.values() if ach.category == category]
 
     def _update_arrays(self) -> None:
-        """Update numpy arrays for vectorized operations"""
-        achievement_count = len(self.achievements)
-        self._category_array = np.zeros(achievement_count, dtype=np.int32)
-        self._unlocked_array = np.zeros(achievement_count, dtype=bool)
-
-        for idx, achievement in enumerate(self.achievements.values()):
-            self._category_array[idx] = achievement.category
-            self._unlocked_array[idx] = achievement.unlocked
+        """Update numpy arrays and compiled rules for vectorized operations"""
+        achievements = list(self.achievements.values())
+        self._ids = list(self.achievements.keys())
+        self._index = {aid: idx for idx, aid in enumerate(self._ids)}
+        self._category_array = np.fromiter(
+            (a.category for a in achievements), dtype=np.int32, count=len(achievements))
+        self._unlocked_array = np.fromiter(
+            (a.unlocked for a in achievements), dtype=bool, count=len(achievements))
+        self._rules = CompiledRules([a.effective_rule() for a in achievements])
+
+        # Reverse index from stat key to the achievements that depend on it
+        extra_rows: Dict[str, List[int]] = defaultdict(list)
+        for idx, achievement in enumerate(achievements):
+            for key in achievement.depends_on:
+                extra_rows[key].append(idx)
+        self._dependents = self._rules.rows_by_stat()
+        for key, rows in extra_rows.items():
+            existing = self._dependents.get(key, np.array([], dtype=np.intp))
+            self._dependents[key] = np.union1d(existing, rows).astype(np.intp)
+
+        # Definitions changed: keep the stats already reported and
+        # re-evaluate every locked row against them
+        self._stat_vector = self._rules.stat_vector(self._stat_values)
+        satisfied = self._rules.evaluate_vector(self._stat_vector) & ~self._unlocked_array
+        self._pending = set(np.flatnonzero(satisfied).tolist())
@@ -0,0 +1,205 @@
+# modules/checkpoint.py
+
+from collections.abc import Mapping
+from typing import Any, Dict, Final, Iterator, List, Optional, Set
+from pathlib import Path
+from datetime import datetime
+import uuid
+
+from modules.lazy_import import lazy_import
+from modules.logger import logger
+from modules.constants import CHECKPOINT_BASE_INTERVAL
+from modules.storage import storage
+from modules.save_format import SaveFile, encode_save, read_meta, section_digest
+
+orjson = lazy_import("orjson")
+lz4_frame = lazy_import("lz4.frame")
+
+BASE_FILE: Final[str] = "base.sims"
+LEGACY_BASE_FILE: Final[str] = "base.lz4"
+
+
+class CheckpointState(Mapping):
+    """Sections of a base save with replayed deltas layered on top
+
+    Base sections are only decoded when they are accessed.
+    """
+
+    def __init__(self, base: Mapping, changes: Dict[str, Any], removed: Set[str]):
+        self._base = base
+        self._changes = changes
+        self._removed = removed
+
+    def __getitem__(self, name: str) -> Any:
+        if name in self._changes:
+            return self._changes[name]
+        if name in self._removed:
+            raise KeyError(name)
+        return self._base[name]
+
+    def __iter__(self) -> Iterator[str]:
+        for name in self._base:
+            if name not in self._removed and name not in self._changes:
+                yield name
+        yield from self._changes
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+class Checkpointer:
+    """Incremental snapshots of named state sections
+
+    Every save hashes each section's encoding and writes only the sections
+    that changed since the previous save as a numbered delta frame. Every
+    `base_interval` saves a full base is written instead, as a sectioned
+    save so a load only decodes the sections it uses. Each base starts a
+    chain with a random id that its deltas carry, and loading replays the
+    base followed by the contiguous deltas of that chain. Leftovers from an
+    older chain are never replayed, so cleanup can be best-effort.
+    """
+
+    def __init__(self, directory: Path, base_interval: int = CHECKPOINT_BASE_INTERVAL):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.base_interval = base_interval
+        self.seq = 0
+        self.base_seq: Optional[int] = None
+        self.chain: Optional[str] = None
+        self._digests: Dict[str, bytes] = {}
+        self._base: Optional[SaveFile] = None
+
+    def _delta_path(self, seq: int) -> Path:
+        return self.directory / f"delta_{seq:08d}.lz4"
+
+    @staticmethod
+    def _frame(kind: str, seq: int, chain: str, sections: Dict[str, bytes],
+               removed: List[str]) -> bytes:
+        # Sections are already encoded; splice them in rather than re-encoding
+        body = b",".join(orjson.dumps(name) + b":" + data for name, data in sections.items())
+        header = orjson.dumps({"kind": kind, "seq": seq, "chain": chain, "removed": removed,
+                               "timestamp": datetime.now().isoformat()})
+        return lz4_frame.compress(header[:-1] + b',"sections":{' + body + b"}}")
+
+    @staticmethod
+    def _read_frame(data: bytes) -> Dict[str, Any]:
+        return orjson.loads(lz4_frame.decompress(data))
+
+    # ---- saving ----
+
+    def save(self, sections: Dict[str, Any]) -> bool:
+        """Checkpoint the sections; returns False if nothing needed writing"""
+        encoded = {name: orjson.dumps(value) for name, value in sections.items()}
+        digests = {name: section_digest(data) for name, data in encoded.items()}
+
+        self.seq += 1
+        if self.base_seq is None or self.seq - self.base_seq >= self.base_interval:
+            return self._write_base(encoded, digests)
+
+        changed = {name: data for name, data in encoded.items()
+                   if self._digests.get(name) != digests[name]}
+        removed = [name for name in self._digests if name not in encoded]
+        if not changed and not removed:
+            self.seq -= 1
+            return False
+
+        frame = self._frame("delta", self.seq, self.chain, changed, removed)
+        if not storage.put(self._delta_path(self.seq), frame):
+            self.seq -= 1
+            return False
+        self._digests = digests
+        return True
+
+    def _write_base(self, encoded: Dict[str, bytes], digests: Dict[str, bytes]) -> bool:
+        chain = uuid.uuid4().hex
+        data = encode_save(encoded, {"kind": "base", "seq": self.seq, "chain": chain,
+                                     "timestamp": datetime.now().isoformat()})
+        # The old base may still be mapped, which blocks the rename on Windows
+        self.close()
+        # Durable so older deltas are never needed once they are removed
+        if not storage.put(self.directory / BASE_FILE, data, durable=True):
+            self.seq -= 1
+            return False
+        self.base_seq = self.seq
+        self.chain = chain
+        self._digests = digests
+        self._remove_stale_files()
+        return True
+
+    def _remove_stale_files(self) -> None:
+        """Deltas and any legacy base on disk all predate the new base"""
+        stale = list(self.directory.glob("delta_*.lz4"))
+        stale.append(self.directory / LEGACY_BASE_FILE)
+        for path in stale:
+            if not path.exists():
+                continue
+            try:
+                path.unlink()
+            except OSError as e:
+                logger.warning(f"Could not remove checkpoint {path.name}: {e}")
+
+    # ---- loading ----
+
+    def _open_base(self):
+        """Base metadata, its sections and their digests; None if no checkpoint"""
+        path = self.directory / BASE_FILE
+        if storage.exists(path):
+            self.close()
+            self._base = SaveFile.open(path)
+            digests = {name: entry.digest for name, entry in self._base.entries.items()}
+            return self._base.meta, self._base, digests
+
+        # Bases written before the sectioned format were a single frame
+        if (data := storage.read(self.directory / LEGACY_BASE_FILE)) is None:
+            return None
+        base = self._read_frame(data)
+        sections = base["sections"]
+        digests = {name: section_digest(orjson.dumps(value)) for name, value in sections.items()}
+        return base, sections, digests
+
+    def metadata(self) -> Optional[Dict[str, Any]]:
+        """Seq, chain and timestamp of the current base without decoding it"""
+        path = self.directory / BASE_FILE
+        return read_meta(path) if storage.exists(path) else None
+
+    def load(self) -> Optional[Mapping]:
+        """Sections rebuilt from the base and its deltas; None if no checkpoint
+
+        The result reads from the mapped base until the next base is written.
+        """
+        if (opened := self._open_base()) is None:
+            return None
+        meta, base, digests = opened
+
+        changes: Dict[str, Any] = {}
+        removed: Set[str] = set()
+        seq = meta["seq"]
+        while (data := storage.read(self._delta_path(seq + 1))) is not None:
+            try:
+                delta = self._read_frame(data)
+            except Exception as e:
+                logger.warning(f"Stopping checkpoint replay at delta {seq + 1}: {e}")
+                break
+            if delta["chain"] != meta["chain"] or delta["seq"] != seq + 1:
+                break
+            for name, value in delta["sections"].items():
+                changes[name] = value
+                removed.discard(name)
+                digests[name] = section_digest(orjson.dumps(value))
+            for name in delta["removed"]:
+                changes.pop(name, None)
+                removed.add(name)
+                digests.pop(name, None)
+            seq += 1
+
+        # Continue numbering after what was replayed
+        self.base_seq = meta["seq"]
+        self.chain = meta["chain"]
+        self.seq = seq
+        self._digests = digests
+        return CheckpointState(base, changes, removed)
+
+    def close(self) -> None:
+        if self._base is not None:
+            self._base.close()
+            self._base = None
@@ -1,12 +1,11 @@
 from dataclasses import dataclass, asdict, field
-from typing import List, Optional, Dict, Any
+from typing import Callable, Dict, Tuple
 from pathlib import Path
-import json
 from functools import wraps
-import aiofiles
 
 from modules.logger import logger
 from modules.constants import CONFIG_DIR
+from modules.config_service import config_service
 
 def validate_config(func):
     """Decorator to validate config operations"""
@@ -29,19 +28,26 @@ class ConfigError(Exception):
     """Custom exception for configuration errors"""
     pass
 
-@dataclass
+@dataclass(frozen=True)
 class GameConfig:
-    """Game configuration data structure"""
+    """Game configuration snapshot; derive changes with dataclasses.replace
+
+    Collections are stored as tuples so a shared snapshot cannot change
+    under its other readers.
+    """
     trait_slots: int = field(default=3, metadata={"min": 0, "max": 9})
     reflection_points: int = field(default=0, metadata={"min": 0})
-    unlocked_themes: List[str] = field(default_factory=list)
-    unlocked_audio: List[str] = field(default_factory=list)
+    unlocked_themes: Tuple[str, ...] = ()
+    unlocked_audio: Tuple[str, ...] = ()
     debug_mode: bool = False
     sound_enabled: bool = True
     mutation_log_visible: bool = True
 
     def __post_init__(self):
         """Validate configuration after initialization"""
+        for name in ("unlocked_themes", "unlocked_audio"):
+            if isinstance(getattr(self, name), list):
+                object.__setattr__(self, name, tuple(getattr(self, name)))
         self.validate()
 
     def validate(self) -> None:
@@ -50,9 +56,9 @@ class GameConfig:
             raise ConfigError("trait_slots must be an integer")
         if not isinstance(self.reflection_points, int):
             raise ConfigError("reflection_points must be an integer")
-        if not isinstance(self.unlocked_themes, list):
+        if not isinstance(self.unlocked_themes, tuple):
             raise ConfigError("unlocked_themes must be a list")
-        if not isinstance(self.unlocked_audio, list):
+        if not isinstance(self.unlocked_audio, tuple):
             raise ConfigError("unlocked_audio must be a list")
 
     @classmethod
@@ -71,6 +77,9 @@ class ConfigurationManager:
         self.config_path = Path(config_path)
         self._ensure_config_dir()
         self.backup_path = self.config_path.with_suffix('.backup')
+        # Every manager for the same file shares one in-memory document
+        self.document = config_service.document(self.config_path, GameConfig.from_dict, asdict,
+                                                GameConfig, backup_path=self.backup_path)
 
     def _ensure_config_dir(self) -> None:
         """Ensure configuration directory exists"""
@@ -78,79 +87,36 @@ class ConfigurationManager:
 
     @validate_config
     def load_config(self) -> GameConfig:
-        """Load configuration with validation and backup support"""
-        try:
-            if self.config_path.exists():
-                with open(self.config_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                return GameConfig(**data)
-            return self._create_default_config()
-        except json.JSONDecodeError:
-            logger.warning("Corrupt config file, attempting to restore backup")
-            return self._restore_backup()
-        except Exception as e:
-            logger.error(f"Failed to load config: {e}")
-            return self._create_default_config()
-
-    def _create_default_config(self) -> GameConfig:
-        """Create and save default configuration"""
-        config = GameConfig()
-        self.save(config)
-        return config
-
-    def _backup_config(self, config: GameConfig) -> None:
-        """Create backup of current configuration"""
-        try:
-            with open(self.backup_path, 'w', encoding='utf-8') as f:
-                json.dump(asdict(config), f, indent=2)
-        except Exception as e:
-            logger.error(f"Failed to create config backup: {e}")
-
-    def _restore_backup(self) -> GameConfig:
-        """Restore configuration from backup"""
-        try:
-            if self.backup_path.exists():
-                with open(self.backup_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                return GameConfig(**data)
-        except Exception as e:
-            logger.error(f"Failed to restore backup: {e}")
-        return self._create_default_config()
+        """Current configuration; the file is only re-read after it changes"""
+        return self.document.get()
 
     @validate_config
     def save(self, config: GameConfig) -> bool:
-        """Save configuration with validation and backup"""
+        """Save configuration; the backup and main file share one group commit"""
         try:
-            # Create backup before saving
-            self._backup_config(config)
-
-            # Save new configuration
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(asdict(config), f, indent=2)
-            return True
+            return self.document.set(config)
         except Exception as e:
             logger.error(f"Failed to save config: {e}")
             return False
 
+    def update(self, change: Callable[[GameConfig], GameConfig]) -> GameConfig:
+        """Atomically derive and save a new configuration from the current one"""
+        return self.document.update(change)
+
     async def async_load(self) -> GameConfig:
         """Load configuration asynchronously"""
         try:
-            if self.config_path.exists():
-                async with aiofiles.open(self.config_path, 'r', encoding='utf-8') as f:
-                    content = await f.read()
-                    data = json.loads(content)
-                    return GameConfig(**data)
-            return GameConfig()
+            return self.document.get()
         except Exception as e:
             logger.error(f"Failed to load config: {e}")
             return GameConfig()
 
     async def async_save(self, config: GameConfig) -> bool:
         """Save configuration asynchronously"""
-        try:
-            async with aiofiles.open(self.config_path, 'w', encoding='utf-8') as f:
-                await f.write(json.dumps(asdict(config), indent=2))
-            return True
-        except Exception as e:
-            logger.error(f"Failed to save config: {e}")
-            return False
\ No newline at end of file
+        # Staging is non-blocking; the commit thread does the I/O
+        return self.save(config)
+
+
+def load_game_config() -> GameConfig:
+    """Shared game configuration snapshot"""
+    return ConfigurationManager().load_config()
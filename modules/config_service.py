@@ -0,0 +1,113 @@
+# modules/config_service.py
+
+from typing import Any, Callable, Dict, Generic, Optional, Tuple, TypeVar
+from pathlib import Path
+import json
+import os
+import threading
+
+from modules.logger import logger
+from modules.storage import storage
+
+T = TypeVar("T")
+
+
+class ConfigDocument(Generic[T]):
+    """One config file held in memory as a typed snapshot
+
+    get() stats the file and decodes it again only when its mtime or size
+    changed; a missing file is created from the defaults on first load.
+    Snapshots are shared, so callers replace them rather than mutate them;
+    set() keeps its own decoded copy of what it writes, so the caller's
+    objects never become the shared snapshot. set() stages the backup and
+    the main file together with the storage service. Repeated changes
+    before a commit therefore cost one write of each file.
+    """
+
+    def __init__(self, path: Path, decode: Callable[[Dict], T], encode: Callable[[T], Dict],
+                 default: Callable[[], T], backup_path: Optional[Path] = None):
+        self.path = Path(path)
+        self.backup_path = backup_path
+        self.decode = decode
+        self.encode = encode
+        self.default = default
+        self.loads = 0
+        self._snapshot: Optional[T] = None
+        self._key: Optional[Tuple[int, int]] = None
+        self._lock = threading.RLock()
+
+    def _file_key(self) -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _read(self, path: Path) -> Optional[Dict]:
+        # Documents cache their own decoded snapshot, so read the file directly
+        data = storage.read(path)
+        return None if data is None else json.loads(data)
+
+    def _load(self) -> T:
+        self.loads += 1
+        try:
+            data = self._read(self.path)
+            return self.default() if data is None else self.decode(data)
+        except Exception as e:
+            logger.warning(f"Unreadable config {self.path.name} ({e}); trying backup")
+        if self.backup_path is not None:
+            try:
+                if (data := self._read(self.backup_path)) is not None:
+                    return self.decode(data)
+            except Exception as e:
+                logger.error(f"Failed to restore {self.backup_path.name}: {e}")
+        return self.default()
+
+    def get(self) -> T:
+        """Current snapshot, reloaded only if the file changed on disk"""
+        with self._lock:
+            key = self._file_key()
+            if self._snapshot is None or (key != self._key and storage.staged(self.path) is None):
+                self._snapshot = self._load()
+                self._key = key
+                if key is None and storage.staged(self.path) is None:
+                    # First run: write the defaults so there is a file to edit
+                    self.set(self._snapshot)
+            return self._snapshot
+
+    def set(self, snapshot: T, durable: bool = False) -> bool:
+        """Replace the snapshot and stage it for the next group commit"""
+        with self._lock:
+            data = self.encode(snapshot)
+            if self.backup_path is not None:
+                storage.put_json(self.backup_path, data)
+            ok = storage.put_json(self.path, data, durable=durable)
+            self._snapshot = self.decode(data)
+            # Until the commit lands the file still has its old key
+            self._key = self._file_key()
+            return ok
+
+    def update(self, change: Callable[[T], T]) -> T:
+        """Apply `change` to the current snapshot atomically and stage the result"""
+        with self._lock:
+            self.set(change(self.get()))
+            return self._snapshot
+
+
+class ConfigService:
+    """Registry of config documents, one per file for the whole process"""
+
+    def __init__(self):
+        self._documents: Dict[Path, ConfigDocument[Any]] = {}
+        self._lock = threading.Lock()
+
+    def document(self, path: Path, decode: Callable[[Dict], T], encode: Callable[[T], Dict],
+                 default: Callable[[], T], backup_path: Optional[Path] = None) -> ConfigDocument[T]:
+        key = Path(path).resolve()
+        with self._lock:
+            if key not in self._documents:
+                self._documents[key] = ConfigDocument(path, decode, encode, default, backup_path)
+            return self._documents[key]
+
+
+config_service = ConfigService()
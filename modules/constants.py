@@ -27,6 +27,12 @@ MAX_RECENT_DISASTERS: Final[int] = 3
 MAX_TRAIT_SLOTS: Final[int] = 9
 MAX_MUTATIONS: Final[int] = 10
 MAX_HIGHLIGHTS: Final[int] = 100
+ACHIEVEMENT_FLUSH_INTERVAL: Final[float] = 30.0  # seconds between write-behind saves
+STORAGE_COMMIT_INTERVAL: Final[float] = 1.0  # seconds between storage group commits
+CHECKPOINT_BASE_INTERVAL: Final[int] = 10  # saves between full checkpoint bases
+PERSISTENCE_QUEUE_SIZE: Final[int] = 256  # pending background persistence jobs
+READ_CACHE_TTL: Final[float] = 30.0  # seconds a cached file is served without a stat
+READ_CACHE_MAX_BYTES: Final[int] = 8 * 1024 * 1024
 
 # Rarity Configuration
 RARITY_WEIGHTS: Final[Dict[str, int]] = {
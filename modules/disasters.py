@@ -1,7 +1,6 @@
 # modules/disasters.py
 
 from pathlib import Path
-import json
 import random
 from typing import Dict, List, Final
 from dataclasses import dataclass
@@ -9,6 +8,7 @@ from dataclasses import dataclass
 from colorama import Fore
 from modules.logger import logger
 from modules.constants import DISASTER_PARTS_DIR
+from modules.read_cache import read_cache
 
 @dataclass
 class DisasterType:
@@ -41,9 +41,7 @@ class DisasterSystem:
         parts = {}
         try:
             for part_file in ["names.json", "types.json", "effects.json"]:
-                file_path = DISASTER_PARTS_DIR / part_file
-                with open(file_path, "r", encoding='utf-8') as f:
-                    parts[part_file.split(".")[0]] = json.load(f)
+                parts[part_file.split(".")[0]] = read_cache.get_json(DISASTER_PARTS_DIR / part_file)
             return parts
         except Exception as e:
             logger.error(f"Failed to load disaster parts: {e}")
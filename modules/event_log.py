@@ -0,0 +1,125 @@
+# modules/event_log.py
+
+from enum import IntEnum
+from typing import Dict, Final, Optional
+from pathlib import Path
+from datetime import datetime
+import itertools
+import os
+import time
+
+import numpy as np
+
+from modules.constants import DATA_DIR
+
+EVENTS_DIR: Final[Path] = DATA_DIR / "events"
+
+# One record per event; 16 bytes with no padding. Read with
+# np.fromfile(path, dtype=EVENT_DTYPE).
+EVENT_DTYPE: Final[np.dtype] = np.dtype([
+    ("tick", "<u4"),           # survival seconds when the event happened
+    ("event", "u1"),           # EventType
+    ("disaster_type", "u1"),   # DISASTER_TYPE_IDS, 0 when not a disaster
+    ("reserved", "<u2"),
+    ("damage", "<f4"),
+    ("hp_after", "<f4"),
+])
+
+# Append-only: ids are stored in event files, so never reorder or remove
+DISASTER_TYPES: Final[tuple] = (
+    "void", "quantum", "temporal", "fire", "frost", "system", "data", "entropy", "neural",
+    "memory", "radiation", "chemical", "biological", "physical", "psychic",
+)
+DISASTER_TYPE_IDS: Final[Dict[str, int]] = {name: i + 1 for i, name in enumerate(DISASTER_TYPES)}
+OTHER_DISASTER: Final[int] = 255
+FLUSH_INTERVAL: Final[float] = 1.0
+
+# Numbers runs within a process so two runs started in one second get distinct files
+_run_numbers = itertools.count()
+
+
+class EventType(IntEnum):
+    MUTATION = 1
+    DISASTER = 2
+    IMMUNE = 3     # disaster blocked by an immunity
+    COLLAPSE = 4
+
+
+def disaster_type_id(name: Optional[str]) -> int:
+    if not name:
+        return 0
+    return DISASTER_TYPE_IDS.get(str(name).lower(), OTHER_DISASTER)
+
+
+def disaster_type_name(type_id: int) -> Optional[str]:
+    if 0 < type_id <= len(DISASTER_TYPES):
+        return DISASTER_TYPES[type_id - 1]
+    return None if type_id == 0 else "other"
+
+
+class EventRecorder:
+    """Appends fixed-width event records for one run to a binary file
+
+    Records are buffered in a structured array and written in blocks, so
+    recording an event is one row assignment. The buffer is also written
+    once `flush_interval` seconds have passed since the last write, so a
+    run in progress shows up on disk and a crash loses at most that much.
+    """
+
+    def __init__(self, path: Path, buffer_size: int = 1024,
+                 flush_interval: float = FLUSH_INTERVAL):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._buffer = np.zeros(buffer_size, dtype=EVENT_DTYPE)
+        self._pending = 0
+        self.count = 0
+        self.flush_interval = flush_interval
+        self._flushed_at = time.monotonic()
+        self._file = open(self.path, "ab")
+
+    @classmethod
+    def for_run(cls, directory: Path = EVENTS_DIR) -> "EventRecorder":
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        name = f"run_{stamp}_{os.getpid()}_{next(_run_numbers)}.events"
+        return cls(Path(directory) / name)
+
+    def record(self, tick: int, event: EventType, damage: float = 0.0, hp_after: float = 0.0,
+               disaster_type: Optional[str] = None) -> None:
+        self._buffer[self._pending] = (tick, event, disaster_type_id(disaster_type), 0,
+                                       damage, hp_after)
+        self._pending += 1
+        self.count += 1
+        if (self._pending == len(self._buffer)
+                or time.monotonic() - self._flushed_at >= self.flush_interval):
+            self.flush()
+
+    def mutation(self, tick: int, hp_after: float) -> None:
+        self.record(tick, EventType.MUTATION, hp_after=hp_after)
+
+    def disaster(self, tick: int, disaster_type: str, damage: float, hp_after: float) -> None:
+        self.record(tick, EventType.DISASTER, damage, hp_after, disaster_type)
+
+    def flush(self) -> None:
+        if self._pending and self._file is not None:
+            self._file.write(self._buffer[:self._pending].tobytes())
+            self._file.flush()
+            self._pending = 0
+        self._flushed_at = time.monotonic()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self.flush()
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> "EventRecorder":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def read_events(path: Path) -> np.ndarray:
+    """Every complete record in an event file; a torn final record is ignored"""
+    count = Path(path).stat().st_size // EVENT_DTYPE.itemsize
+    return np.fromfile(path, dtype=EVENT_DTYPE, count=count)
@@ -1,19 +1,25 @@
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Sequence
 from datetime import datetime
-from functools import lru_cache
-import orjson  # Much faster than standard json
-import aiofiles
-import asyncio
-import lz4.frame
+from dataclasses import asdict
 
 from modules.stats import PlayerStats
-from modules.mutations import MutationSystem
+from modules.mutations import Mutation, MutationSystem
 from modules.achievements import AchievementManager
+from modules.lazy_import import lazy_import
 from modules.logger import logger
+from modules.metrics import SAVE_SECONDS
 from modules.performance import PerformanceMonitor
+from modules.storage import storage
+from modules.read_cache import read_cache
+from modules.checkpoint import Checkpointer
+from modules.save_format import SaveSummary
+from modules.save_slots import SaveSlots, SlotInfo
 from .game_types import GameState, PlayerState, GameID, PlayerID
 
+orjson = lazy_import("orjson")  # Much faster than standard json
+lz4_frame = lazy_import("lz4.frame")
+
 class SimulacraGame:
     """Main game class managing state and systems"""
 
@@ -24,58 +30,84 @@ class SimulacraGame:
         self.stats = PlayerStats()
         self.mutation_system = MutationSystem()
         self.achievement_manager = AchievementManager()
+        self.checkpoints = Checkpointer(self.save_dir / "checkpoints")
+        self.slots = SaveSlots(self.save_dir / "slots")
 
     async def initialize(self) -> None:
         """Initialize game systems"""
         await self.load_game()
 
-    @lru_cache(maxsize=32)
     async def _read_state_cache(self, file_path: str) -> dict:
-        """Cached state reading"""
-        async with aiofiles.open(file_path, 'r') as f:
-            return json.loads(await f.read())
-
-    @lru_cache(maxsize=32)
-    def _serialize_state(self) -> bytes:
-        """Cache state serialization"""
-        return orjson.dumps({
-            "stats": self.stats.to_dict(),
-            "timestamp": datetime.now().isoformat()
-        })
+        """Cached state reading, reloaded when the file changes"""
+        return await read_cache.read_json(Path(file_path))
 
-    @lru_cache(maxsize=32)
-    def _compress_state(self) -> bytes:
-        """Compress game state for faster saving"""
-        state_data = orjson.dumps({
+    def _state_sections(self) -> dict:
+        """Game state split into independently checkpointed sections"""
+        return {
             "stats": self.stats.to_dict(),
-            "timestamp": datetime.now().isoformat()
-        })
-        return lz4.frame.compress(state_data)
+            "mutations": {id: asdict(m) for id, m in self.mutation_system.mutations.items()},
+            "active_mutations": self.mutation_system.active_mutations
+        }
+
+    def _restore_sections(self, sections: dict) -> None:
+        self.stats = PlayerStats(**sections["stats"])
+        self.mutation_system.mutations = {
+            id: Mutation(**data) for id, data in sections.get("mutations", {}).items()
+        }
+        self.mutation_system.active_mutations = list(sections.get("active_mutations", []))
 
     @PerformanceMonitor.track
     async def save_game(self) -> bool:
-        """Save compressed game state"""
+        """Checkpoint the sections that changed since the last save"""
         try:
-            save_path = self.save_dir / "save.lz4"
-            async with aiofiles.open(save_path, mode='wb') as f:
-                await f.write(self._compress_state())
+            with SAVE_SECONDS.time(kind="checkpoint"):
+                self.checkpoints.save(self._state_sections())
             return True
         except Exception as e:
             logger.error(f"Failed to save game: {e}")
             return False
 
     async def load_game(self) -> bool:
-        """Load compressed game state"""
+        """Load the latest checkpoint, falling back to a legacy full save"""
         try:
-            save_path = self.save_dir / "save.lz4"
-            if not save_path.exists():
+            if (sections := self.checkpoints.load()) is not None:
+                self._restore_sections(sections)
+                return True
+
+            compressed_data = storage.read(self.save_dir / "save.lz4")
+            if compressed_data is None:
                 return False
 
-            async with aiofiles.open(save_path, mode='rb') as f:
-                compressed_data = await f.read()
-                data = orjson.loads(lz4.frame.decompress(compressed_data))
-                self.stats = PlayerStats(**data["stats"])
+            data = orjson.loads(lz4_frame.decompress(compressed_data))
+            self.stats = PlayerStats(**data["stats"])
             return True
         except Exception as e:
             logger.error(f"Failed to load game: {e}")
-            return False
\ No newline at end of file
+            return False
+
+    async def save_to_slot(self, slot: str, loadout: Sequence[str] = (),
+                           survival_seconds: int = 0) -> bool:
+        """Write the full game state to a named save slot"""
+        try:
+            sections = self._state_sections()
+            stats = sections["stats"]
+            summary = SaveSummary(datetime.now().timestamp(), stats.get("current_hp", 0.0),
+                                  stats.get("max_hp", 0.0), int(survival_seconds), tuple(loadout))
+            with SAVE_SECONDS.time(kind="slot"):
+                return self.slots.save(slot, sections, summary)
+        except Exception as e:
+            logger.error(f"Failed to save slot {slot}: {e}")
+            return False
+
+    async def load_from_slot(self, slot: str) -> bool:
+        try:
+            with self.slots.open(slot) as save:
+                self._restore_sections(save)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to load slot {slot}: {e}")
+            return False
+
+    def list_slots(self) -> List[SlotInfo]:
+        """Slot summaries for a load menu, from the slot headers alone"""
+        return self.slots.list()
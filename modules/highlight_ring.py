@@ -0,0 +1,154 @@
+# modules/highlight_ring.py
+
+from typing import Any, Dict, Final, Iterable, List, Optional
+from pathlib import Path
+import json
+import struct
+import zlib
+
+from modules.logger import logger
+from modules.constants import MAX_HIGHLIGHTS
+from modules.file_lock import file_lock
+from modules.storage_codecs import FileClass, StorageCodec, codec_registry
+
+RING_MAGIC: Final[bytes] = b"SHRB"
+RING_VERSION: Final[int] = 1
+DEFAULT_SLOT_SIZE: Final[int] = 16 * 1024
+
+# Header: magic, version, slot count, slot size, head (next slot), live count
+HEADER: Final[struct.Struct] = struct.Struct("<4sHIIII")
+HEADER_SIZE: Final[int] = 32
+HEAD_STATE: Final[struct.Struct] = struct.Struct("<II")
+HEAD_OFFSET: Final[int] = HEADER.size - HEAD_STATE.size
+# Slot: payload length, crc32, payload, zero padding
+SLOT_HEADER: Final[struct.Struct] = struct.Struct("<II")
+
+
+class HighlightRing:
+    """Fixed-size ring buffer of highlight records in one binary file
+
+    The file is preallocated to `slots` slots of `slot_size` bytes. An
+    append writes one slot and the 8-byte head/count pair in the header,
+    so the cost never depends on how many highlights are stored. Once
+    full, the oldest highlight is overwritten. A record too large for a
+    slot loses the oldest entries of its longest lists until it fits.
+
+    Head and count are re-read under a lock file on every access, so
+    several instances (or processes) can share one ring.
+    """
+
+    def __init__(self, path: Path, slots: int = MAX_HIGHLIGHTS,
+                 slot_size: int = DEFAULT_SLOT_SIZE,
+                 codec: Optional[StorageCodec] = None):
+        self.path = Path(path)
+        self.codec = codec or codec_registry.codec_for(FileClass.HIGHLIGHTS)
+        self.lock_path = self.path.with_suffix(".lock")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Checked under the lock so two openers cannot both create the file
+        with file_lock(self.lock_path):
+            if self.path.exists():
+                self._read_header()
+            else:
+                self.slots, self.slot_size = slots, slot_size
+                self.head = self.count = 0
+                self._create()
+
+    def _create(self) -> None:
+        tmp = self.path.with_suffix(".tmp")
+        with open(tmp, "wb") as f:
+            f.write(HEADER.pack(RING_MAGIC, RING_VERSION, self.slots, self.slot_size, 0, 0)
+                    .ljust(HEADER_SIZE, b"\0"))
+            f.truncate(HEADER_SIZE + self.slots * self.slot_size)
+        tmp.replace(self.path)
+
+    def _read_header(self) -> None:
+        with open(self.path, "rb") as f:
+            magic, version, self.slots, self.slot_size, self.head, self.count = \
+                HEADER.unpack(f.read(HEADER.size))
+        if magic != RING_MAGIC or version != RING_VERSION:
+            raise ValueError(f"Not a highlight ring file: {self.path}")
+
+    @property
+    def capacity(self) -> int:
+        return self.slot_size - SLOT_HEADER.size
+
+    def _read_state(self, f) -> None:
+        """Refresh head and count, which other writers may have moved"""
+        f.seek(HEAD_OFFSET)
+        self.head, self.count = HEAD_STATE.unpack(f.read(HEAD_STATE.size))
+
+    def __len__(self) -> int:
+        with file_lock(self.lock_path), open(self.path, "rb") as f:
+            self._read_state(f)
+        return self.count
+
+    def _slot_offset(self, slot: int) -> int:
+        return HEADER_SIZE + slot * self.slot_size
+
+    def _fit(self, record: Dict[str, Any]) -> bytes:
+        """Encode `record`, halving its longest list until it fits in a slot
+
+        The newest (last) entries of a list are kept. Raises ValueError if
+        the record is still too large once every list is empty.
+        """
+        payload = self.codec.encode(record)
+        original = len(payload)
+        while len(payload) > self.capacity:
+            lists = [key for key, value in record.items() if isinstance(value, list) and value]
+            if not lists:
+                raise ValueError(f"Highlight record is {len(payload)} bytes; "
+                                 f"slot holds {self.capacity}")
+            key = max(lists, key=lambda k: len(record[k]))
+            record = {**record, key: record[key][(len(record[key]) + 1) // 2:]}
+            payload = self.codec.encode(record)
+        if len(payload) != original:
+            logger.warning(f"Highlight record trimmed from {original} to {len(payload)} bytes")
+        return payload
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """Write a record into the slot at the head and advance it"""
+        payload = self._fit(record)
+
+        with file_lock(self.lock_path), open(self.path, "r+b") as f:
+            self._read_state(f)
+            f.seek(self._slot_offset(self.head))
+            f.write(SLOT_HEADER.pack(len(payload), zlib.crc32(payload)) + payload)
+            self.head = (self.head + 1) % self.slots
+            self.count = min(self.count + 1, self.slots)
+            f.seek(HEAD_OFFSET)
+            f.write(HEAD_STATE.pack(self.head, self.count))
+
+    def extend(self, records: Iterable[Dict[str, Any]]) -> None:
+        for record in records:
+            self.append(record)
+
+    def records(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Stored records, newest first"""
+        results = []
+        with file_lock(self.lock_path), open(self.path, "rb") as f:
+            self._read_state(f)
+            wanted = self.count if limit is None else min(limit, self.count)
+            for step in range(1, wanted + 1):
+                f.seek(self._slot_offset((self.head - step) % self.slots))
+                length, crc = SLOT_HEADER.unpack(f.read(SLOT_HEADER.size))
+                payload = f.read(length)
+                if length > self.capacity or zlib.crc32(payload) != crc:
+                    logger.warning(f"Skipping damaged highlight slot in {self.path.name}")
+                    continue
+                results.append(self.codec.decode(payload))
+        return results
+
+
+def open_ring(path: Path, legacy_json: Optional[Path] = None,
+              slots: int = MAX_HIGHLIGHTS) -> HighlightRing:
+    """Open a ring, importing the legacy highlights JSON list on first use"""
+    path = Path(path)
+    fresh = not path.exists()
+    ring = HighlightRing(path, slots=slots)
+    if fresh and legacy_json is not None and legacy_json.exists():
+        try:
+            with open(legacy_json, encoding='utf-8') as f:
+                ring.extend(json.load(f)[-slots:])
+        except Exception as e:
+            logger.error(f"Failed to import {legacy_json.name}: {e}")
+    return ring
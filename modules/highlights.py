@@ -1,13 +1,12 @@
 from dataclasses import dataclass, asdict
 from typing import Dict, List, Optional
 from datetime import datetime
-import os
-import json
 from pathlib import Path
 
 from modules.logger import logger
 from modules.error_handler import handle_errors
-from modules.constants import MAX_HIGHLIGHTS, DATA_DIR
+from modules.constants import CYAN, DATA_DIR, PURPLE, RESET, WHITE
+from modules.highlight_ring import open_ring
 
 @dataclass
 class Highlight:
@@ -42,57 +41,69 @@ class Highlight:
             immunities=stats.get('immunities', [])
         )
 
+def render_highlight(highlight: Highlight) -> str:
+    """Render a highlight as the readable text report"""
+    lines = [
+        "=== SIMULACRA RUN HIGHLIGHT ===",
+        f"Time: {datetime.fromisoformat(highlight.timestamp):%Y-%m-%d %H:%M:%S}",
+        f"Survival Time: {highlight.survival_time//60}m {highlight.survival_time%60}s",
+        f"Final HP: {highlight.hp_end:.1f}/{highlight.max_hp}",
+        f"Mutation Rate: {highlight.mutation_rate:.2f}%",
+        f"Entropy Drain: {highlight.entropy_drain:.2f} HP/s",
+        f"Reflection Points: {highlight.reflection_points}",
+        "",
+        "Traits:"
+    ]
+    for trait in highlight.traits:
+        effects = [e['text'] for e in trait.get('effects', [])]
+        lines.append(f"  - {trait['name']} ({', '.join(effects)})")
+
+    lines.extend(["", "Resistances:"])
+    for k, v in highlight.resistances.items():
+        lines.append(f"  - {k}: {v}%")
+
+    lines.extend(["", "Mutations:"])
+    for mut in highlight.mutations:
+        lines.append(f"  - {mut['name']} ({mut['effect']})")
+    return "\n".join(lines) + "\n"
+
 class HighlightManager:
     """Manages game highlights and saving"""
     def __init__(self):
         self.highlights_dir = Path(DATA_DIR) / "highlights"
-        self.highlights_json = self.highlights_dir / "highlights.json"
         self.highlights_dir.mkdir(parents=True, exist_ok=True)
+        self.ring = open_ring(self.highlights_dir / "highlights.ring",
+                              legacy_json=self.highlights_dir / "highlights.json")
 
     @handle_errors()
     def save_highlight(self, stats: Dict, time: int,
                       mutations: List, traits: List) -> None:
-        """Save both JSON and text format highlights"""
+        """Store a highlight in the ring buffer"""
         highlight = Highlight.from_stats(stats, time, mutations, traits)
-        self._save_json_highlight(highlight)
-        self._save_text_highlight(highlight)
+        self.ring.append(asdict(highlight))
         logger.info("💾 Highlight saved successfully")
 
-    def _save_json_highlight(self, highlight: Highlight) -> None:
-        """Save highlight in JSON format"""
-        highlights = []
-        if os.path.exists(self.highlights_json):
-            with open(self.highlights_json, 'r') as f:
-                highlights = json.load(f)
-
-        highlights.append(vars(highlight))
-        highlights = highlights[-MAX_HIGHLIGHTS:]  # Keep only most recent
+    def get_highlights(self, limit: Optional[int] = None) -> List[Highlight]:
+        """Stored highlights, newest first"""
+        return [Highlight(**record) for record in self.ring.records(limit)]
 
-        with open(self.highlights_json, 'w') as f:
-            json.dump(highlights, f, indent=2)
-
-    def _save_text_highlight(self, highlight: Highlight) -> None:
-        """Save highlight in readable text format"""
-        filename = f"{self.highlights_dir}/highlight_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
-
-        with open(filename, 'w') as f:
-            f.write("=== SIMULACRA RUN HIGHLIGHT ===\n")
-            f.write(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Survival Time: {highlight.survival_time//60}m {highlight.survival_time%60}s\n")
-            f.write(f"Final HP: {highlight.hp_end:.1f}/{highlight.max_hp}\n")
-            f.write(f"Mutation Rate: {highlight.mutation_rate:.2f}%\n")
-            f.write(f"Entropy Drain: {highlight.entropy_drain:.2f} HP/s\n")
-            f.write(f"Reflection Points: {highlight.reflection_points}\n\n")
-
-            f.write("Traits:\n")
-            for trait in highlight.traits:
-                effects = [e['text'] for e in trait.get('effects', [])]
-                f.write(f"  - {trait['name']} ({', '.join(effects)})\n")
+    @handle_errors()
+    def display_highlights(self, limit: int = 10) -> None:
+        """List recent highlights and render the selected one as text"""
+        highlights = self.get_highlights(limit)
+        if not highlights:
+            print("No highlights saved yet.")
+            return
 
-            f.write("\nResistances:\n")
-            for k, v in highlight.resistances.items():
-                f.write(f"  - {k}: {v}%\n")
+        print(f"\n{CYAN}📁 Recent Highlights{RESET}")
+        for i, highlight in enumerate(highlights, 1):
+            print(f"{PURPLE}{i}.{RESET} {highlight.timestamp[:19]} - "
+                  f"survived {highlight.survival_time//60}m {highlight.survival_time%60}s")
 
-            f.write("\nMutations:\n")
-            for mut in highlight.mutations:
-                f.write(f"  - {mut['name']} ({mut['effect']})\n")
+        choice = input(f"{WHITE}Select a highlight to view (or press Enter to cancel): {RESET}")
+        if choice.isdigit():
+            index = int(choice) - 1
+            if 0 <= index < len(highlights):
+                print("\n" + render_highlight(highlights[index]))
+            else:
+                print("Invalid selection.")
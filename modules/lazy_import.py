@@ -0,0 +1,86 @@
+# modules/lazy_import.py
+
+from types import ModuleType
+import importlib.util
+import sys
+import threading
+
+# LazyLoader only loads under a lock from 3.12; before that a second thread
+# can see the module half-executed, so older versions use _LockedLazyModule
+THREAD_SAFE_LAZY_LOADER = sys.version_info >= (3, 12)
+
+
+class _LockedLazyModule(ModuleType):
+    """Lazy module that runs its import once, under a lock
+
+    Mirrors the loader from Python 3.12: the class switches back to
+    ModuleType only after the module has finished executing, so threads
+    that arrive meanwhile wait on the lock instead of reading a partial
+    module. Access from the importing thread itself, during execution,
+    reads the module as it stands.
+    """
+
+    def __getattribute__(self, attr):
+        spec = object.__getattribute__(self, "__spec__")
+        state = spec.loader_state
+        with state["lock"]:
+            if object.__getattribute__(self, "__class__") is _LockedLazyModule:
+                if state["is_loading"]:
+                    return object.__getattribute__(self, attr)
+                state["is_loading"] = True
+                attrs = object.__getattribute__(self, "__dict__")
+                # Keep attributes set on the lazy module before it loaded
+                updated = {key: value for key, value in attrs.items()
+                           if key not in state["__dict__"] or value is not state["__dict__"][key]}
+                spec.loader.exec_module(self)
+                if sys.modules.get(spec.name, self) is not self:
+                    raise ValueError(f"module object for {spec.name!r} "
+                                     "substituted in sys.modules during a lazy load")
+                attrs.update(updated)
+                self.__class__ = ModuleType
+        return getattr(self, attr)
+
+    def __delattr__(self, attr):
+        self.__getattribute__("__name__")
+        delattr(self, attr)
+
+
+class _LockedLazyLoader(importlib.util.LazyLoader):
+    def exec_module(self, module: ModuleType) -> None:
+        super().exec_module(module)
+        # Plain attribute access would already trigger the stock lazy load
+        spec = object.__getattribute__(module, "__spec__")
+        spec.loader_state.update(lock=threading.RLock(), is_loading=False)
+        module.__class__ = _LockedLazyModule
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Module object whose import runs on first attribute access
+
+    `np = lazy_import("numpy")` costs a spec lookup at import time; NumPy
+    itself loads the first time `np.<anything>` is used, which is safe from
+    any thread. Raises ImportError straight away if the module is not
+    installed, like a normal import.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"No module named {name!r}", name=name)
+    loader_type = importlib.util.LazyLoader if THREAD_SAFE_LAZY_LOADER else _LockedLazyLoader
+    loader = loader_type(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    if "." in name:
+        # Let `import pkg.sub` style access (pkg.sub.attr) find it too
+        parent, _, child = name.rpartition(".")
+        setattr(sys.modules[parent], child, module)
+    return module
+
+
+def is_loaded(name: str) -> bool:
+    """True once the module has actually run, not just been lazily imported"""
+    module = sys.modules.get(name)
+    return module is not None and type(module) is ModuleType
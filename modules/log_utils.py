@@ -17,4 +17,4 @@ def log_achievement(name: str) -> None:
 
 def log_event(title: str, message: str, color: Optional[str] = Fore.CYAN) -> None:
     """Log generic game events with custom colors"""
-    logger.info(f"{title}: {message}", color)
+    logger.info(f"{title}: {message}", color=color)
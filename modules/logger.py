@@ -3,11 +3,104 @@ import logging
 from datetime import datetime
 import sys
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Any, Callable, Optional, Union
 from colorama import Fore, Style
+import atexit
 import gzip
+import queue
 import shutil
-from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
+import threading
+import time
+from logging.handlers import (QueueHandler, QueueListener, RotatingFileHandler,
+                              TimedRotatingFileHandler)
+
+from modules.metrics import LOG_MESSAGES
+
+
+DEBUG_ENV = "SIMULACRA_DEBUG"
+
+
+def _debug_from_env() -> bool:
+    return os.environ.get(DEBUG_ENV, "").lower() not in ("", "0", "false", "no")
+
+
+class LazyMessage:
+    """Message built by a callable, only when a handler formats the record"""
+    __slots__ = ("build",)
+
+    def __init__(self, build: Callable[[], Any]):
+        self.build = build
+
+    def __str__(self) -> str:
+        return str(self.build())
+
+
+class ConsoleHandler(logging.Handler):
+    """Prints each record's console text in its color
+
+    sys.stdout is looked up per record, so redirected or captured output
+    still receives records that were queued before the redirect.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            text = f"{getattr(record, 'prefix', '')}{record.getMessage()}"
+            stream = sys.stdout
+            stream.write(f"{getattr(record, 'color', '')}{text}{Style.RESET_ALL}\n")
+            stream.flush()
+        except Exception:
+            self.handleError(record)
+
+
+class RunLogHandler(logging.Handler):
+    """Appends run events to current_run.log through one buffered handle"""
+
+    FLUSH_INTERVAL = 1.0  # seconds
+
+    def __init__(self, path: Path):
+        super().__init__()
+        self.path = path
+        self._file = None
+        self._last_flush = 0.0
+        self.addFilter(lambda record: getattr(record, "run_log", False))
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if self._file is None:
+                self._file = open(self.path, "a", encoding="utf-8", buffering=64 * 1024)
+            self._file.write(f"{record.getMessage()}\n")
+            now = time.monotonic()
+            if now - self._last_flush >= self.FLUSH_INTERVAL:
+                self._file.flush()
+                self._last_flush = now
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        super().close()
+
+
+class _LocalQueueHandler(QueueHandler):
+    """Queues records for the listener thread
+
+    %-style arguments are merged here, on the logging thread, so a mutable
+    argument is logged as it was at the call and not as the listener later
+    finds it. prepare() only runs for enabled levels. A LazyMessage without
+    arguments is queued as is and built on the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        return record
 
 
 class SimulacraLogger:
@@ -35,18 +128,51 @@ class SimulacraLogger:
         'critical': logging.CRITICAL
     }
 
-    def __init__(self):
-        self.log_dir = Path("data/logs")
-        self.metrics_dir = self.log_dir / "metrics"
-        self.setup_directories()
-        self.setup_logging()
-        self.metrics: Dict[str, int] = {"errors": 0, "warnings": 0}
-
-        self.main_log = self.log_dir / "simulacra.log"
-        self.run_log = self.log_dir / "current_run.log"
-
-        self._clear_run_log()
-        self._compress_old_logs()
+    # Claims and run logs untouched this long belong to a process that is gone
+    STALE_SECONDS = 24 * 60 * 60
+
+    def __init__(self, log_dir: Path = Path("data/logs"), name: str = 'simulacra'):
+        """Creates no files; output is set up by configure() or the first log call"""
+        self.log_dir = Path(log_dir)
+        self.name = name
+        self.listener: Optional[QueueListener] = None
+        self.handlers: list = []
+        self.compressor: Optional[threading.Thread] = None
+        # Set by close(); later records are dropped instead of reopening the logs
+        self._closed = False
+        self._configure_lock = threading.Lock()
+        self.logger = logging.getLogger(self.name)
+        self.set_debug(_debug_from_env())
+
+    @property
+    def metrics_dir(self) -> Path:
+        return self.log_dir / "metrics"
+
+    @property
+    def main_log(self) -> Path:
+        return self.log_dir / "simulacra.log"
+
+    @property
+    def run_log(self) -> Path:
+        """Per-process run log so processes sharing log_dir never clobber each other"""
+        return self.log_dir / f"current_run.{os.getpid()}.log"
+
+    @property
+    def configured(self) -> bool:
+        return self.listener is not None
+
+    def configure(self, log_dir: Optional[Path] = None) -> None:
+        """Create the log directory, start the listener and begin a run log"""
+        with self._configure_lock:
+            if self.configured:
+                return
+            if log_dir is not None:
+                self.log_dir = Path(log_dir)
+            self._closed = False
+            self.setup_directories()
+            self.setup_logging()
+            self._clear_run_log()
+            self.compress_in_background()
 
     def setup_directories(self) -> None:
         """Create required directories"""
@@ -54,13 +180,19 @@ class SimulacraLogger:
             directory.mkdir(parents=True, exist_ok=True)
 
     def setup_logging(self) -> None:
-        """Initialize enhanced logging setup"""
-        self.logger = logging.getLogger('simulacra')
-        self.logger.setLevel(logging.DEBUG)
+        """Route records through a queue to handlers on a listener thread
+
+        A logging call on the caller's thread creates the record and puts it
+        on the queue. Console output, the rotating files and the run log are
+        written by the listener thread.
+        """
+        self.logger.propagate = False
+        for handler in list(self.logger.handlers):
+            self.logger.removeHandler(handler)
 
         # Main rotating log handler
         main_handler = RotatingFileHandler(
-            self.log_dir / "simulacra.log",
+            self.main_log,
             maxBytes=5 * 1024 * 1024,  # 5MB
             backupCount=5,
             encoding='utf-8'
@@ -82,84 +214,151 @@ class SimulacraLogger:
         )
         main_handler.setFormatter(formatter)
         debug_handler.setFormatter(formatter)
-
-        self.logger.addHandler(main_handler)
-        self.logger.addHandler(debug_handler)
+        self.run_handler = RunLogHandler(self.run_log)
+
+        self.handlers = [ConsoleHandler(), main_handler, debug_handler, self.run_handler]
+        self._queue: "queue.Queue[logging.LogRecord]" = queue.Queue()
+        self.logger.addHandler(_LocalQueueHandler(self._queue))
+        self.listener = QueueListener(self._queue, *self.handlers, respect_handler_level=True)
+        self.listener.start()
+
+    def set_debug(self, enabled: bool) -> None:
+        """Global debug switch; when off, debug calls return before formatting"""
+        self.logger.setLevel(logging.DEBUG if enabled else logging.INFO)
+
+    @property
+    def debug_enabled(self) -> bool:
+        return self.logger.isEnabledFor(logging.DEBUG)
+
+    def flush(self) -> None:
+        """Block until every queued record has been written"""
+        if self.listener is not None:
+            self._queue.join()
+        for handler in self.handlers:
+            handler.flush()
+
+    def close(self) -> None:
+        """Drain the queue, stop the listener and close every handler
+
+        Records logged afterwards, e.g. by other exit hooks, are dropped.
+        """
+        self._closed = True
+        if self.compressor is not None:
+            self.compressor.join()
+        if self.listener is None:
+            return
+        self.listener.stop()
+        self.listener = None
+        for handler in self.handlers:
+            handler.close()
+        self.handlers = []
 
     def _clear_run_log(self) -> None:
         """Initialize new run log"""
         with open(self.run_log, "w", encoding="utf-8") as f:
             f.write(f"=== SIMULACRA RUN LOG ===\n{datetime.now()}\n\n")
 
+    def compress_in_background(self) -> None:
+        self.compressor = threading.Thread(target=self._compress_old_logs,
+                                           name="log-compressor", daemon=True)
+        self.compressor.start()
+
+    def _compression_candidates(self) -> list:
+        now = time.time()
+        candidates = []
+        for path in self.log_dir.iterdir():
+            name = path.name
+            if name.endswith(".gz") or not path.is_file():
+                continue
+            if ".compressing." in name or name.startswith("current_run."):
+                # Abandoned claims and run logs of other processes, once stale
+                if path != self.run_log and now - path.stat().st_mtime > self.STALE_SECONDS:
+                    candidates.append(path)
+            elif name.startswith(("simulacra.log.", "debug.log.")):
+                candidates.append(path)
+        return candidates
+
     def _compress_old_logs(self) -> None:
-        """Compress rotated log files"""
-        for i in range(1, self.BACKUP_COUNT + 1):
-            log_file = self.main_log.with_suffix(f'.log.{i}')
-            if log_file.exists():
-                gz_file = log_file.with_suffix('.gz')
-                with open(log_file, 'rb') as f_in:
-                    with gzip.open(gz_file, 'wb') as f_out:
+        """Gzip rotated and stale log files
+
+        Each file is claimed by renaming it first, so when several processes
+        share the log directory only one of them compresses a given file.
+        """
+        try:
+            candidates = self._compression_candidates()
+        except OSError:
+            return
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        for path in candidates:
+            base = path.name.split(".compressing.")[0]
+            claimed = path.with_name(f"{base}.compressing.{os.getpid()}")
+            try:
+                path.rename(claimed)
+            except OSError:
+                continue  # another process claimed it first
+            gz_file = path.with_name(f"{base}.{stamp}.{os.getpid()}.gz")
+            tmp = gz_file.with_name(gz_file.name + ".tmp")
+            try:
+                with open(claimed, 'rb') as f_in:
+                    with gzip.open(tmp, 'wb') as f_out:
                         shutil.copyfileobj(f_in, f_out)
-                log_file.unlink()  # Remove original file
-
-    def _log(self, level: str, msg: str, color: Optional[str]=None) -> None:
-        """Core logging function with color support"""
+                tmp.replace(gz_file)
+                claimed.unlink()
+            except OSError as e:
+                self.logger.warning("Could not compress %s: %s", path.name, e)
+
+    def _log(self, level: str, msg: Union[str, Callable[[], Any]], args: tuple = (),
+             color: Optional[str]=None, prefix: str='', run_log: bool=False) -> None:
+        """Core logging function with color support
+
+        `msg` may be a %-style format string with `args`, or a callable that
+        builds the message. Either way nothing is formatted unless the level
+        is enabled; arguments are merged when the record is queued, and a
+        callable runs on the listener thread.
+        """
+        levelno = self.LOG_LEVELS.get(level.lower(), logging.INFO)
+        if levelno >= logging.WARNING:
+            LOG_MESSAGES.inc(level=logging.getLevelName(levelno).lower())
+        if self._closed or not self.logger.isEnabledFor(levelno):
+            return
+        if self.listener is None:
+            self.configure()
+        if callable(msg):
+            msg = LazyMessage(msg)
         color = color or self.COLORS.get(level, '')
-        print(f"{color}{msg}{Style.RESET_ALL}")
+        self.logger.log(levelno, msg, *args,
+                        extra={"color": color, "prefix": prefix, "run_log": run_log})
 
-        log_func = getattr(self.logger, level.lower(), self.logger.info)
-        log_func(msg)
+    def debug(self, msg: Union[str, Callable[[], Any]], *args: Any) -> None:
+        self._log('DEBUG', msg, args, prefix="DEBUG: ")
 
-    def debug(self, msg: str) -> None:
-        self._log('DEBUG', f"DEBUG: {msg}")
+    def info(self, msg: Union[str, Callable[[], Any]], *args: Any,
+             color: Optional[str]=None) -> None:
+        self._log('INFO', msg, args, color)
 
-    def info(self, msg: str, color: Optional[str]=None) -> None:
-        self._log('INFO', msg, color)
+    def warning(self, msg: Union[str, Callable[[], Any]], *args: Any) -> None:
+        self._log('WARNING', msg, args, prefix="WARNING: ")
 
-    def warning(self, msg: str) -> None:
-        print(f"{Fore.YELLOW}WARNING: {msg}{Style.RESET_ALL}")
-        self.logger.warning(msg)
-
-    def error(self, msg: str) -> None:
-        self._log('ERROR', f"ERROR: {msg}")
+    def error(self, msg: Union[str, Callable[[], Any]], *args: Any) -> None:
+        self._log('ERROR', msg, args, prefix="ERROR: ")
 
     def mutation(self, name: str, rarity: str, effect: str, time: int) -> None:
-        msg = f"[{time}s] 🌱 {name} [{rarity.upper()}] — {effect}"
-        self._log('MUTATION', msg)
-        self._append_run_log(msg)
+        self._log('MUTATION', "[%ss] 🌱 %s [%s] — %s", (time, name, rarity.upper(), effect),
+                  run_log=True)
 
     def disaster(self, name: str, dtype: str, flair: str, dmg: float, time: int) -> None:
-        msg = f"[{time}s] ⚠️ {name} [{dtype.upper()}] — {flair} | Damage: -{dmg:.2f} HP"
-        self._log('DISASTER', msg)
-        self._append_run_log(msg)
+        self._log('DISASTER', "[%ss] ⚠️ %s [%s] — %s | Damage: -%.2f HP",
+                  (time, name, dtype.upper(), flair, dmg), run_log=True)
 
     def achievement(self, name: str) -> None:
-        msg = f"🏆 Achievement Unlocked: {name}"
-        self._log('ACHIEVEMENT', msg)
-
-    def _append_run_log(self, text: str) -> None:
-        """Append to current run log"""
-        with open(self.run_log, "a", encoding="utf-8") as f:
-            f.write(f"{text}\n")
+        self._log('ACHIEVEMENT', "🏆 Achievement Unlocked: %s", (name,))
 
 
 # Global logger instance
 logger = SimulacraLogger()
+atexit.register(logger.close)
 
 
-def setup_logging() -> None:
-    """Configure logging with rotation"""
-    log_dir = Path("logs")
-    log_dir.mkdir(exist_ok=True)
-
-    handler = RotatingFileHandler(
-        log_dir / "simulacra.log",
-        maxBytes=5 * 1024 * 1024,  # 5MB
-        backupCount=3
-    )
-
-    logging.basicConfig(
-        handlers=[handler],
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        level=logging.INFO
-    )
+def setup_logging(log_dir: Optional[Path] = None) -> None:
+    """Configure log output explicitly; importing this module creates no files"""
+    logger.configure(log_dir)
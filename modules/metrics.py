@@ -0,0 +1,279 @@
+# modules/metrics.py
+
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Dict, Final, Iterator, List, Optional, Sequence, Tuple
+from pathlib import Path
+import abc
+import bisect
+import math
+import os
+import threading
+import time
+
+CONTENT_TYPE: Final[str] = "text/plain; version=0.0.4; charset=utf-8"
+DEFAULT_BUCKETS: Final[Tuple[float, ...]] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+METRICS_FILE_ENV: Final[str] = "SIMULACRA_METRICS_FILE"
+METRICS_PORT_ENV: Final[str] = "SIMULACRA_METRICS_PORT"
+TEXTFILE_INTERVAL: Final[float] = 15.0  # seconds
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+LabelKey = Tuple[str, ...]
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class Metric(abc.ABC):
+    """Base for a named metric with optional labels
+
+    Label values are passed as keyword arguments; each combination is its
+    own series.
+    """
+
+    kind = "untyped"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelKey:
+        if set(labels) != set(self.labels):
+            raise ValueError(f"{self.name} expects labels {self.labels}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labels)
+
+    def _label_text(self, key: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+        pairs = list(zip(self.labels, key))
+        if extra is not None:
+            pairs.append(extra)
+        if not pairs:
+            return ""
+        return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+    @abc.abstractmethod
+    def samples(self) -> List[str]:
+        """Exposition lines for every series, without HELP and TYPE"""
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}",
+                *self.samples()]
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()):
+        super().__init__(name, help, labels)
+        self._values: Dict[LabelKey, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        if amount < 0:
+            raise ValueError("Counters only go up")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        key = self._key(labels)
+        with self._lock:
+            return self._values.get(key, 0.0)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [f"{self.name}{self._label_text(key)} {_format_value(v)}" for key, v in values]
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, help, labels)
+        self.buckets = tuple(sorted(buckets))
+        # Per series: [count per bucket (last is +Inf), sum]
+        self._series: Dict[LabelKey, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total = self._series.setdefault(key, ([0] * (len(self.buckets) + 1), [0.0]))
+            counts[index] += 1
+            total[0] += value
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        """Observe the wall time of the block in seconds"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels: str) -> int:
+        key = self._key(labels)
+        with self._lock:
+            series = self._series.get(key)
+            return sum(series[0]) if series else 0
+
+    def samples(self) -> List[str]:
+        lines = []
+        with self._lock:
+            series = sorted((key, (list(c), t[0])) for key, (c, t) in self._series.items())
+        for key, (counts, total) in series:
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), counts):
+                cumulative += count
+                label = self._label_text(key, ("le", _format_value(bound)))
+                lines.append(f"{self.name}_bucket{label} {cumulative}")
+            lines.append(f"{self.name}_sum{self._label_text(key)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{self._label_text(key)} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Holds every metric and renders them in Prometheus text format"""
+
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: Metric) -> Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric):
+                    raise ValueError(f"Metric {metric.name} already registered as {existing.kind}")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, help: str, labels: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, help, labels))
+
+    def gauge(self, name: str, help: str, labels: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, help, labels))
+
+    def histogram(self, name: str, help: str, labels: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, help, labels, buckets))
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    # ---- exporters ----
+
+    def write_textfile(self, path: Path) -> None:
+        """Write the exposition atomically, for node_exporter's textfile collector"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(self.render(), encoding="utf-8")
+        tmp.replace(path)
+
+    def start_textfile_writer(self, path: Path,
+                              interval: float = TEXTFILE_INTERVAL) -> threading.Thread:
+        def run() -> None:
+            while True:
+                try:
+                    self.write_textfile(path)
+                except OSError:
+                    pass  # the next interval retries
+                time.sleep(interval)
+
+        thread = threading.Thread(target=run, name="metrics-textfile", daemon=True)
+        thread.start()
+        return thread
+
+    def serve(self, port: int, host: str = "127.0.0.1") -> "ThreadingHTTPServer":
+        """Serve /metrics on a background thread; localhost only by default"""
+        # Imported here: http.server is slow to import and most runs never serve
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?")[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args) -> None:
+                pass  # scrapes would flood the console
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+        return server
+
+
+registry = MetricsRegistry()
+
+# ---- game metrics ----
+
+TICKS = registry.counter("simulacra_ticks_total", "Simulation ticks processed")
+DISASTERS = registry.counter("simulacra_disasters_total", "Disasters that dealt damage",
+                             labels=("type",))
+DAMAGE_TAKEN = registry.histogram("simulacra_damage_taken", "HP lost per disaster hit",
+                                  buckets=(1, 2, 5, 10, 15, 20, 30, 50, 100))
+MUTATIONS = registry.counter("simulacra_mutations_total", "Mutations gained")
+RUNS = registry.counter("simulacra_runs_total", "Runs completed")
+PLAYER_HP = registry.gauge("simulacra_player_hp", "Current HP of the running simulation")
+SAVE_SECONDS = registry.histogram("simulacra_save_seconds", "Save latency in seconds",
+                                  labels=("kind",))
+HUD_FRAME_SECONDS = registry.histogram("simulacra_hud_frame_seconds", "HUD frame render time")
+HUD_FRAMES_DROPPED = registry.counter("simulacra_hud_frames_dropped_total",
+                                      "HUD snapshots replaced before they were drawn")
+LOG_MESSAGES = registry.counter("simulacra_log_messages_total", "Log records by level",
+                                labels=("level",))
+
+
+def start_exporters_from_env() -> None:
+    """Export when SIMULACRA_METRICS_FILE or SIMULACRA_METRICS_PORT is set"""
+    if path := os.environ.get(METRICS_FILE_ENV):
+        registry.start_textfile_writer(Path(path))
+    if port := os.environ.get(METRICS_PORT_ENV):
+        registry.serve(int(port))
@@ -3,10 +3,10 @@ from typing import Dict, List, Optional, Final
 from pathlib import Path
 import random
 import uuid
-import json
 
 from modules.logger import logger
 from modules.constants import DATA_DIR
+from modules.read_cache import read_cache
 
 @dataclass
 class MutationComponents:
@@ -43,9 +43,7 @@ class MutationGenerator:
 
     def _load_json_file(self, filename: str) -> List[str]:
         """Load JSON file from mutation parts directory"""
-        file_path = self.MUTATION_PARTS_DIR / filename
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return read_cache.get_json(self.MUTATION_PARTS_DIR / filename)
 
     def generate_mutation_effect(self) -> str:
         """Generate random mutation effect string"""
@@ -0,0 +1,116 @@
+# modules/persistence_worker.py
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Final, Optional
+from enum import IntEnum
+import atexit
+import itertools
+import queue
+import threading
+
+from modules.logger import logger
+from modules.constants import PERSISTENCE_QUEUE_SIZE
+from modules.storage import storage
+
+SUBMIT_TIMEOUT: Final[float] = 0.5
+
+
+class Priority(IntEnum):
+    """Lower values are written first"""
+    CRITICAL = 0   # run history: losing it loses the run
+    NORMAL = 1     # achievements, highlights, config
+    LOW = 2        # derived data that can be rebuilt
+    SHUTDOWN = 99  # sorts after every real job so close() drains the queue
+
+
+@dataclass(order=True, frozen=True)
+class PersistenceJob:
+    priority: int
+    seq: int
+    name: str = field(compare=False)
+    action: Optional[Callable[[Any], Any]] = field(compare=False, default=None)
+    record: Any = field(compare=False, default=None)
+
+
+class PersistenceWorker:
+    """Background thread that performs queued persistence jobs
+
+    The game thread submits an action plus an immutable record and returns
+    immediately. Jobs run in priority order, FIFO within a priority. The
+    queue is bounded. When it stays full past SUBMIT_TIMEOUT, the job runs
+    inline rather than being dropped. close(), registered at exit, drains
+    every queued job before returning.
+    """
+
+    def __init__(self, maxsize: int = PERSISTENCE_QUEUE_SIZE):
+        self._queue: "queue.PriorityQueue[PersistenceJob]" = queue.PriorityQueue(maxsize)
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self.completed = 0
+        self.failed = 0
+
+    def _ensure_thread(self) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="persistence-worker",
+                                                daemon=True)
+                self._thread.start()
+
+    def submit(self, name: str, action: Callable[[Any], Any], record: Any,
+               priority: Priority = Priority.NORMAL) -> bool:
+        """Queue `action(record)`; returns False if it had to run inline"""
+        job = PersistenceJob(priority, next(self._seq), name, action, record)
+        self._ensure_thread()
+        try:
+            self._queue.put(job, timeout=SUBMIT_TIMEOUT)
+            return True
+        except queue.Full:
+            logger.warning(f"Persistence queue full; running {name} inline")
+            self._execute(job)
+            return False
+
+    def _execute(self, job: PersistenceJob) -> None:
+        try:
+            job.action(job.record)
+            self.completed += 1
+        except Exception as e:
+            self.failed += 1
+            logger.error(f"Persistence job {job.name} failed: {e}")
+
+    def _run(self) -> None:
+        while True:
+            job = self._queue.get()
+            try:
+                if job.priority == Priority.SHUTDOWN:
+                    return
+                self._execute(job)
+            finally:
+                self._queue.task_done()
+
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def flush(self) -> None:
+        """Block until every queued job has run"""
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.join()
+
+    def close(self) -> None:
+        """Drain the queue and stop the worker thread"""
+        thread = self._thread
+        if thread is None or not thread.is_alive():
+            return
+        self._queue.put(PersistenceJob(Priority.SHUTDOWN, next(self._seq), "shutdown"))
+        thread.join()
+        self._thread = None
+
+
+persistence_worker = PersistenceWorker()
+
+
+@atexit.register
+def _shutdown() -> None:
+    # Jobs stage documents with the storage service, so drain them first
+    persistence_worker.close()
+    storage.close()
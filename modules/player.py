@@ -1,15 +1,20 @@
 from pathlib import Path
-from typing import Dict, List, Optional, Final
-from dataclasses import dataclass, field
-import json
+from typing import Dict, Final, Mapping, Tuple
+from dataclasses import dataclass, field, fields, replace
+from types import MappingProxyType
 
 from modules.logger import logger
 from modules.constants import DATA_DIR
+from modules.config_service import config_service
 from modules.error_handler import GameError, ValidationError
 
-@dataclass
+@dataclass(frozen=True)
 class PlayerConfig:
-    """Player configuration with validation"""
+    """Player configuration snapshot with validation
+
+    Lists are stored as tuples and dev_flags as a read-only mapping, so a
+    shared snapshot cannot change under its other readers.
+    """
     trait_slots: int = field(
         default=3,
         metadata={"min": 1, "max": 10}
@@ -18,14 +23,14 @@ class PlayerConfig:
         default=0,
         metadata={"min": 0}
     )
-    unlocked_themes: List[str] = field(default_factory=list)
-    unlocked_audio: List[str] = field(default_factory=list)
-    hud_upgrades: List[str] = field(default_factory=list)
-    dev_flags: Dict[str, bool] = field(
-        default_factory=lambda: {
+    unlocked_themes: Tuple[str, ...] = ()
+    unlocked_audio: Tuple[str, ...] = ()
+    hud_upgrades: Tuple[str, ...] = ()
+    dev_flags: Mapping[str, bool] = field(
+        default_factory=lambda: MappingProxyType({
             "debug_mode": False,
             "mutation_log_visible": True
-        }
+        })
     )
 
     def __post_init__(self):
@@ -50,20 +55,21 @@ class PlayerConfig:
             raise ValueError(f"Reflection points cannot be negative")
 
     def _validate_lists(self) -> None:
-        if not isinstance(self.unlocked_themes, list):
-            self.unlocked_themes = list(self.unlocked_themes)
-        if not isinstance(self.unlocked_audio, list):
-            self.unlocked_audio = list(self.unlocked_audio)
-        if not isinstance(self.hud_upgrades, list):
-            self.hud_upgrades = list(self.hud_upgrades)
+        for name in ("unlocked_themes", "unlocked_audio", "hud_upgrades"):
+            object.__setattr__(self, name, tuple(getattr(self, name)))
 
     def _validate_dev_flags(self) -> None:
         required_flags = {"debug_mode", "mutation_log_visible"}
-        if not all(flag in self.dev_flags for flag in required_flags):
-            self.dev_flags.update({
-                flag: False for flag in required_flags
-                if flag not in self.dev_flags
-            })
+        # Copy, so the caller's dict cannot reach into the snapshot
+        flags = {flag: False for flag in required_flags}
+        flags.update(self.dev_flags)
+        object.__setattr__(self, "dev_flags", MappingProxyType(flags))
+
+    def to_dict(self) -> Dict:
+        """JSON-ready copy of the snapshot"""
+        data = {f.name: getattr(self, f.name) for f in fields(self)}
+        data["dev_flags"] = dict(self.dev_flags)
+        return data
 
 class PlayerManager:
     """Manages player configuration and state"""
@@ -75,15 +81,16 @@ class PlayerManager:
     CONFIG_PATH: Final[Path] = DATA_DIR / "player_config.json"
     MAX_TRAIT_SLOTS: Final[int] = 9
 
+    @classmethod
+    def _document(cls):
+        return config_service.document(cls.CONFIG_PATH, lambda data: PlayerConfig(**data),
+                                       PlayerConfig.to_dict, cls._create_default_config)
+
     @classmethod
     def load_config(cls) -> PlayerConfig:
         """Load or create player configuration"""
         try:
-            if cls.CONFIG_PATH.exists():
-                with open(cls.CONFIG_PATH, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                return PlayerConfig(**data)
-            return cls._create_default_config()
+            return cls._document().get()
         except Exception as e:
             logger.error(f"Failed to load player config: {e}")
             return cls._create_default_config()
@@ -92,10 +99,7 @@ class PlayerManager:
     def save_config(cls, config: PlayerConfig) -> bool:
         """Save player configuration"""
         try:
-            cls.CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
-            with open(cls.CONFIG_PATH, 'w', encoding='utf-8') as f:
-                json.dump(vars(config), f, indent=2)
-            return True
+            return cls._document().set(config)
         except Exception as e:
             logger.error(f"Failed to save player config: {e}")
             return False
@@ -106,18 +110,18 @@ class PlayerManager:
         return PlayerConfig()
 
     @staticmethod
-    def increase_trait_slots(config: PlayerConfig) -> bool:
-        """Attempt to increase trait slots"""
+    def increase_trait_slots(config: PlayerConfig) -> PlayerConfig:
+        """Config with one more trait slot, unchanged at the maximum"""
         if config.trait_slots < PlayerManager.MAX_TRAIT_SLOTS:
-            config.trait_slots += 1
-            return True
-        return False
+            return replace(config, trait_slots=config.trait_slots + 1)
+        return config
 
     @staticmethod
-    def unlock_theme(config: PlayerConfig, theme_name: str) -> None:
-        """Unlock a new theme"""
+    def unlock_theme(config: PlayerConfig, theme_name: str) -> PlayerConfig:
+        """Config with a new theme unlocked"""
         if theme_name not in config.unlocked_themes:
-            config.unlocked_themes.append(theme_name)
+            return replace(config, unlocked_themes=(*config.unlocked_themes, theme_name))
+        return config
 
     @staticmethod
     def has_theme(config: PlayerConfig, theme_name: str) -> bool:
@@ -125,9 +129,10 @@ class PlayerManager:
         return theme_name in config.unlocked_themes
 
     @staticmethod
-    def toggle_debug_mode(config: PlayerConfig) -> None:
-        """Toggle debug mode"""
-        config.dev_flags["debug_mode"] = not config.dev_flags["debug_mode"]
+    def toggle_debug_mode(config: PlayerConfig) -> PlayerConfig:
+        """Config with debug mode flipped"""
+        flags = {**config.dev_flags, "debug_mode": not config.dev_flags["debug_mode"]}
+        return replace(config, dev_flags=flags)
 
     @staticmethod
     def is_debug_enabled(config: PlayerConfig) -> bool:
@@ -0,0 +1,163 @@
+# modules/read_cache.py
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+from pathlib import Path
+import os
+import threading
+import time
+
+from modules.constants import READ_CACHE_MAX_BYTES, READ_CACHE_TTL
+from modules.lazy_import import lazy_import
+
+if TYPE_CHECKING:
+    import asyncio
+
+aiofiles = lazy_import("aiofiles")
+orjson = lazy_import("orjson")
+
+FileKey = Tuple[int, int]  # (st_mtime_ns, st_size)
+
+
+@dataclass
+class CacheEntry:
+    key: FileKey
+    data: bytes
+    checked_at: float
+
+
+class ReadCache:
+    """Read-through cache for data and state files
+
+    Entries are keyed by path and validated against the file's mtime and
+    size. For `ttl` seconds after a check an entry is served without
+    touching the disk. After that, one stat decides whether it is still
+    current. Raw bytes are cached, bounded by `max_bytes` in LRU order.
+    JSON is parsed on each read so callers never share a mutable object.
+    Concurrent async reads of the same file share one in-flight read, run
+    as a task the cache owns so cancelling one reader leaves the others.
+    """
+
+    def __init__(self, ttl: float = READ_CACHE_TTL, max_bytes: int = READ_CACHE_MAX_BYTES):
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Path, CacheEntry]" = OrderedDict()
+        self._inflight: Dict[Path, "asyncio.Task[bytes]"] = {}
+        self._lock = threading.Lock()
+
+    # ---- cache bookkeeping ----
+
+    @staticmethod
+    def _file_key(path: Path) -> FileKey:
+        st = os.stat(path)
+        return st.st_mtime_ns, st.st_size
+
+    def _lookup(self, path: Path) -> Optional[bytes]:
+        """Cached bytes if still current; stats the file once the TTL lapses"""
+        with self._lock:
+            entry = self._entries.get(path)
+        if entry is None:
+            return None
+        now = time.monotonic()
+        if now - entry.checked_at >= self.ttl:
+            try:
+                current = self._file_key(path)
+            except OSError:
+                current = None
+            if current != entry.key:
+                self.invalidate(path)
+                return None
+            entry.checked_at = now
+        with self._lock:
+            if path in self._entries:
+                self._entries.move_to_end(path)
+            self.hits += 1
+        return entry.data
+
+    def _store(self, path: Path, key: FileKey, data: bytes) -> None:
+        if len(data) > self.max_bytes:
+            return
+        with self._lock:
+            if (old := self._entries.pop(path, None)) is not None:
+                self.size -= len(old.data)
+            self._entries[path] = CacheEntry(key, data, time.monotonic())
+            self.size += len(data)
+            while self.size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= len(evicted.data)
+
+    def invalidate(self, path: Path) -> None:
+        with self._lock:
+            if (entry := self._entries.pop(Path(path), None)) is not None:
+                self.size -= len(entry.data)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ---- synchronous reads ----
+
+    def get_bytes(self, path: Path) -> bytes:
+        """Contents of a file, from memory when unchanged"""
+        path = Path(path)
+        if (data := self._lookup(path)) is not None:
+            return data
+        with self._lock:
+            self.misses += 1
+        key = self._file_key(path)
+        data = path.read_bytes()
+        self._store(path, key, data)
+        return data
+
+    def get_json(self, path: Path) -> Any:
+        return orjson.loads(self.get_bytes(path))
+
+    # ---- asynchronous reads ----
+
+    async def _read(self, path: Path) -> bytes:
+        with self._lock:
+            self.misses += 1
+        key = self._file_key(path)
+        async with aiofiles.open(path, 'rb') as f:
+            data = await f.read()
+        self._store(path, key, data)
+        return data
+
+    def _read_done(self, path: Path, task: "asyncio.Task[bytes]") -> None:
+        if self._inflight.get(path) is task:
+            del self._inflight[path]
+        if not task.cancelled():
+            # Waiters re-raise it; retrieve it here so a read nobody awaits stays quiet
+            task.exception()
+
+    async def read_bytes(self, path: Path) -> bytes:
+        """Async variant of get_bytes; concurrent callers share one read"""
+        # Only reachable from a running event loop, so asyncio is already loaded
+        import asyncio
+
+        path = Path(path)
+        if (data := self._lookup(path)) is not None:
+            return data
+
+        loop = asyncio.get_running_loop()
+        task = self._inflight.get(path)
+        if task is None or task.get_loop() is not loop:
+            task = loop.create_task(self._read(path))
+            self._inflight[path] = task
+            task.add_done_callback(lambda done: self._read_done(path, done))
+        # Shielded, so a cancelled caller stops waiting without stopping the read
+        return await asyncio.shield(task)
+
+    async def read_json(self, path: Path) -> Any:
+        return orjson.loads(await self.read_bytes(path))
+
+
+read_cache = ReadCache()
@@ -0,0 +1,236 @@
+# modules/run_index.py
+
+from dataclasses import dataclass
+from typing import Any, Dict, Final, Iterable, List, Mapping, Optional, Tuple
+from pathlib import Path
+import math
+import sqlite3
+import threading
+
+from modules.constants import SAVE_DIR
+
+SCHEMA: Final[str] = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    timestamp TEXT NOT NULL,
+    survival_seconds INTEGER NOT NULL,
+    reflection_points INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS run_traits (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    name TEXT NOT NULL,
+    tier INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS run_mutations (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    name TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_runs_survival ON runs(survival_seconds);
+CREATE INDEX IF NOT EXISTS idx_run_traits_name ON run_traits(name, run_id);
+CREATE INDEX IF NOT EXISTS idx_run_traits_tier ON run_traits(tier, run_id);
+CREATE INDEX IF NOT EXISTS idx_run_mutations_name ON run_mutations(name, run_id);
+
+-- Rollups kept current by triggers so aggregate queries never scan runs
+CREATE TABLE IF NOT EXISTS run_totals (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    runs INTEGER NOT NULL,
+    total_survival REAL NOT NULL,
+    total_survival_sq REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS trait_stats (
+    name TEXT NOT NULL,
+    tier INTEGER NOT NULL,
+    runs INTEGER NOT NULL,
+    total_survival REAL NOT NULL,
+    best_survival INTEGER NOT NULL,
+    PRIMARY KEY (name, tier)
+);
+CREATE TABLE IF NOT EXISTS tier_stats (
+    tier INTEGER PRIMARY KEY,
+    runs INTEGER NOT NULL,
+    total_survival REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS mutation_stats (
+    name TEXT PRIMARY KEY,
+    runs INTEGER NOT NULL,
+    total_survival REAL NOT NULL
+);
+
+CREATE TRIGGER IF NOT EXISTS runs_rollup AFTER INSERT ON runs BEGIN
+    INSERT INTO run_totals VALUES (0, 1, NEW.survival_seconds,
+                                   NEW.survival_seconds * NEW.survival_seconds)
+    ON CONFLICT(id) DO UPDATE SET
+        runs = runs + 1,
+        total_survival = total_survival + excluded.total_survival,
+        total_survival_sq = total_survival_sq + excluded.total_survival_sq;
+END;
+CREATE TRIGGER IF NOT EXISTS run_traits_rollup AFTER INSERT ON run_traits BEGIN
+    INSERT INTO trait_stats
+    SELECT NEW.name, NEW.tier, 1, survival_seconds, survival_seconds
+    FROM runs WHERE id = NEW.run_id
+    ON CONFLICT(name, tier) DO UPDATE SET
+        runs = runs + 1,
+        total_survival = total_survival + excluded.total_survival,
+        best_survival = MAX(best_survival, excluded.best_survival);
+END;
+-- Only a run's first trait of each tier counts, so the tier mean is per run
+CREATE TRIGGER IF NOT EXISTS run_tiers_rollup AFTER INSERT ON run_traits
+WHEN (SELECT COUNT(*) FROM run_traits WHERE tier = NEW.tier AND run_id = NEW.run_id) = 1
+BEGIN
+    INSERT INTO tier_stats
+    SELECT NEW.tier, 1, survival_seconds FROM runs WHERE id = NEW.run_id
+    ON CONFLICT(tier) DO UPDATE SET
+        runs = runs + 1,
+        total_survival = total_survival + excluded.total_survival;
+END;
+CREATE TRIGGER IF NOT EXISTS run_mutations_rollup AFTER INSERT ON run_mutations BEGIN
+    INSERT INTO mutation_stats
+    SELECT NEW.name, 1, survival_seconds FROM runs WHERE id = NEW.run_id
+    ON CONFLICT(name) DO UPDATE SET
+        runs = runs + 1,
+        total_survival = total_survival + excluded.total_survival;
+END;
+
+-- Indexes created before tier_stats existed are filled in once
+INSERT INTO tier_stats
+SELECT t.tier, COUNT(*), SUM(r.survival_seconds)
+FROM (SELECT DISTINCT tier, run_id FROM run_traits) AS t
+JOIN runs AS r ON r.id = t.run_id
+WHERE NOT EXISTS (SELECT 1 FROM tier_stats)
+GROUP BY t.tier;
+"""
+
+# Query text is constant so sqlite3's statement cache reuses the prepared plans
+INSERT_RUN: Final[str] = "INSERT OR IGNORE INTO runs VALUES (?, ?, ?, ?)"
+INSERT_TRAIT: Final[str] = "INSERT INTO run_traits VALUES (?, ?, ?)"
+INSERT_MUTATION: Final[str] = "INSERT INTO run_mutations VALUES (?, ?)"
+LAST_RUN_ID: Final[str] = "SELECT MAX(id) FROM runs"
+RUN_TOTALS: Final[str] = "SELECT runs, total_survival, total_survival_sq FROM run_totals"
+BEST_WITH_TRAIT: Final[str] = "SELECT MAX(best_survival) FROM trait_stats WHERE name = ?"
+MEAN_BY_TIER: Final[str] = """
+    SELECT tier, total_survival / runs, runs FROM tier_stats ORDER BY tier
+"""
+MUTATION_STATS: Final[str] = "SELECT name, runs, total_survival FROM mutation_stats"
+TRAIT_RANKING: Final[str] = """
+    SELECT name, SUM(total_survival) / SUM(runs) AS mean, SUM(runs) AS n, MAX(best_survival)
+    FROM trait_stats GROUP BY name HAVING n >= ?
+    ORDER BY mean DESC LIMIT ?
+"""
+
+
+@dataclass
+class MutationCorrelation:
+    """How a mutation's presence relates to survival time"""
+    name: str
+    runs: int
+    mean_survival: float
+    correlation: float
+
+
+@dataclass
+class TraitRecommendation:
+    name: str
+    mean_survival: float
+    runs: int
+    best_survival: int
+
+
+class RunIndex:
+    """SQLite index over run history for analytics queries
+
+    Rows are keyed by the run's sequence number in the history log, so the
+    index can always be rebuilt or caught up from `RunHistoryStore`.
+    """
+    INDEX_FILE: Path = SAVE_DIR / "runs.sqlite3"
+
+    def __init__(self, db_path: Optional[Path] = None):
+        self.db_path = Path(db_path or self.INDEX_FILE)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    @property
+    def next_run_id(self) -> int:
+        """Sequence number of the first run not yet indexed"""
+        with self._lock:
+            last = self._conn.execute(LAST_RUN_ID).fetchone()[0]
+        return 0 if last is None else last + 1
+
+    def add_run(self, run_id: int, run: Mapping[str, Any]) -> None:
+        self.add_runs([(run_id, run)])
+
+    def add_runs(self, runs: Iterable[Tuple[int, Mapping[str, Any]]]) -> int:
+        """Index runs in a single transaction; returns how many were added"""
+        added = 0
+        with self._lock, self._conn:
+            for run_id, run in runs:
+                cursor = self._conn.execute(INSERT_RUN, (
+                    run_id, run.get("timestamp", ""),
+                    int(run.get("survival_seconds", 0)),
+                    int(run.get("reflection_points", 0))
+                ))
+                if not cursor.rowcount:
+                    continue
+                # A run counts once per trait or mutation, however often it repeats
+                self._conn.executemany(INSERT_TRAIT, dict.fromkeys(
+                    (run_id, trait.get("name", ""), int(trait.get("tier", 0)))
+                    for trait in run.get("traits", [])
+                ))
+                self._conn.executemany(INSERT_MUTATION, dict.fromkeys(
+                    (run_id, mutation.get("name", ""))
+                    for mutation in run.get("mutations", [])
+                ))
+                added += 1
+        return added
+
+    # ---- queries ----
+
+    def run_count(self) -> int:
+        with self._lock:
+            row = self._conn.execute(RUN_TOTALS).fetchone()
+        return row[0] if row else 0
+
+    def best_survival_with_trait(self, name: str) -> Optional[int]:
+        with self._lock:
+            return self._conn.execute(BEST_WITH_TRAIT, (name,)).fetchone()[0]
+
+    def mean_survival_by_tier(self) -> Dict[int, float]:
+        with self._lock:
+            return {tier: mean for tier, mean, _ in self._conn.execute(MEAN_BY_TIER)}
+
+    def mutation_correlations(self, min_runs: int = 1) -> List[MutationCorrelation]:
+        """Point-biserial correlation between each mutation and survival"""
+        with self._lock:
+            totals = self._conn.execute(RUN_TOTALS).fetchone()
+            rows = self._conn.execute(MUTATION_STATS).fetchall()
+        if not totals:
+            return []
+
+        n, total, total_sq = totals
+        mean = total / n
+        std = math.sqrt(max(total_sq / n - mean * mean, 0.0))
+        results = []
+        for name, runs, survival in rows:
+            if runs < min_runs:
+                continue
+            with_mean = survival / runs
+            without = n - runs
+            correlation = 0.0
+            if std > 0 and without > 0:
+                without_mean = (total - survival) / without
+                correlation = (with_mean - without_mean) / std * math.sqrt(runs * without) / n
+            results.append(MutationCorrelation(name, runs, with_mean, correlation))
+        return sorted(results, key=lambda r: r.correlation, reverse=True)
+
+    def recommend_traits(self, limit: int = 5, min_runs: int = 3) -> List[TraitRecommendation]:
+        """Traits with the highest mean survival over at least `min_runs` runs"""
+        with self._lock:
+            rows = self._conn.execute(TRAIT_RANKING, (min_runs, limit)).fetchall()
+        return [TraitRecommendation(*row) for row in rows]
@@ -0,0 +1,392 @@
+# modules/run_store.py
+
+from dataclasses import dataclass
+from typing import Any, Dict, Final, Iterator, List, Optional
+from pathlib import Path
+import bisect
+import re
+import struct
+import threading
+import zlib
+
+from modules.logger import logger
+from modules.constants import SAVE_DIR
+from modules.file_lock import file_lock, hold_lock, is_locked, release_lock
+from modules.storage_codecs import FileClass, StorageCodec, codec_registry
+
+# Log blocks: [payload length][crc32][payload]; index entries: [block offset][payload length]
+BLOCK_HEADER: Final[struct.Struct] = struct.Struct("<II")
+INDEX_ENTRY: Final[struct.Struct] = struct.Struct("<QI")
+SEGMENT_PATTERN: Final = re.compile(r"seg_(\d{12})_(\d{4})\.log$")
+LOCK_FILE: Final[str] = "history.lock"
+
+
+@dataclass
+class Segment:
+    """One segment: a contiguous range of records starting at `base`"""
+    base: int
+    generation: int
+    count: int
+    path: Path
+
+    @property
+    def index_path(self) -> Path:
+        return self.path.with_suffix(".idx")
+
+    @property
+    def lease_path(self) -> Path:
+        return self.path.with_suffix(".lock")
+
+    @property
+    def end(self) -> int:
+        return self.base + self.count
+
+    def is_live(self) -> bool:
+        """Whether a store somewhere still has this segment open for appends"""
+        return is_locked(self.lease_path)
+
+
+def segment_path(directory: Path, base: int, generation: int) -> Path:
+    return directory / f"seg_{base:012d}_{generation:04d}.log"
+
+
+class RunHistoryStore:
+    """Append-only segmented log of run records
+
+    Every session appends to a fresh segment, so files from earlier sessions
+    are sealed and never modified. Each record is a codec-framed block; the
+    side index holds fixed-width offsets, which makes "latest N" a seek to
+    the end of the newest index. Small sealed segments are merged by a
+    background compaction that also re-encodes records with the current codec.
+
+    Appends, compaction and orphan cleanup hold a lock file in the history
+    directory, so a store opened mid-compaction never mistakes its files for
+    debris and stores in other processes never see a half-written block.
+    The store appending to a segment also holds that segment's lease; leased
+    segments are neither recovered nor compacted by anyone else, and a store
+    whose segment is followed by a newer one rolls over before appending.
+    """
+    HISTORY_DIR: Path = SAVE_DIR / "history"
+    SEGMENT_RECORDS: Final[int] = 4096
+    COMPACT_THRESHOLD: Final[int] = 4
+
+    def __init__(self, history_dir: Optional[Path] = None,
+                 segment_records: int = SEGMENT_RECORDS,
+                 compact_threshold: int = COMPACT_THRESHOLD,
+                 codec: Optional[StorageCodec] = None,
+                 background: bool = True):
+        self.history_dir = Path(history_dir or self.HISTORY_DIR)
+        self.history_dir.mkdir(parents=True, exist_ok=True)
+        self.segment_records = segment_records
+        self.compact_threshold = compact_threshold
+        self.codec = codec or codec_registry.codec_for(FileClass.RUNS)
+        self.lock_path = self.history_dir / LOCK_FILE
+
+        self._lock = threading.RLock()
+        with file_lock(self.lock_path):
+            self._segments: List[Segment] = self._load_segments()
+        self._active: Optional[Segment] = None
+        self._lease: Optional[int] = None
+        self._log_file = None
+        self._index_file = None
+        self._compactor: Optional[threading.Thread] = None
+
+        if background:
+            self.compact_in_background()
+
+    # ---- loading and recovery ----
+
+    def _load_segments(self) -> List[Segment]:
+        """Discover segments, dropping stale pre-compaction and orphan files
+
+        Callers hold the history lock.
+        """
+        for pattern in ("seg_*.log.tmp", "seg_*.idx.tmp"):
+            # Output of a compaction that crashed before its renames
+            for path in self.history_dir.glob(pattern):
+                path.unlink(missing_ok=True)
+
+        found = []
+        for path in self.history_dir.glob("seg_*.log"):
+            if match := SEGMENT_PATTERN.search(path.name):
+                if not path.with_suffix(".idx").exists():
+                    # Compaction crashed before its commit point
+                    path.unlink()
+                    continue
+                found.append(Segment(int(match.group(1)), int(match.group(2)), 0, path))
+
+        segments: List[Segment] = []
+        covered_end = 0
+        for segment in sorted(found, key=lambda s: (s.base, -s.generation)):
+            if segment.base < covered_end:
+                self._delete_segment(segment)
+                continue
+            if segment.is_live():
+                # Appends hold the history lock, so the index is complete
+                segment.count = segment.index_path.stat().st_size // INDEX_ENTRY.size
+            else:
+                segment.lease_path.unlink(missing_ok=True)
+                segment.count = self._recover(segment)
+                if segment.count == 0:
+                    # Crashed before its first append; its base is reused
+                    self._delete_segment(segment)
+                    continue
+            segments.append(segment)
+            covered_end = segment.end
+        return segments
+
+    def _recover(self, segment: Segment) -> int:
+        """Make the index agree with the log after an unclean shutdown"""
+        index_size = segment.index_path.stat().st_size
+        count = index_size // INDEX_ENTRY.size
+        with open(segment.index_path, "r+b") as index:
+            index.truncate(count * INDEX_ENTRY.size)
+            end = 0
+            if count:
+                index.seek((count - 1) * INDEX_ENTRY.size)
+                offset, length = INDEX_ENTRY.unpack(index.read(INDEX_ENTRY.size))
+                end = offset + BLOCK_HEADER.size + length
+
+            # Index any complete blocks written after the last index entry
+            with open(segment.path, "r+b") as log:
+                log.seek(end)
+                while header := log.read(BLOCK_HEADER.size):
+                    if len(header) < BLOCK_HEADER.size:
+                        break
+                    length, crc = BLOCK_HEADER.unpack(header)
+                    payload = log.read(length)
+                    if len(payload) < length or zlib.crc32(payload) != crc:
+                        break
+                    index.seek(0, 2)
+                    index.write(INDEX_ENTRY.pack(end, length))
+                    end += BLOCK_HEADER.size + length
+                    count += 1
+                log.truncate(end)
+        return count
+
+    def _delete_segment(self, segment: Segment) -> bool:
+        try:
+            segment.index_path.unlink(missing_ok=True)
+            segment.path.unlink(missing_ok=True)
+            return True
+        except OSError as e:
+            # Windows refuses to delete files a reader still has open
+            logger.warning(f"Could not remove segment {segment.path.name}: {e}")
+            return False
+
+    # ---- writing ----
+
+    def append(self, record: Dict[str, Any]) -> int:
+        """Append a run record; returns its sequence number"""
+        payload = self.codec.encode(record)
+        with self._lock, file_lock(self.lock_path):
+            if (self._active is None or self._active.count >= self.segment_records
+                    or self._superseded()):
+                self._open_segment()
+            offset = self._log_file.tell()
+            self._log_file.write(BLOCK_HEADER.pack(len(payload), zlib.crc32(payload)) + payload)
+            self._log_file.flush()
+            self._index_file.write(INDEX_ENTRY.pack(offset, len(payload)))
+            self._index_file.flush()
+            self._active.count += 1
+            return self._active.end - 1
+
+    def _superseded(self) -> bool:
+        """Whether another store started a segment after our active one"""
+        return any(self.history_dir.glob(f"seg_{self._active.end:012d}_*.log"))
+
+    def _open_segment(self) -> None:
+        """Start a new segment after every segment on disk
+
+        Callers hold the history lock, so the rescan sees every other
+        store's appends and no two stores can pick the same base.
+        """
+        self._close_files()
+        self._reload_segments()
+        base = self._segments[-1].end if self._segments else 0
+        segment = Segment(base, 0, 0, segment_path(self.history_dir, base, 0))
+        lease = hold_lock(segment.lease_path)
+        try:
+            # Index first: a log that briefly has no index looks like debris
+            self._index_file = open(segment.index_path, "xb")
+            self._log_file = open(segment.path, "xb")
+        except BaseException:
+            self._close_files()
+            self._active = None
+            release_lock(lease)
+            segment.lease_path.unlink(missing_ok=True)
+            raise
+        self._lease = lease
+        self._segments.append(segment)
+        self._active = segment
+
+    def _close_files(self) -> None:
+        for handle in (self._log_file, self._index_file):
+            if handle is not None:
+                handle.close()
+        self._log_file = self._index_file = None
+        if self._lease is not None:
+            release_lock(self._lease)
+            self._lease = None
+            self._active.lease_path.unlink(missing_ok=True)
+
+    def close(self) -> None:
+        """Close the active segment and wait for compaction"""
+        if self._compactor is not None:
+            self._compactor.join()
+        with self._lock, file_lock(self.lock_path):
+            self._close_files()
+            self._active = None
+
+    # ---- reading ----
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._segments[-1].end if self._segments else 0
+
+    def _read_index(self, segment: Segment, start: int, stop: int) -> List[tuple]:
+        with open(segment.index_path, "rb") as index:
+            index.seek(start * INDEX_ENTRY.size)
+            data = index.read((stop - start) * INDEX_ENTRY.size)
+        return list(INDEX_ENTRY.iter_unpack(data))
+
+    def _read_blocks(self, log, entries: List[tuple]) -> Iterator[Any]:
+        for offset, length in entries:
+            log.seek(offset + BLOCK_HEADER.size)
+            yield self.codec.decode(log.read(length))
+
+    def latest(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Most recent records first; cost depends only on `limit`"""
+        records: List[Dict[str, Any]] = []
+        with self._lock:
+            for segment in reversed(self._segments):
+                if len(records) >= limit:
+                    break
+                need = limit - len(records)
+                entries = self._read_index(segment, max(0, segment.count - need), segment.count)
+                with open(segment.path, "rb") as log:
+                    records.extend(reversed(list(self._read_blocks(log, entries))))
+        return records
+
+    def _segment_for(self, seq: int) -> Optional[Segment]:
+        bases = [segment.base for segment in self._segments]
+        pos = bisect.bisect_right(bases, seq) - 1
+        if pos >= 0 and seq < self._segments[pos].end:
+            return self._segments[pos]
+        return None
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Stream every record, oldest first"""
+        return self.iter_from(0)
+
+    def iter_from(self, seq: int) -> Iterator[Dict[str, Any]]:
+        """Stream records from sequence number `seq`, one segment at a time
+
+        Position is tracked by sequence number, so a compaction that swaps
+        segments between steps does not skip or repeat records.
+        """
+        while True:
+            with self._lock:
+                segment = self._segment_for(seq)
+                if segment is None:
+                    return
+                entries = self._read_index(segment, seq - segment.base, segment.count)
+                log = open(segment.path, "rb")
+            with log:
+                for record in self._read_blocks(log, entries):
+                    seq += 1
+                    yield record
+
+    # ---- compaction ----
+
+    def _compaction_groups(self) -> List[List[Segment]]:
+        """Runs of adjacent small sealed segments that fit in one segment"""
+        groups, current, total = [], [], 0
+        for segment in self._segments:
+            sealed_small = (segment is not self._active and segment.count < self.segment_records
+                            and not segment.is_live())
+            if sealed_small and total + segment.count <= self.segment_records:
+                current.append(segment)
+                total += segment.count
+                continue
+            if len(current) > 1:
+                groups.append(current)
+            current, total = ([segment], segment.count) if sealed_small else ([], 0)
+        if len(current) > 1:
+            groups.append(current)
+        return groups
+
+    def needs_compaction(self) -> bool:
+        with self._lock:
+            small = [s for s in self._segments
+                     if s is not self._active and s.count < self.segment_records]
+            return len(small) >= self.compact_threshold
+
+    def compact_in_background(self) -> None:
+        """Start compaction on a daemon thread if enough small segments exist"""
+        if not self.needs_compaction():
+            return
+        if self._compactor is not None and self._compactor.is_alive():
+            return
+        self._compactor = threading.Thread(target=self.compact, name="run-history-compactor",
+                                           daemon=True)
+        self._compactor.start()
+
+    def compact(self) -> int:
+        """Merge small sealed segments; returns the number of segments removed"""
+        with self._lock:
+            groups = self._compaction_groups()
+
+        removed = 0
+        for group in groups:
+            with file_lock(self.lock_path):
+                if not all(s.path.exists() and s.index_path.exists() for s in group):
+                    # Another store compacted these while we waited for the lock
+                    self._reload_segments()
+                    break
+                try:
+                    merged = self._merge(group)
+                except Exception as e:
+                    logger.error(f"Run history compaction failed: {e}")
+                    continue
+                with self._lock:
+                    start = self._segments.index(group[0])
+                    self._segments[start:start + len(group)] = [merged]
+                for segment in group:
+                    self._delete_segment(segment)
+            removed += len(group) - 1
+        return removed
+
+    def _reload_segments(self) -> None:
+        """Pick up segments rewritten by another store; callers hold the history lock"""
+        with self._lock:
+            segments = self._load_segments()
+            if self._active is not None:
+                segments = [self._active if s.path == self._active.path else s
+                            for s in segments]
+            self._segments = segments
+
+    def _merge(self, group: List[Segment]) -> Segment:
+        """Rewrite a group of segments as one new-generation segment"""
+        generation = max(s.generation for s in group) + 1
+        merged = Segment(group[0].base, generation, 0,
+                         segment_path(self.history_dir, group[0].base, generation))
+        log_tmp = merged.path.with_suffix(".log.tmp")
+        index_tmp = merged.path.with_suffix(".idx.tmp")
+
+        with open(log_tmp, "wb") as log_out, open(index_tmp, "wb") as index_out:
+            for segment in group:
+                entries = self._read_index(segment, 0, segment.count)
+                with open(segment.path, "rb") as log_in:
+                    for record in self._read_blocks(log_in, entries):
+                        payload = self.codec.encode(record)
+                        index_out.write(INDEX_ENTRY.pack(log_out.tell(), len(payload)))
+                        log_out.write(BLOCK_HEADER.pack(len(payload), zlib.crc32(payload)) + payload)
+                        merged.count += 1
+
+        # The index rename is the commit point; _load_segments discards
+        # a log without an index and older generations it covers. Both
+        # happen under the history lock, so no loader sees the gap between.
+        log_tmp.replace(merged.path)
+        index_tmp.replace(merged.index_path)
+        return merged
@@ -0,0 +1,216 @@
+# modules/save_format.py
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any, Dict, Final, Iterator, Optional, Tuple, Union
+from pathlib import Path
+from struct import Struct
+import hashlib
+import mmap
+import zlib
+
+from modules.lazy_import import lazy_import
+from modules.storage import storage
+
+orjson = lazy_import("orjson")
+lz4_frame = lazy_import("lz4.frame")
+
+MAGIC: Final[bytes] = b"SIMS"
+VERSION: Final[int] = 2
+
+# magic, version, section count, metadata length
+FILE_HEADER: Final[Struct] = Struct("<4sHHI")
+# v2+: timestamp, current hp, max hp, survival seconds, loadout names
+LOADOUT_SIZE: Final[int] = 228
+SUMMARY: Final[Struct] = Struct(f"<dffI{LOADOUT_SIZE}s")
+SUMMARY_SIZE: Final[int] = FILE_HEADER.size + SUMMARY.size
+LOADOUT_SEPARATOR: Final[bytes] = b"\x1f"
+# name, offset, stored length, raw length, crc32 of stored bytes, blake2b of raw bytes
+SECTION_ENTRY: Final[Struct] = Struct("<16sQIII16s")
+NAME_SIZE: Final[int] = 16
+
+
+class SaveFormatError(ValueError):
+    """A save file is truncated, corrupt or not in the sectioned format"""
+
+
+def section_digest(encoded: bytes) -> bytes:
+    return hashlib.blake2b(encoded, digest_size=16).digest()
+
+
+@dataclass(frozen=True)
+class SaveSummary:
+    """Fixed-size summary stored right after the file header"""
+    timestamp: float
+    current_hp: float
+    max_hp: float
+    survival_seconds: int
+    loadout: Tuple[str, ...] = ()
+
+    def pack(self) -> bytes:
+        loadout = b""
+        for name in self.loadout:
+            encoded = name.encode('utf-8').replace(LOADOUT_SEPARATOR, b"")
+            joined = loadout + LOADOUT_SEPARATOR + encoded if loadout else encoded
+            if len(joined) > LOADOUT_SIZE:
+                break  # keep whole names only
+            loadout = joined
+        return SUMMARY.pack(self.timestamp, self.current_hp, self.max_hp,
+                            self.survival_seconds, loadout)
+
+    @classmethod
+    def unpack(cls, data: bytes) -> "SaveSummary":
+        timestamp, current_hp, max_hp, survival, loadout = SUMMARY.unpack_from(data)
+        loadout = loadout.rstrip(b"\0")
+        names = tuple(n.decode('utf-8') for n in loadout.split(LOADOUT_SEPARATOR)) if loadout else ()
+        return cls(timestamp, current_hp, max_hp, survival, names)
+
+
+@dataclass(frozen=True)
+class SectionEntry:
+    name: str
+    offset: int
+    length: int
+    raw_length: int
+    crc: int
+    digest: bytes
+
+
+def encode_save(sections: Dict[str, bytes], meta: Optional[Dict[str, Any]] = None,
+                summary: Optional[SaveSummary] = None) -> bytes:
+    """Build a sectioned save from orjson-encoded sections
+
+    Layout: file header, fixed-size summary, metadata JSON, section table,
+    then each section compressed on its own so it can be decoded without
+    the others. Without a summary the summary block is zeroed.
+    """
+    meta_bytes = orjson.dumps(meta or {})
+    stored = {}
+    for name, raw in sections.items():
+        if len(name.encode('utf-8')) > NAME_SIZE:
+            raise ValueError(f"Section name too long: {name}")
+        stored[name] = lz4_frame.compress(raw)
+
+    offset = SUMMARY_SIZE + len(meta_bytes) + SECTION_ENTRY.size * len(sections)
+    table = []
+    for name, data in stored.items():
+        raw = sections[name]
+        table.append(SECTION_ENTRY.pack(name.encode('utf-8'), offset, len(data), len(raw),
+                                        zlib.crc32(data), section_digest(raw)))
+        offset += len(data)
+
+    header = FILE_HEADER.pack(MAGIC, VERSION, len(sections), len(meta_bytes))
+    summary_bytes = summary.pack() if summary is not None else bytes(SUMMARY.size)
+    return b"".join([header, summary_bytes, meta_bytes, *table, *stored.values()])
+
+
+def read_meta(path: Path) -> Dict[str, Any]:
+    """Metadata of a save without touching its sections"""
+    if (staged := storage.staged(path)) is not None:
+        return SaveFile(staged).meta
+    with open(path, "rb") as f:
+        version, _, meta_len = _unpack_header(f.read(FILE_HEADER.size))
+        f.seek(_meta_offset(version))
+        return orjson.loads(f.read(meta_len))
+
+
+def parse_summary(header: bytes) -> Optional[SaveSummary]:
+    """Summary from the first SUMMARY_SIZE bytes of a save; None before v2"""
+    version, _, _ = _unpack_header(header)
+    if version < 2:
+        return None
+    if len(header) < SUMMARY_SIZE:
+        raise SaveFormatError("Save file is truncated")
+    summary = SaveSummary.unpack(header[FILE_HEADER.size:SUMMARY_SIZE])
+    return summary if summary.timestamp else None
+
+
+def _unpack_header(header: bytes) -> Tuple[int, int, int]:
+    if len(header) < FILE_HEADER.size:
+        raise SaveFormatError("Save file is truncated")
+    magic, version, count, meta_len = FILE_HEADER.unpack_from(header)
+    if magic != MAGIC:
+        raise SaveFormatError("Not a sectioned save file")
+    if version > VERSION:
+        raise SaveFormatError(f"Unsupported save version {version}")
+    return version, count, meta_len
+
+
+def _meta_offset(version: int) -> int:
+    # Version 1 files have no summary block
+    return SUMMARY_SIZE if version >= 2 else FILE_HEADER.size
+
+
+class SaveFile(Mapping):
+    """Read-only view of a sectioned save
+
+    Only the header and section table are parsed up front. A section is
+    checked and decompressed the first time it is accessed, and the
+    result is kept. Files on disk are memory-mapped, so sections that are
+    never accessed are never read.
+    """
+
+    def __init__(self, buffer: Union[bytes, mmap.mmap]):
+        self._buffer = buffer
+        self.version, count, meta_len = _unpack_header(buffer[:FILE_HEADER.size])
+        meta_start = _meta_offset(self.version)
+        table_start = meta_start + meta_len
+        if len(buffer) < table_start + SECTION_ENTRY.size * count:
+            raise SaveFormatError("Save file is truncated")
+        self.summary = parse_summary(buffer[:SUMMARY_SIZE])
+        self.meta: Dict[str, Any] = orjson.loads(buffer[meta_start:table_start])
+
+        self.entries: Dict[str, SectionEntry] = {}
+        for i in range(count):
+            name, offset, length, raw_length, crc, digest = SECTION_ENTRY.unpack_from(
+                buffer, table_start + i * SECTION_ENTRY.size)
+            if offset + length > len(buffer):
+                raise SaveFormatError("Save file is truncated")
+            name = name.rstrip(b"\0").decode('utf-8')
+            self.entries[name] = SectionEntry(name, offset, length, raw_length, crc, digest)
+        self._decoded: Dict[str, Any] = {}
+
+    @classmethod
+    def open(cls, path: Path) -> "SaveFile":
+        """Map a save file, preferring contents still staged for commit"""
+        if (staged := storage.staged(path)) is not None:
+            return cls(staged)
+        with open(path, "rb") as f:
+            try:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise SaveFormatError("Save file is empty")
+        try:
+            return cls(buffer)
+        except Exception:
+            buffer.close()
+            raise
+
+    def raw(self, name: str) -> bytes:
+        """Uncompressed encoding of a section, verified against its checksum"""
+        entry = self.entries[name]
+        data = self._buffer[entry.offset:entry.offset + entry.length]
+        if zlib.crc32(data) != entry.crc:
+            raise SaveFormatError(f"Section {name} failed its checksum")
+        return lz4_frame.decompress(data)
+
+    def __getitem__(self, name: str) -> Any:
+        if name not in self._decoded:
+            self._decoded[name] = orjson.loads(self.raw(name))
+        return self._decoded[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def close(self) -> None:
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+    def __enter__(self) -> "SaveFile":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -1,12 +1,14 @@
-import os
 import json
-import logging
 from datetime import datetime
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
+from typing import Dict, Iterator, List
+from dataclasses import asdict, dataclass
 from pathlib import Path
+from colorama import Fore
 from modules.logger import logger
-from modules.constants import DATA_DIR, MAX_HIGHLIGHTS
+from modules.constants import DATA_DIR, CYAN, PURPLE, RESET, WHITE
+from modules.highlight_ring import open_ring
+from modules.run_index import RunIndex
+from modules.run_store import RunHistoryStore
 
 @dataclass
 class RunData:
@@ -33,17 +35,40 @@ class HighlightData:
 class SaveManager:
     """Handles game saving and loading"""
     SAVE_DIR: Path = DATA_DIR / "runs"
-    HIGHLIGHT_FILE: Path = DATA_DIR / "highlights.json"
+    HIGHLIGHT_FILE: Path = DATA_DIR / "highlights.ring"
+    LEGACY_HIGHLIGHT_FILE: Path = DATA_DIR / "highlights.json"
 
     def __init__(self):
         self.SAVE_DIR.mkdir(parents=True, exist_ok=True)
+        self.history = RunHistoryStore(self.SAVE_DIR / "history")
+        self.index = RunIndex(self.SAVE_DIR / "runs.sqlite3")
+        self._import_legacy_runs()
+        self._catch_up_index()
+
+    def _import_legacy_runs(self) -> None:
+        """Copy per-run JSON files from older versions into the history log"""
+        if len(self.history):
+            return
+        # Filenames embed the timestamp, so name order is chronological
+        for file in sorted(self.SAVE_DIR.glob("run_*.json")):
+            try:
+                with open(file, encoding='utf-8') as f:
+                    self.history.append(json.load(f))
+            except Exception as e:
+                logger.error(f"Failed to import legacy run {file.name}: {e}")
+
+    def _catch_up_index(self) -> None:
+        """Index runs that reached the history log but not the database"""
+        start = self.index.next_run_id
+        if start < len(self.history):
+            added = self.index.add_runs(enumerate(self.history.iter_from(start), start))
+            logger.info(f"Indexed {added} runs for analytics")
 
     def save_run(self, run: RunData) -> bool:
-        """Save run data to file"""
+        """Append run data to the history log and the analytics index"""
         try:
-            filename = f"run_{datetime.now():%Y-%m-%d_%H-%M-%S}.json"
-            with open(self.SAVE_DIR / filename, "w", encoding='utf-8') as f:
-                json.dump(run.__dict__, f, indent=2)
+            record = asdict(run)
+            self.index.add_run(self.history.append(record), record)
             return True
         except Exception as e:
             logger.error(f"Failed to save run: {e}")
@@ -52,21 +77,45 @@ class SaveManager:
     def load_runs(self, limit: int = 10) -> List[RunData]:
         """Load most recent runs"""
         try:
-            files = sorted(self.SAVE_DIR.glob("*.json"), reverse=True)
-            runs = []
-            for file in files[:limit]:
-                with open(file, encoding='utf-8') as f:
-                    runs.append(RunData(**json.load(f)))
-            return runs
+            return [RunData(**record) for record in self.history.latest(limit)]
         except Exception as e:
             logger.error(f"Failed to load runs: {e}")
             return []
 
+    def iter_runs(self) -> Iterator[RunData]:
+        """Stream every saved run, oldest first"""
+        for record in self.history:
+            yield RunData(**record)
+
+    def display_stats(self) -> None:
+        """Show run analytics from the index"""
+        print(f"\n{CYAN}📈 Run Statistics{RESET}")
+        print(f"{WHITE}{'='*44}{RESET}")
+        print(f"Runs recorded: {self.index.run_count()}")
+
+        if tiers := self.index.mean_survival_by_tier():
+            print(f"\n{WHITE}Mean survival by trait tier:{RESET}")
+            for tier, mean in tiers.items():
+                print(f"  Tier {tier}: {mean:.1f}s")
+
+        if picks := self.index.recommend_traits():
+            print(f"\n{WHITE}Recommended traits:{RESET}")
+            for pick in picks:
+                print(f"  {CYAN}{pick.name}{RESET} - avg {pick.mean_survival:.1f}s, "
+                      f"best {pick.best_survival}s ({pick.runs} runs)")
+
+        if correlations := self.index.mutation_correlations(min_runs=3)[:3]:
+            print(f"\n{WHITE}Mutations linked to long runs:{RESET}")
+            for item in correlations:
+                print(f"  {PURPLE}{item.name}{RESET} - r={item.correlation:+.2f} "
+                      f"({item.runs} runs)")
+        print(f"{WHITE}{'='*44}{RESET}")
+
 def save_highlight_log(hp: float, mutation_rate: float, rp: int,
                       time_alive: int, entropy_drain: float,
                       mutations: List[Dict], traits: List[Dict],
                       resistance: Dict[str, float]) -> None:
-    """Save highlight data to JSON file"""
+    """Append highlight data to the highlight ring buffer"""
     try:
         highlight = HighlightData(
             timestamp=datetime.now().isoformat(),
@@ -80,18 +129,10 @@ def save_highlight_log(hp: float, mutation_rate: float, rp: int,
             resistance=resistance
         )
 
-        highlights = []
-        if os.path.exists(SaveManager.HIGHLIGHT_FILE):
-            with open(SaveManager.HIGHLIGHT_FILE, "r") as f:
-                highlights = json.load(f)
-
-        highlights.append(highlight.__dict__)
-        highlights = highlights[-MAX_HIGHLIGHTS:]
-
-        with open(SaveManager.HIGHLIGHT_FILE, "w") as f:
-            json.dump(highlights, f, indent=2)
+        ring = open_ring(SaveManager.HIGHLIGHT_FILE, legacy_json=SaveManager.LEGACY_HIGHLIGHT_FILE)
+        ring.append(asdict(highlight))
 
-        logger.info("💾 Highlight saved successfully", Fore.GREEN)
+        logger.info("💾 Highlight saved successfully", color=Fore.GREEN)
 
     except Exception as e:
         logger.error(f"Failed to save highlight: {e}")
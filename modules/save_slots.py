@@ -0,0 +1,104 @@
+# modules/save_slots.py
+
+from dataclasses import dataclass
+from typing import Any, Dict, Final, List, Optional
+from pathlib import Path
+from datetime import datetime
+import os
+import re
+
+from modules.lazy_import import lazy_import
+from modules.logger import logger
+from modules.storage import storage
+from modules.save_format import (SUMMARY_SIZE, SaveFile, SaveFormatError, SaveSummary,
+                                 encode_save, parse_summary)
+
+orjson = lazy_import("orjson")
+
+SLOT_SUFFIX: Final[str] = ".sims"
+SLOT_NAME: Final[re.Pattern] = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+
+
+@dataclass(frozen=True)
+class SlotInfo:
+    slot: str
+    path: Path
+    summary: Optional[SaveSummary]
+    mtime_ns: int
+    size: int
+
+
+class SaveCatalog:
+    """Summaries of every save slot, read from the fixed-size headers
+
+    Only the first SUMMARY_SIZE bytes of a slot are read, and only when
+    its mtime or size changed since the last refresh.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self.header_reads = 0
+        self._cache: Dict[str, SlotInfo] = {}
+
+    def _read_info(self, slot: str, path: Path, stat: os.stat_result) -> SlotInfo:
+        self.header_reads += 1
+        summary = None
+        try:
+            with open(path, "rb") as f:
+                summary = parse_summary(f.read(SUMMARY_SIZE))
+        except (OSError, SaveFormatError) as e:
+            logger.warning(f"Unreadable save slot {slot}: {e}")
+        return SlotInfo(slot, path, summary, stat.st_mtime_ns, stat.st_size)
+
+    def refresh(self) -> List[SlotInfo]:
+        """Current slots, newest save first"""
+        found: Dict[str, SlotInfo] = {}
+        if self.directory.exists():
+            with os.scandir(self.directory) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(SLOT_SUFFIX) or not entry.is_file():
+                        continue
+                    slot = entry.name[:-len(SLOT_SUFFIX)]
+                    stat = entry.stat()
+                    cached = self._cache.get(slot)
+                    if cached is not None and (cached.mtime_ns, cached.size) == \
+                            (stat.st_mtime_ns, stat.st_size):
+                        found[slot] = cached
+                    else:
+                        found[slot] = self._read_info(slot, Path(entry.path), stat)
+        self._cache = found
+        return sorted(found.values(),
+                      key=lambda info: info.summary.timestamp if info.summary else 0.0,
+                      reverse=True)
+
+
+class SaveSlots:
+    """Named full saves, one sectioned save file per slot"""
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self.catalog = SaveCatalog(self.directory)
+
+    def path(self, slot: str) -> Path:
+        if not SLOT_NAME.match(slot):
+            raise ValueError(f"Invalid save slot name: {slot!r}")
+        return self.directory / f"{slot}{SLOT_SUFFIX}"
+
+    def save(self, slot: str, sections: Dict[str, Any], summary: SaveSummary) -> bool:
+        """Write a slot; durable since slot saves are made on request"""
+        encoded = {name: orjson.dumps(value) for name, value in sections.items()}
+        meta = {"slot": slot, "timestamp": datetime.now().isoformat()}
+        return storage.put(self.path(slot), encode_save(encoded, meta, summary), durable=True)
+
+    def open(self, slot: str) -> SaveFile:
+        return SaveFile.open(self.path(slot))
+
+    def delete(self, slot: str) -> bool:
+        try:
+            self.path(slot).unlink()
+            return True
+        except FileNotFoundError:
+            return False
+
+    def list(self) -> List[SlotInfo]:
+        return self.catalog.refresh()
@@ -1,13 +1,13 @@
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Final
 from pathlib import Path
-import json
 import random
 from collections import Counter
 
 from modules.logger import logger
 from modules.mutation_generator import generate_mutation_effect
 from modules.constants import DATA_DIR
+from modules.vault_journal import journal_for
 
 @dataclass
 class MergeResult:
@@ -29,27 +29,17 @@ class TraitMerger:
 
     @classmethod
     def load_vault(cls) -> List[Dict]:
-        """Load trait vault from file"""
+        """Current trait vault (snapshot plus journal)"""
         try:
-            if not cls.VAULT_PATH.exists():
-                return []
-            with open(cls.VAULT_PATH, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return list(journal_for(cls.VAULT_PATH).traits)
         except Exception as e:
             logger.error(f"Failed to load vault: {e}")
             return []
 
     @classmethod
     def save_vault(cls, vault: List[Dict]) -> bool:
-        """Save trait vault to file"""
-        try:
-            cls.VAULT_PATH.parent.mkdir(parents=True, exist_ok=True)
-            with open(cls.VAULT_PATH, 'w', encoding='utf-8') as f:
-                json.dump(vault, f, indent=2)
-            return True
-        except Exception as e:
-            logger.error(f"Failed to save vault: {e}")
-            return False
+        """Replace the trait vault with a full snapshot"""
+        return journal_for(cls.VAULT_PATH).rewrite(vault)
 
     @staticmethod
     def trait_signature(trait: Dict) -> Counter:
@@ -59,7 +49,8 @@ class TraitMerger:
     @classmethod
     def merge_traits(cls, index1: int, index2: int) -> MergeResult:
         """Merge two traits by index"""
-        vault = cls.load_vault()
+        journal = journal_for(cls.VAULT_PATH)
+        vault = journal.traits
 
         if not cls._validate_indices(vault, index1, index2):
             return MergeResult(False, "❌ Invalid trait indices", None)
@@ -73,12 +64,10 @@ class TraitMerger:
         if not new_trait:
             return MergeResult(False, "❌ Merge failed", None)
 
-        # Update vault
-        for idx in sorted([index1, index2], reverse=True):
-            vault.pop(idx)
-        vault.append(new_trait)
-
-        if not cls.save_vault(vault):
+        try:
+            journal.merge([index1, index2], new_trait)
+        except Exception as e:
+            logger.error(f"Failed to record merge: {e}")
             return MergeResult(False, "❌ Failed to save", None)
 
         return MergeResult(
@@ -0,0 +1,183 @@
+# modules/storage.py
+
+from typing import Any, Dict, Optional, Union
+from pathlib import Path
+import atexit
+import json
+import os
+import threading
+import time
+
+from modules.logger import logger
+from modules.constants import STORAGE_COMMIT_INTERVAL
+from modules.metrics import SAVE_SECONDS
+from modules.read_cache import read_cache
+
+
+class StorageService:
+    """Single write path for whole-document saves
+
+    Writes are staged in memory and committed as a group: every staged
+    document goes to a fsynced temp file, each temp file is renamed over
+    its target, and then each affected directory is fsynced once so the
+    renames survive a crash. Staging the same path twice
+    before a commit keeps only the latest contents. Reads return staged
+    contents first, so callers always see their own writes; a document
+    being committed stays visible until its rename has finished.
+    """
+
+    def __init__(self, commit_interval: float = STORAGE_COMMIT_INTERVAL):
+        self.commit_interval = commit_interval
+        self._pending: Dict[Path, bytes] = {}
+        self._inflight: Dict[Path, bytes] = {}
+        self._lock = threading.Lock()
+        self._commit_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.commits = 0
+
+    # ---- staging ----
+
+    def put(self, path: Path, data: Union[bytes, str], durable: bool = False) -> bool:
+        """Stage a document; with `durable` the batch is committed before returning"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        with self._lock:
+            self._pending[path] = data
+        if durable:
+            return self.commit()
+        self._ensure_thread()
+        return True
+
+    def put_json(self, path: Path, obj: Any, indent: Optional[int] = 2,
+                 durable: bool = False) -> bool:
+        return self.put(path, json.dumps(obj, indent=indent), durable=durable)
+
+    def staged(self, path: Path) -> Optional[bytes]:
+        """Contents staged for a document but not yet committed"""
+        path = Path(path)
+        with self._lock:
+            data = self._pending.get(path)
+            return data if data is not None else self._inflight.get(path)
+
+    def read(self, path: Path) -> Optional[bytes]:
+        """Latest contents of a document, staged or on disk"""
+        path = Path(path)
+        if (data := self.staged(path)) is not None:
+            return data
+        try:
+            return path.read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def read_json(self, path: Path) -> Optional[Any]:
+        """Parse a JSON document; None if it does not exist"""
+        data = self.read(path)
+        return None if data is None else json.loads(data)
+
+    def exists(self, path: Path) -> bool:
+        path = Path(path)
+        with self._lock:
+            if path in self._pending or path in self._inflight:
+                return True
+        return path.exists()
+
+    # ---- committing ----
+
+    def commit(self) -> bool:
+        """Write every staged document, syncing each directory once per batch"""
+        with self._commit_lock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+                self._inflight = dict(batch)
+            if not batch:
+                return True
+
+            started = time.perf_counter()
+            written = []
+            ok = True
+            for path, data in batch.items():
+                tmp = path.with_name(path.name + ".tmp")
+                if not path.parent.exists():
+                    # The directory was removed after the write was staged
+                    logger.debug(f"Dropping write for {path}: directory no longer exists")
+                    self._retire(path)
+                    continue
+                try:
+                    with open(tmp, "wb") as f:
+                        f.write(data)
+                        f.flush()
+                        os.fsync(f.fileno())
+                    written.append((path, tmp))
+                except Exception as e:
+                    logger.error(f"Failed to stage write for {path}: {e}")
+                    self._retire(path)
+                    ok = False
+
+            renamed_dirs = set()
+            for path, tmp in written:
+                try:
+                    tmp.replace(path)
+                    read_cache.invalidate(path)
+                    renamed_dirs.add(path.parent)
+                except Exception as e:
+                    logger.error(f"Failed to commit {path}: {e}")
+                    tmp.unlink(missing_ok=True)
+                    ok = False
+                self._retire(path)
+            for directory in renamed_dirs:
+                ok = self._sync_directory(directory) and ok
+            self.commits += 1
+            SAVE_SECONDS.observe(time.perf_counter() - started, kind="commit")
+            return ok
+
+    @staticmethod
+    def _sync_directory(directory: Path) -> bool:
+        """Make renames in a directory durable"""
+        if os.name == "nt":
+            # Windows cannot open a directory for fsync; NTFS journals renames
+            return True
+        try:
+            fd = os.open(directory, os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            return True
+        except OSError as e:
+            logger.error(f"Failed to sync directory {directory}: {e}")
+            return False
+
+    def _retire(self, path: Path) -> None:
+        """Stop serving an in-flight document once disk has caught up"""
+        with self._lock:
+            self._inflight.pop(path, None)
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="storage-commit", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while not self._closed.is_set():
+            self._wakeup.wait(self.commit_interval)
+            self._wakeup.clear()
+            if self._pending:
+                self.commit()
+
+    def close(self) -> bool:
+        """Commit anything still staged and stop the commit thread"""
+        self._closed.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._closed.clear()
+        return self.commit()
+
+
+storage = StorageService()
+atexit.register(storage.close)
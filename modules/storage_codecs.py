@@ -0,0 +1,284 @@
+# modules/storage_codecs.py
+
+from __future__ import annotations
+
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, Final, Iterable, List, Optional
+from enum import Enum, IntEnum
+from pathlib import Path
+import statistics
+import time
+import json
+
+from modules.lazy_import import lazy_import
+
+orjson = lazy_import("orjson")
+msgpack = lazy_import("msgpack")
+zstandard = lazy_import("zstandard")
+lz4_frame = lazy_import("lz4.frame")
+
+from modules.logger import logger
+from modules.constants import DATA_DIR
+
+# Every encoded payload starts with FRAME_MAGIC followed by one CodecType byte.
+# Legacy files are plain JSON and are recognised by their first byte instead.
+FRAME_MAGIC: Final[bytes] = b"\xc5"
+DEFAULT_DICT_SIZE: Final[int] = 16 * 1024
+MIN_TRAINING_SAMPLES: Final[int] = 8
+MIN_DICT_SIZE: Final[int] = 1024
+SAMPLE_BYTES_PER_DICT_BYTE: Final[int] = 4
+
+
+class CodecType(IntEnum):
+    """Codec identifiers, stored in the frame header"""
+    JSON = 0
+    MSGPACK = 1
+    ZSTD = 2
+    ZSTD_DICT = 3
+    LZ4 = 4
+
+
+class FileClass(str, Enum):
+    """Groups of game files that share a codec profile"""
+    TRAITS = "traits"
+    RUNS = "runs"
+    HIGHLIGHTS = "highlights"
+
+
+@dataclass
+class CodecBenchmark:
+    """Measured cost of one codec over a sample set"""
+    codec: CodecType
+    records: int
+    raw_bytes: int
+    encoded_bytes: int
+    encode_us: float
+    decode_us: float
+
+    @property
+    def ratio(self) -> float:
+        return self.raw_bytes / self.encoded_bytes if self.encoded_bytes else 0.0
+
+
+class StorageCodec:
+    """Encodes records to framed bytes and back"""
+
+    def __init__(self, codec: CodecType = CodecType.ZSTD, level: int = 3,
+                 dictionary: Optional[zstandard.ZstdCompressionDict] = None,
+                 known_dictionaries: Iterable[zstandard.ZstdCompressionDict] = ()):
+        if codec == CodecType.ZSTD_DICT and dictionary is None:
+            raise ValueError("ZSTD_DICT codec requires a trained dictionary")
+        self.codec = codec
+        self.level = level
+        self.dictionary = dictionary
+        self._header = FRAME_MAGIC + bytes([codec])
+        self._cctx = zstandard.ZstdCompressor(level=level, dict_data=dictionary) \
+            if codec in (CodecType.ZSTD, CodecType.ZSTD_DICT) else None
+        self._dctx = zstandard.ZstdDecompressor()
+        # Older payloads may reference a previously trained dictionary
+        self._dict_dctx: Dict[int, zstandard.ZstdDecompressor] = {
+            d.dict_id(): zstandard.ZstdDecompressor(dict_data=d)
+            for d in [*known_dictionaries, *([dictionary] if dictionary is not None else [])]
+        }
+
+    def encode(self, record: Any) -> bytes:
+        """Serialize and compress a record"""
+        match self.codec:
+            case CodecType.JSON:
+                body = orjson.dumps(record)
+            case CodecType.MSGPACK:
+                body = msgpack.packb(record)
+            case CodecType.LZ4:
+                body = lz4_frame.compress(msgpack.packb(record))
+            case _:
+                body = self._cctx.compress(msgpack.packb(record))
+        return self._header + body
+
+    def decode(self, payload: bytes) -> Any:
+        """Decode any framed payload, or a legacy plain JSON document"""
+        payload = bytes(payload)
+        if not payload.startswith(FRAME_MAGIC):
+            return orjson.loads(payload)
+
+        codec, body = CodecType(payload[1]), payload[2:]
+        match codec:
+            case CodecType.JSON:
+                return orjson.loads(body)
+            case CodecType.MSGPACK:
+                return msgpack.unpackb(body)
+            case CodecType.LZ4:
+                return msgpack.unpackb(lz4_frame.decompress(body))
+            case CodecType.ZSTD:
+                return msgpack.unpackb(self._dctx.decompress(body))
+            case CodecType.ZSTD_DICT:
+                dict_id = zstandard.get_frame_parameters(body).dict_id
+                if dict_id not in self._dict_dctx:
+                    raise ValueError(f"Unknown zstd dictionary {dict_id}")
+                return msgpack.unpackb(self._dict_dctx[dict_id].decompress(body))
+
+
+def train_dictionary(samples: Iterable[Any],
+                     dict_size: int = DEFAULT_DICT_SIZE) -> Optional[zstandard.ZstdCompressionDict]:
+    """Train a zstd dictionary on msgpack-encoded sample records
+
+    The dictionary is shrunk to what the samples can support; returns None
+    until there is enough real material to train on.
+    """
+    packed = [msgpack.packb(sample) for sample in samples]
+    if len(packed) < MIN_TRAINING_SAMPLES:
+        return None
+    dict_size = min(dict_size, sum(map(len, packed)) // SAMPLE_BYTES_PER_DICT_BYTE)
+    if dict_size < MIN_DICT_SIZE:
+        return None
+    try:
+        return zstandard.train_dictionary(dict_size, packed)
+    except zstandard.ZstdError as e:
+        logger.warning(f"Dictionary training failed: {e}")
+        return None
+
+
+def benchmark_codec(codec: StorageCodec, samples: List[Any], rounds: int = 3) -> CodecBenchmark:
+    """Measure encoded size and per-record encode/decode time"""
+    raw_bytes = sum(len(orjson.dumps(sample)) for sample in samples)
+    encode_times, decode_times = [], []
+    encoded: List[bytes] = []
+
+    for _ in range(rounds):
+        start = time.perf_counter_ns()
+        encoded = [codec.encode(sample) for sample in samples]
+        encode_times.append(time.perf_counter_ns() - start)
+
+        start = time.perf_counter_ns()
+        for payload in encoded:
+            codec.decode(payload)
+        decode_times.append(time.perf_counter_ns() - start)
+
+    count = max(1, len(samples))
+    return CodecBenchmark(
+        codec=codec.codec,
+        records=len(samples),
+        raw_bytes=raw_bytes,
+        encoded_bytes=sum(map(len, encoded)),
+        encode_us=statistics.median(encode_times) / count / 1000,
+        decode_us=statistics.median(decode_times) / count / 1000
+    )
+
+
+def select_codec(results: List[CodecBenchmark], decode_weight: float = 0.5) -> CodecType:
+    """Pick the codec with the best size/decode-time trade-off
+
+    Size and decode time are both taken relative to the best codec for that
+    measure; decode_weight controls how much slower decoding may cost.
+    """
+    smallest = max(1, min(r.encoded_bytes for r in results))
+    fastest = max(1e-9, min(r.decode_us for r in results))
+
+    def score(r: CodecBenchmark) -> float:
+        return (r.encoded_bytes / smallest) * (r.decode_us / fastest) ** decode_weight
+
+    return min(results, key=score).codec
+
+
+def format_report(results: Dict[str, List[CodecBenchmark]],
+                  selected: Optional[Dict[str, CodecType]] = None) -> str:
+    """Render benchmark results as a plain-text table"""
+    lines = [f"{'class':<14}{'codec':<11}{'bytes':>10}{'ratio':>8}{'enc us':>10}{'dec us':>10}",
+             "-" * 63]
+    for file_class, rows in results.items():
+        for row in rows:
+            marker = " *" if selected and selected.get(file_class) == row.codec else ""
+            lines.append(f"{file_class:<14}{row.codec.name.lower():<11}{row.encoded_bytes:>10}"
+                         f"{row.ratio:>8.2f}{row.encode_us:>10.2f}{row.decode_us:>10.2f}{marker}")
+    return "\n".join(lines)
+
+
+class CodecRegistry:
+    """Per file class codec profiles with trained dictionaries"""
+    CODEC_DIR: Path = DATA_DIR / "codecs"
+    DEFAULT_CODEC: Final[CodecType] = CodecType.ZSTD
+
+    def __init__(self, codec_dir: Optional[Path] = None):
+        self.codec_dir = Path(codec_dir or self.CODEC_DIR)
+        self.profile_path = self.codec_dir / "profiles.json"
+        self.profiles: Dict[str, Dict] = self._load_profiles()
+        self._codecs: Dict[str, StorageCodec] = {}
+
+    def _load_profiles(self) -> Dict[str, Dict]:
+        """Load selected codecs per file class"""
+        try:
+            if self.profile_path.exists():
+                with open(self.profile_path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+        except Exception as e:
+            logger.error(f"Failed to load codec profiles: {e}")
+        return {}
+
+    def _save_profiles(self) -> None:
+        try:
+            self.codec_dir.mkdir(parents=True, exist_ok=True)
+            with open(self.profile_path, 'w', encoding='utf-8') as f:
+                json.dump(self.profiles, f, indent=2)
+        except Exception as e:
+            logger.error(f"Failed to save codec profiles: {e}")
+
+    def _dict_path(self, file_class: str, dict_id: int) -> Path:
+        return self.codec_dir / f"{file_class}.{dict_id}.zdict"
+
+    def _load_dictionaries(self, file_class: str) -> Dict[int, zstandard.ZstdCompressionDict]:
+        """Load every dictionary ever trained for a file class"""
+        dictionaries = {}
+        for path in self.codec_dir.glob(f"{file_class}.*.zdict"):
+            dictionary = zstandard.ZstdCompressionDict(path.read_bytes())
+            dictionaries[dictionary.dict_id()] = dictionary
+        return dictionaries
+
+    def codec_for(self, file_class: FileClass | str) -> StorageCodec:
+        """Return the configured codec for a file class"""
+        key = FileClass(file_class).value
+        if key not in self._codecs:
+            profile = self.profiles.get(key, {})
+            codec = CodecType[profile.get("codec", self.DEFAULT_CODEC.name)]
+            dictionaries = self._load_dictionaries(key)
+            dictionary = dictionaries.get(profile.get("dict_id"))
+            if codec == CodecType.ZSTD_DICT and dictionary is None:
+                logger.warning(f"Missing dictionary for {key}, falling back to zstd")
+                codec = CodecType.ZSTD
+            self._codecs[key] = StorageCodec(
+                codec,
+                dictionary=dictionary if codec == CodecType.ZSTD_DICT else None,
+                known_dictionaries=dictionaries.values()
+            )
+        return self._codecs[key]
+
+    def benchmark(self, samples: List[Any],
+                  dictionary: Optional[zstandard.ZstdCompressionDict] = None) -> List[CodecBenchmark]:
+        """Benchmark every codec on the given samples"""
+        codecs = [StorageCodec(codec) for codec in CodecType if codec != CodecType.ZSTD_DICT]
+        if dictionary is not None:
+            codecs.append(StorageCodec(CodecType.ZSTD_DICT, dictionary=dictionary))
+        return [benchmark_codec(codec, samples) for codec in codecs]
+
+    def calibrate(self, file_class: FileClass | str, samples: List[Any],
+                  dict_size: int = DEFAULT_DICT_SIZE) -> List[CodecBenchmark]:
+        """Train a dictionary, benchmark all codecs and persist the best choice"""
+        key = FileClass(file_class).value
+        dictionary = train_dictionary(samples, dict_size)
+        results = self.benchmark(samples, dictionary)
+        selected = select_codec(results)
+
+        self.codec_dir.mkdir(parents=True, exist_ok=True)
+        if dictionary is not None:
+            self._dict_path(key, dictionary.dict_id()).write_bytes(dictionary.as_bytes())
+        self.profiles[key] = {
+            "codec": selected.name,
+            "dict_id": dictionary.dict_id() if dictionary is not None else None,
+            "results": [{**asdict(r), "codec": r.codec.name} for r in results]
+        }
+        self._save_profiles()
+        self._codecs.pop(key, None)
+        logger.info(f"Codec for {key}: {selected.name.lower()}")
+        return results
+
+
+# Shared registry used by the storage backends
+codec_registry = CodecRegistry()
@@ -4,22 +4,29 @@ import random
 import json
 import os
 import logging
-from typing import Dict, List, Any, Optional, Final, Set
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Final, Set
 from dataclasses import dataclass, field
 from modules.logger import logger
 import re
 from pathlib import Path
 from modules.constants import DATA_DIR
 from enum import IntEnum, Enum
-import numpy as np
-from numpy.typing import NDArray
 from collections import defaultdict
 from functools import lru_cache
-import orjson
 import mmap
-import msgpack
-import zstandard
-import lz4.frame
+from modules.lazy_import import lazy_import
+from modules.storage_codecs import FileClass, codec_registry
+from modules.vault_journal import journal_for
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+# Loaded on first use so the launcher menu does not wait on them
+np = lazy_import("numpy")
+orjson = lazy_import("orjson")
+msgpack = lazy_import("msgpack")
+zstandard = lazy_import("zstandard")
+lz4_frame = lazy_import("lz4.frame")
 
 TRAIT_POOL_PATH = "data/traits.json"
 VAULT_PATH = "data/vault.json"
@@ -94,6 +101,7 @@ class CompressionType(Enum):
     NONE = "none"
     ZSTD = "zstd"
     LZ4 = "lz4"
+    ADAPTIVE = "adaptive"  # Codec chosen per file class by the codec registry
 
 
 class TraitManager:
@@ -333,7 +341,10 @@ class TraitManager:
                     dctx = zstandard.ZstdDecompressor()
                     packed = dctx.decompress(compressed)
                 case CompressionType.LZ4:
-                    packed = lz4.frame.decompress(compressed)
+                    packed = lz4_frame.decompress(compressed)
+                case CompressionType.ADAPTIVE:
+                    self._process_trait_data(codec_registry.codec_for(FileClass.TRAITS).decode(compressed))
+                    return
                 case _:
                     packed = compressed
 
@@ -414,16 +425,16 @@ class TraitManager:
     def _save_binary(self, data: dict) -> None:
         """Save traits in compressed binary format"""
         try:
-            packed = msgpack.packb(data)
-
             match self.compression:
                 case CompressionType.ZSTD:
                     cctx = zstandard.ZstdCompressor(level=3)
-                    compressed = cctx.compress(packed)
+                    compressed = cctx.compress(msgpack.packb(data))
                 case CompressionType.LZ4:
-                    compressed = lz4.frame.compress(packed)
+                    compressed = lz4_frame.compress(msgpack.packb(data))
+                case CompressionType.ADAPTIVE:
+                    compressed = codec_registry.codec_for(FileClass.TRAITS).encode(data)
                 case _:
-                    compressed = packed
+                    compressed = msgpack.packb(data)
 
             with open(self.TRAIT_BINARY, 'wb') as f:
                 f.write(compressed)
@@ -518,21 +529,12 @@ def load_all_traits():
 
 
 def load_vault():
-    if not os.path.exists(VAULT_PATH):
-        return []
-    with open(VAULT_PATH, "r") as f:
-        content = f.read().strip()
-        if not content:
-            return []
-        return json.loads(content)
+    return list(journal_for(Path(VAULT_PATH)).traits)
 
 
 def load_traits():
     """Load traits from the vault file and validate their format."""
-    if not os.path.exists(TRAIT_FILE):
-        return []
-    with open(TRAIT_FILE, "r") as f:
-        traits = json.load(f)
+    traits = list(journal_for(Path(TRAIT_FILE)).traits)
 
     # Validate and standardize effects
     for trait in traits:
@@ -544,9 +546,7 @@ def load_traits():
 
 def save_traits(traits):
     """Save traits to the vault file."""
-    os.makedirs(os.path.dirname(TRAIT_FILE), exist_ok=True)
-    with open(TRAIT_FILE, "w") as f:
-        json.dump(traits, f, indent=4)
+    journal_for(Path(TRAIT_FILE)).rewrite(traits)
 
 
 def format_trait(trait):
@@ -642,22 +642,22 @@ def process_trait_effects(trait):
         'immunities': []
     }
 
-    print(f"\nDEBUG: Processing trait: {trait['name']}")
+    logger.debug("Processing trait: %s", trait['name'])
 
     for effect in trait.get('effects', []):
         effect_text = effect.get('text', '')
-        print(f"DEBUG: Processing effect: {effect_text}")
+        logger.debug("Processing effect: %s", effect_text)
 
         # Process HP modifications
         if "% HP" in effect_text:
             if "+%" in effect_text:
                 value = int(effect_text.split("+")[1].split("%")[0])
                 mods['hp_percent'] += value
-                print(f"DEBUG: Added {value}% HP")
+                logger.debug("Added %s%% HP", value)
             elif "-%" in effect_text:
                 value = int(effect_text.split("-")[1].split("%")[0])
                 mods['hp_percent'] -= value
-                print(f"DEBUG: Reduced {value}% HP")
+                logger.debug("Reduced %s%% HP", value)
 
         # Process Mutation Rate - Fixed the value handling
         if "Mutation Rate" in effect_text:
@@ -667,21 +667,21 @@ def process_trait_effects(trait):
             elif "-%" in effect_text:
                 mutation_value = -int(effect_text.split("-")[1].split("%")[0])
             mods['mutation_rate'] += mutation_value
-            print(f"DEBUG: Mutation rate modified by {mutation_value}%")
+            logger.debug("Mutation rate modified by %s%%", mutation_value)
 
         # Process Immunities
         if "Immune to" in effect_text:
             immune_type = effect_text.split("Immune to ")[1].split(" ")[0]
             if immune_type not in mods['immunities']:
                 mods['immunities'].append(immune_type)
-            print(f"DEBUG: Added immunity to {immune_type}")
+            logger.debug("Added immunity to %s", immune_type)
 
         # Process Resistances
         if "reduced" in effect_text and "damage" in effect_text:
             resist_value = int(effect_text.split("%")[0])
             damage_type = effect_text.split("reduced ")[1].split(" ")[0]
             mods['resistances'][damage_type] = mods['resistances'].get(damage_type, 0) + resist_value
-            print(f"DEBUG: Added {resist_value}% resistance to {damage_type}")
+            logger.debug("Added %s%% resistance to %s", resist_value, damage_type)
 
         # Process Resilience
         if "Resilience" in effect_text:
@@ -691,7 +691,7 @@ def process_trait_effects(trait):
             elif "-%" in effect_text:
                 resil_value = -int(effect_text.split("-")[1].split("%")[0])
             mods['resistances']['resilience'] = mods['resistances'].get('resilience', 0) + resil_value
-            print(f"DEBUG: Resilience modified by {resil_value}%")
+            logger.debug("Resilience modified by %s%%", resil_value)
 
     return mods
 
@@ -701,10 +701,10 @@ def calculate_hp(traits):
     base_hp = 100
     hp_modifier = 0
 
-    print("\nDEBUG: Calculating HP from traits")
+    logger.debug("Calculating HP from traits")
 
     for trait in traits:
-        print(f"DEBUG: Processing HP mods for {trait['name']}")
+        logger.debug("Processing HP mods for %s", trait['name'])
         for effect in trait.get('effects', []):
             effect_text = effect.get('text', '')
 
@@ -712,14 +712,14 @@ def calculate_hp(traits):
                 if "+%" in effect_text:
                     value = int(effect_text.split("+")[1].split("%")[0])
                     hp_modifier += value
-                    print(f"DEBUG: Added +{value}% HP")
+                    logger.debug("Added +%s%% HP", value)
                 elif "-%" in effect_text:
                     value = int(effect_text.split("-")[1].split("%")[0])
                     hp_modifier -= value
-                    print(f"DEBUG: Subtracted {value}% HP")
+                    logger.debug("Subtracted %s%% HP", value)
 
     final_hp = base_hp * (1 + (hp_modifier / 100))
-    print(f"DEBUG: Final HP calculation: {base_hp} * (1 + {hp_modifier}/100) = {final_hp}")
+    logger.debug("Final HP calculation: %s * (1 + %s/100) = %s", base_hp, hp_modifier, final_hp)
 
     return final_hp
 
@@ -771,7 +771,7 @@ def apply_hp_modifier(stats: dict, hp_multiplier: float) -> None:
     if hp_multiplier != 0:
         stats['max_hp'] = stats['base_hp'] * (1 + (hp_multiplier / 100))
         stats['current_hp'] = stats['max_hp']
-        print(f"DEBUG: Final HP: {stats['max_hp']} ({hp_multiplier}% increase)")
+        logger.debug("Final HP: %s (%s%% increase)", stats['max_hp'], hp_multiplier)
 
 
 def apply_trait_effects(traits: list) -> dict:
@@ -782,7 +782,7 @@ def apply_trait_effects(traits: list) -> dict:
     logger.debug("Processing trait effects...")
 
     for trait in traits:
-        logger.debug(f"Processing trait: {trait['name']}")
+        logger.debug("Processing trait: %s", trait['name'])
 
         for effect in trait.get('effects', []):
             effect_text = effect.get('text', '')
@@ -790,21 +790,21 @@ def apply_trait_effects(traits: list) -> dict:
             if "% HP" in effect_text:
                 mod = parse_hp_modifier(effect_text)
                 hp_multiplier += mod
-                logger.debug(f"HP modifier: {mod}% (total: {hp_multiplier}%)")
+                logger.debug("HP modifier: %s%% (total: %s%%)", mod, hp_multiplier)
 
             elif "Mutation Rate" in effect_text:
                 mod = parse_mutation_rate(effect_text)
                 stats['mutation_rate'] += mod
-                logger.debug(f"Mutation rate: {mod}%")
+                logger.debug("Mutation rate: %s%%", mod)
 
             elif "Immune to" in effect_text:
                 immune_type = parse_immunity(effect_text)
                 if immune_type not in stats['immunities']:
                     stats['immunities'].append(immune_type)
-                    logger.debug(f"Added immunity: {immune_type}")
+                    logger.debug("Added immunity: %s", immune_type)
 
     apply_hp_modifier(stats, hp_multiplier)
-    logger.debug(f"Final stats: {stats}")
+    logger.debug("Final stats: %s", stats)
     return stats
 
 
@@ -850,7 +850,7 @@ def process_trait_effects(stats: Dict, trait: Dict) -> Dict:
             if match := re.search(r'([+-]\d+)%\s*hp', effect_text):
                 mod = float(match.group(1))
                 hp_multiplier *= (1 + mod / 100)
-                logger.debug(f"HP modifier from {trait['name']}: {mod}%")
+                logger.debug("HP modifier from %s: %s%%", trait['name'], mod)
 
         # Entropy reduction
         if 'entropy' in effect_text and 'reduction' in effect_text:
@@ -858,7 +858,7 @@ def process_trait_effects(stats: Dict, trait: Dict) -> Dict:
                 value = float(match.group(1))
                 current = stats.get('entropy_reduction', 0)
                 stats['entropy_reduction'] = min(100, current + value)
-                logger.debug(f"Added {value}% entropy reduction from {trait['name']}")
+                logger.debug("Added %s%% entropy reduction from %s", value, trait['name'])
 
         # Fire resistance (chance to resist)
         if 'chance to resist fire' in effect_text:
@@ -894,7 +894,7 @@ def calculate_initial_stats(loadout: List[Dict]) -> Dict:
 
     for trait in loadout:
         stats = process_trait_effects(stats, trait)
-        logger.debug(f"Processed trait: {trait['name']}")
+        logger.debug("Processed trait: %s", trait['name'])
 
     # Ensure stats are within bounds
     stats['mutation_rate'] = max(0, stats['mutation_rate'])
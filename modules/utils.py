@@ -1,33 +1,34 @@
 from pathlib import Path
-from typing import Dict, Any, Optional, Final
-from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+from dataclasses import dataclass, asdict
 from datetime import datetime
-import json
 import os
 
 from modules.logger import logger
 from modules.constants import DATA_DIR
+from modules.storage import storage
+from modules.config_service import config_service
 
-@dataclass
+@dataclass(frozen=True)
 class GameConfig:
-    """Game configuration data"""
+    """Game configuration snapshot"""
     rp: int = 0
     trait_slots: int = 3
-    unlocked_themes: list = None
-    unlocked_audio: list = None
+    unlocked_themes: Tuple[str, ...] = ()
+    unlocked_audio: Tuple[str, ...] = ()
 
     def __post_init__(self):
-        """Initialize optional fields"""
-        self.unlocked_themes = self.unlocked_themes or []
-        self.unlocked_audio = self.unlocked_audio or []
+        """Store collections as tuples; None means empty"""
+        object.__setattr__(self, "unlocked_themes", tuple(self.unlocked_themes or ()))
+        object.__setattr__(self, "unlocked_audio", tuple(self.unlocked_audio or ()))
 
     def validate(self) -> bool:
         """Validate configuration values"""
         return all([
             isinstance(self.rp, int),
             isinstance(self.trait_slots, int),
-            isinstance(self.unlocked_themes, list),
-            isinstance(self.unlocked_audio, list)
+            isinstance(self.unlocked_themes, tuple),
+            isinstance(self.unlocked_audio, tuple)
         ])
 
 class FileManager:
@@ -35,10 +36,7 @@ class FileManager:
     @staticmethod
     def safe_load(path: Path) -> Optional[Dict]:
         try:
-            if not path.exists():
-                return None
-            with open(path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return storage.read_json(path)
         except Exception as e:
             logger.error(f"Failed to load file {path}: {e}")
             return None
@@ -46,10 +44,7 @@ class FileManager:
     @staticmethod
     def safe_save(path: Path, data: Dict) -> bool:
         try:
-            path.parent.mkdir(parents=True, exist_ok=True)
-            with open(path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
-            return True
+            return storage.put_json(path, data)
         except Exception as e:
             logger.error(f"Failed to save file {path}: {e}")
             return False
@@ -58,13 +53,15 @@ class ConfigManager:
     """Manages game configuration"""
     CONFIG_PATH = Path(DATA_DIR) / "config.json"
 
+    @classmethod
+    def _document(cls):
+        return config_service.document(cls.CONFIG_PATH, lambda data: GameConfig(**data),
+                                       asdict, GameConfig)
+
     @classmethod
     def get_config(cls) -> GameConfig:
         """Load configuration or create default"""
-        data = FileManager.safe_load(cls.CONFIG_PATH)
-        if data is None:
-            return GameConfig()
-        return GameConfig(**data)
+        return cls._document().get()
 
     @classmethod
     def save_config(cls, config: GameConfig) -> bool:
@@ -72,7 +69,11 @@ class ConfigManager:
         if not config.validate():
             logger.error("Invalid configuration data")
             return False
-        return FileManager.safe_save(cls.CONFIG_PATH, config.__dict__)
+        try:
+            return cls._document().set(config)
+        except Exception as e:
+            logger.error(f"Failed to save file {cls.CONFIG_PATH}: {e}")
+            return False
 
 def format_time(seconds: int) -> str:
     """Format seconds into readable time"""
@@ -87,28 +88,8 @@ def get_entropy_drain(survival_seconds: int) -> float:
     return round(base_entropy * time_multiplier, 2)
 
 def view_highlights():
-    folder = "data/highlights"
-    if not os.path.exists(folder):
-        print("No highlights found.")
-        return
-
-    files = sorted(os.listdir(folder), reverse=True)
-    if not files:
-        print("No highlights saved yet.")
-        return
-
-    print("\n📁 Highlight Log Files:")
-    for i, fname in enumerate(files[:10], 1):
-        print(f"{i}. {fname}")
-
-    choice = input("Select a highlight to view (or press Enter to cancel): ")
-    if choice.isdigit():
-        index = int(choice) - 1
-        if 0 <= index < len(files):
-            with open(os.path.join(folder, files[index]), "r") as f:
-                print("\n" + f.read())
-        else:
-            print("Invalid selection.")
+    from modules.highlights import HighlightManager
+    HighlightManager().display_highlights()
 
 def clear_screen() -> None:
     """Clear the terminal screen"""
@@ -1,4 +1,3 @@
-import json
 import os
 import logging
 from pathlib import Path
@@ -8,6 +7,7 @@ from colorama import Fore, Style
 from modules.utils import clear_screen
 from modules.logger import logger
 from modules.constants import DATA_DIR
+from modules.vault_journal import journal_for
 
 @dataclass
 class Trait:
@@ -32,6 +32,7 @@ class VaultManager:
     VAULT_PATH: Final[Path] = DATA_DIR / "vault.json"
 
     def __init__(self):
+        self.journal = journal_for(self.VAULT_PATH)
         self.vault: List[Dict] = []
         self.initialize()
 
@@ -45,26 +46,26 @@ class VaultManager:
             self.vault = []
 
     def load_vault(self) -> List[Dict]:
-        """Load the player's trait vault"""
+        """Load the player's trait vault
+
+        Returns the journal's live list, so later journaled changes are
+        visible without reloading. Invalid traits are removed through the
+        journal to keep replay indices aligned.
+        """
         try:
-            if not self.VAULT_PATH.exists():
-                return []
-            with open(self.VAULT_PATH, "r", encoding='utf-8') as f:
-                return [trait for trait in json.load(f) if self._validate_trait(trait)]
+            vault = self.journal.traits
+            for idx in reversed(range(len(vault))):
+                if not self._validate_trait(vault[idx]):
+                    logger.warning(f"Dropping invalid vault trait: {vault[idx]}")
+                    self.journal.remove(idx)
+            return vault
         except Exception as e:
             logger.error(f"Failed to load vault: {e}")
             return []
 
     def save_vault(self) -> bool:
-        """Save the current vault state"""
-        try:
-            self.VAULT_PATH.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.VAULT_PATH, "w", encoding='utf-8') as f:
-                json.dump(self.vault, f, indent=2)
-            return True
-        except Exception as e:
-            logger.error(f"Failed to save vault: {e}")
-            return False
+        """Fold journaled changes into a full vault snapshot"""
+        return self.journal.compact()
 
     def _validate_trait(self, trait: Dict) -> bool:
         """Validate trait structure"""
@@ -100,11 +101,9 @@ class VaultManager:
         """Add a new trait to the vault"""
         try:
             trait.setdefault("point_value", 0)
-            self.vault.append(trait)
-            success = self.save_vault()
-            if success:
-                logger.info(f"Added trait to vault: {trait['name']}", Fore.GREEN)
-            return success
+            self.journal.add(trait)
+            logger.info("Added trait to vault: %s", trait['name'], color=Fore.GREEN)
+            return True
         except Exception as e:
             logger.error(f"Failed to add trait: {e}")
             return False
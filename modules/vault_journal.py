@@ -0,0 +1,198 @@
+# modules/vault_journal.py
+
+from typing import Any, Dict, Final, List, Optional, Sequence
+from pathlib import Path
+import json
+import threading
+import zlib
+
+from modules.logger import logger
+from modules.storage import storage
+
+COMPACT_THRESHOLD: Final[int] = 200
+
+
+class VaultJournal:
+    """Trait vault stored as a JSON snapshot plus an operation journal
+
+    The snapshot stays a plain JSON list so older readers keep working.
+    Each mutation appends one line to `<snapshot>.journal`, and the
+    journal is replayed on load. Compaction freezes the journal by
+    renaming it to `<snapshot>.journal.<crc>-<n>`, where crc identifies the
+    snapshot it applies to. It then writes a new snapshot. A frozen journal
+    whose crc no longer matches the snapshot was already folded in.
+    """
+
+    def __init__(self, snapshot_path: Path, compact_threshold: int = COMPACT_THRESHOLD):
+        self.snapshot_path = Path(snapshot_path)
+        self.journal_path = self.snapshot_path.with_name(self.snapshot_path.name + ".journal")
+        self.compact_threshold = compact_threshold
+        self.traits: List[Dict[str, Any]] = []
+        self.pending_ops = 0
+        self._lock = threading.RLock()
+        self._compact_lock = threading.Lock()
+        self._journal = None
+        self._compactor: Optional[threading.Thread] = None
+        self.load()
+
+    # ---- loading ----
+
+    def load(self) -> List[Dict[str, Any]]:
+        """Rebuild the vault from the snapshot and any journals"""
+        with self._lock:
+            self._close_journal()
+            snapshot = b""
+            if self.snapshot_path.exists():
+                snapshot = self.snapshot_path.read_bytes()
+            self.traits = json.loads(snapshot) if snapshot.strip() else []
+            self.pending_ops = 0
+
+            snapshot_crc = f"{zlib.crc32(snapshot):08x}"
+            interrupted = False
+            for frozen in self._frozen_journals():
+                crc, _ = frozen.suffix[1:].split("-")
+                if crc == snapshot_crc:
+                    self._replay(frozen)
+                    interrupted = True
+                else:
+                    frozen.unlink()
+            if self.journal_path.exists():
+                self._replay(self.journal_path, repair=True)
+            if interrupted:
+                # Finish the compaction that was cut short
+                self.compact()
+            return self.traits
+
+    def _frozen_journals(self) -> List[Path]:
+        """Journals frozen by compaction, in the order they were frozen"""
+        frozen = self.snapshot_path.parent.glob(self.journal_path.name + ".*-*")
+        return sorted(frozen, key=lambda p: int(p.suffix.rsplit("-", 1)[1]))
+
+    def _replay(self, path: Path, repair: bool = False) -> None:
+        good_end = 0
+        with open(path, "rb") as f:
+            for line in f:
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError("incomplete entry")
+                    self._apply(json.loads(line))
+                except Exception as e:
+                    logger.warning(f"Stopped replaying {path.name}: {e}")
+                    break
+                good_end += len(line)
+                self.pending_ops += 1
+        if repair and good_end < path.stat().st_size:
+            # Drop the torn tail so new entries start on a clean line
+            with open(path, "r+b") as f:
+                f.truncate(good_end)
+
+    def _apply(self, entry: Dict[str, Any]) -> None:
+        match entry["op"]:
+            case "add":
+                self.traits.append(entry["trait"])
+            case "remove":
+                self.traits.pop(entry["index"])
+            case "merge":
+                for idx in sorted(entry["indices"], reverse=True):
+                    self.traits.pop(idx)
+                self.traits.append(entry["trait"])
+            case op:
+                raise ValueError(f"Unknown vault operation: {op}")
+
+    # ---- mutations ----
+
+    def _record(self, entry: Dict[str, Any]) -> None:
+        """Apply an operation and append it to the journal"""
+        line = json.dumps(entry, separators=(",", ":")) + "\n"
+        with self._lock:
+            self._apply(entry)
+            if self._journal is None:
+                self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+                self._journal = open(self.journal_path, "a", encoding='utf-8')
+            self._journal.write(line)
+            self._journal.flush()
+            self.pending_ops += 1
+        if self.pending_ops >= self.compact_threshold:
+            self.compact_in_background()
+
+    def add(self, trait: Dict[str, Any]) -> None:
+        self._record({"op": "add", "trait": trait})
+
+    def remove(self, index: int) -> Dict[str, Any]:
+        with self._lock:
+            trait = self.traits[index]
+            self._record({"op": "remove", "index": index})
+        return trait
+
+    def merge(self, indices: Sequence[int], trait: Dict[str, Any]) -> None:
+        """Replace the traits at `indices` with the merged trait"""
+        self._record({"op": "merge", "indices": list(indices), "trait": trait})
+
+    def rewrite(self, traits: List[Dict[str, Any]]) -> bool:
+        """Replace the whole vault and write a fresh snapshot"""
+        with self._lock:
+            self.traits[:] = traits
+        return self.compact()
+
+    # ---- compaction ----
+
+    def _close_journal(self) -> None:
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+    def compact_in_background(self) -> None:
+        if self._compactor is not None and self._compactor.is_alive():
+            return
+        self._compactor = threading.Thread(target=self.compact, name="vault-compactor",
+                                           daemon=True)
+        self._compactor.start()
+
+    def compact(self) -> bool:
+        """Fold the journal into a new snapshot"""
+        with self._compact_lock:
+            return self._compact()
+
+    def _compact(self) -> bool:
+        try:
+            snapshot = self.snapshot_path.read_bytes() if self.snapshot_path.exists() else b""
+            with self._lock:
+                traits = list(self.traits)
+                self._close_journal()
+                if self.journal_path.exists():
+                    # Never overwrite a frozen journal left by an interrupted compaction
+                    seq = max((int(p.suffix.rsplit("-", 1)[1]) for p in self._frozen_journals()),
+                              default=-1) + 1
+                    frozen = f"{self.journal_path.name}.{zlib.crc32(snapshot):08x}-{seq}"
+                    self.journal_path.replace(self.journal_path.with_name(frozen))
+                self.pending_ops = 0
+
+            # Frozen journals may only go once the snapshot is on disk
+            if not storage.put_json(self.snapshot_path, traits, durable=True):
+                return False
+
+            for frozen in self._frozen_journals():
+                frozen.unlink()
+            return True
+        except Exception as e:
+            logger.error(f"Failed to compact vault {self.snapshot_path.name}: {e}")
+            return False
+
+    def close(self) -> None:
+        if self._compactor is not None:
+            self._compactor.join()
+        with self._lock:
+            self._close_journal()
+
+
+_journals: Dict[Path, VaultJournal] = {}
+_journals_lock = threading.Lock()
+
+
+def journal_for(snapshot_path: Path) -> VaultJournal:
+    """Shared journal per vault file so every manager sees the same state"""
+    key = Path(snapshot_path).resolve()
+    with _journals_lock:
+        if key not in _journals:
+            _journals[key] = VaultJournal(key)
+        return _journals[key]
@@ -0,0 +1,110 @@
+# animations.py
+
+from typing import List, Optional
+import abc
+import threading
+import time
+
+
+class Animation(abc.ABC):
+    """A timed visual effect, sampled by the render loop once per frame
+
+    Animations never sleep. Each frame asks for the lines to show at the
+    current time, so any thread can start one and carry on.
+    """
+
+    def __init__(self, duration: float, start: Optional[float] = None):
+        self.duration = duration
+        self.start = time.monotonic() if start is None else start
+
+    def elapsed(self, now: float) -> float:
+        return max(0.0, now - self.start)
+
+    def done(self, now: float) -> bool:
+        return self.elapsed(now) >= self.duration
+
+    @abc.abstractmethod
+    def lines(self, now: float) -> List[str]:
+        """Lines to show at time `now`"""
+
+
+class Flash(Animation):
+    """A banner line shown for a fixed time"""
+
+    def __init__(self, text: str, color: str, duration: float, reset: str = "\x1b[0m",
+                 start: Optional[float] = None):
+        super().__init__(duration, start)
+        self.text = f"{color}{text}{reset}"
+
+    def lines(self, now: float) -> List[str]:
+        return [] if self.done(now) else [self.text]
+
+
+class Blink(Animation):
+    """A line that alternates between shown and blank"""
+
+    def __init__(self, text: str, color: str, blinks: int, period: float,
+                 reset: str = "\x1b[0m", start: Optional[float] = None):
+        super().__init__(blinks * period, start)
+        self.text = f"{color}{text}{reset}"
+        self.period = period
+
+    def lines(self, now: float) -> List[str]:
+        if self.done(now):
+            return []
+        # Blank instead of missing so the lines below do not jump
+        visible = (self.elapsed(now) % self.period) < self.period / 2
+        return [self.text if visible else ""]
+
+
+class Typewriter(Animation):
+    """Reveals text one character per `char_delay`, then holds it"""
+
+    def __init__(self, text: str, color: str, char_delay: float, reset: str = "\x1b[0m",
+                 start: Optional[float] = None):
+        super().__init__(len(text) * char_delay, start)
+        self.text = text
+        self.color = color
+        self.reset = reset
+        self.char_delay = char_delay
+
+    def lines(self, now: float) -> List[str]:
+        shown = len(self.text) if self.done(now) else int(self.elapsed(now) / self.char_delay)
+        return [f"{self.color}{line}{self.reset}" if line else ""
+                for line in self.text[:shown].split("\n")]
+
+
+class Animator:
+    """The animations currently playing, in the order they started"""
+
+    def __init__(self):
+        self._animations: List[Animation] = []
+        self._lock = threading.Lock()
+
+    def add(self, animation: Animation) -> Animation:
+        with self._lock:
+            self._animations.append(animation)
+        return animation
+
+    def clear(self) -> None:
+        with self._lock:
+            self._animations = []
+
+    @property
+    def active(self) -> bool:
+        return bool(self._animations)
+
+    def prune(self, now: Optional[float] = None) -> List[Animation]:
+        """Drop finished animations; returns the ones still running"""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            self._animations = [a for a in self._animations if not a.done(now)]
+            return list(self._animations)
+
+    def lines(self, now: Optional[float] = None) -> List[str]:
+        """Lines of every running animation; finished ones are dropped"""
+        now = time.monotonic() if now is None else now
+        lines: List[str] = []
+        for animation in self.prune(now):
+            lines.extend(animation.lines(now))
+        return lines
@@ -0,0 +1,113 @@
+# dashboard.py
+
+from typing import Dict, Final, List, Optional, Sequence, TextIO, Tuple
+from dataclasses import dataclass
+import queue
+import shutil
+import threading
+
+from simulacra.ui.hud import HUDManager
+from simulacra.ui.renderer import FrameRenderer
+from simulacra.ui.scheduler import RenderScheduler
+
+CELL_WIDTH: Final[int] = 30
+CELL_GAP: Final[str] = "  "
+
+
+@dataclass(frozen=True)
+class RunSnapshot:
+    """Compact state of one headless run, cheap to send between processes"""
+    run_id: str
+    hp: float
+    max_hp: float
+    entropy_drain: float
+    survival_seconds: int
+    disasters: int = 0
+    last_disaster: Optional[str] = None
+    alive: bool = True
+
+
+class SpectatorDashboard:
+    """Shows many headless runs side by side in one terminal
+
+    Workers call update() from any thread, or put RunSnapshots on a queue
+    that drain() empties (a multiprocessing.Queue works for processes).
+    Every run is laid out in one frame, so a redraw is a single diffed
+    write no matter how many runs are on screen.
+    """
+
+    def __init__(self, fps: float = 4.0, columns: Optional[int] = None,
+                 stream: Optional[TextIO] = None):
+        self.columns = columns
+        self.renderer = FrameRenderer(stream)
+        self.scheduler: RenderScheduler[Tuple[RunSnapshot, ...]] = RenderScheduler(self.draw, fps)
+        self._runs: Dict[str, RunSnapshot] = {}
+        self._lock = threading.Lock()
+
+    def start(self) -> "SpectatorDashboard":
+        self.scheduler.start()
+        return self
+
+    def stop(self) -> None:
+        self.scheduler.stop()
+
+    def update(self, snapshot: RunSnapshot) -> None:
+        with self._lock:
+            self._runs[snapshot.run_id] = snapshot
+            runs = tuple(self._runs.values())
+        self.scheduler.submit(runs)
+
+    def drain(self, source: "queue.Queue[RunSnapshot]") -> int:
+        """Apply every snapshot waiting on a queue without blocking"""
+        count = 0
+        while True:
+            try:
+                snapshot = source.get_nowait()
+            except queue.Empty:
+                return count
+            self.update(snapshot)
+            count += 1
+
+    def draw(self, runs: Sequence[RunSnapshot]) -> None:
+        self.renderer.render(self.build_frame(runs))
+
+    def _column_count(self) -> int:
+        if self.columns:
+            return self.columns
+        width = shutil.get_terminal_size().columns
+        return max(1, (width + len(CELL_GAP)) // (CELL_WIDTH + len(CELL_GAP)))
+
+    def build_frame(self, runs: Sequence[RunSnapshot]) -> List[str]:
+        colors = HUDManager.colors
+        alive = sum(1 for run in runs if run.alive)
+        lines = [f"{colors.INFO}SIMULACRA SPECTATOR — {len(runs)} runs, {alive} alive{colors.RESET}",
+                 ""]
+        columns = self._column_count()
+        ordered = sorted(runs, key=lambda run: run.run_id)
+        for row_start in range(0, len(ordered), columns):
+            cells = [self._cell(run) for run in ordered[row_start:row_start + columns]]
+            for row in zip(*cells):
+                lines.append(CELL_GAP.join(row))
+            lines.append("")
+        return lines
+
+    @staticmethod
+    def _fit(text: str, color: str = "") -> str:
+        """Pad or cut plain text to the cell width, then color it"""
+        text = text[:CELL_WIDTH].ljust(CELL_WIDTH)
+        return f"{color}{text}{HUDManager.colors.RESET}" if color else text
+
+    @classmethod
+    def _cell(cls, run: RunSnapshot) -> Tuple[str, str, str]:
+        colors = HUDManager.colors
+        seconds = run.survival_seconds
+        header = f"{run.run_id} {seconds//60}m{seconds%60:02d}s"
+        if run.alive:
+            hp = cls._fit(f"HP  {HUDManager.format_hp(run.hp, run.max_hp)}",
+                          HUDManager._get_health_color(run.hp))
+        else:
+            hp = cls._fit("COLLAPSED", colors.HEALTH_CRITICAL)
+        last = f" {run.last_disaster}" if run.last_disaster else ""
+        hazards = (f"EN {HUDManager._format_stat(run.entropy_drain)}/s"
+                   f"  DIS {run.disasters}{last}")
+        return (cls._fit(header, colors.INFO), hp, cls._fit(hazards, colors.ENTROPY))
@@ -1,12 +1,11 @@
 # hud.py
 
-from typing import List, Dict, Final, Optional
+from typing import List, Dict, Final, Optional, Tuple
 from dataclasses import dataclass, field
 import os
 import datetime
 from colorama import Fore, Style, Back, init
 import time
-import sys
 
 from simulacra.core.traits import TraitSystem
 from simulacra.core.player import Player
@@ -18,6 +17,8 @@ from simulacra.core.constants import (
 from modules.utils import format_time
 from modules.error_handler import handle_errors, GameError, handle_error
 from modules.logger import logger
+from simulacra.ui.renderer import FrameRenderer
+from simulacra.ui.animations import Animation, Animator, Blink, Flash, Typewriter
 from modules.constants import (
     BASE_HP,
     BASE_ENTROPY_DRAIN,
@@ -35,6 +36,7 @@ class HUDAnimation:
     HEAL_FLASH_DURATION: float = 0.1
     GAME_OVER_DELAY: float = 0.05
     DISASTER_WARNING_BLINK: int = 3
+    DISASTER_WARNING_PERIOD: float = 0.4
 
 
 @dataclass
@@ -76,21 +78,90 @@ class HUDConfig:
         'psychic': '🧠'
     })
     UPDATE_INTERVAL: float = 1.0
+    TARGET_FPS: float = 10.0
     SHOW_DECIMALS: bool = True
     MAX_DISASTERS: int = 5
 
 
+@dataclass(frozen=True)
+class HUDSnapshot:
+    """Everything one HUD frame shows, copied out of the live game state
+
+    Snapshots are immutable, so the render thread can draw one while the
+    simulation keeps mutating the player.
+    """
+    health: float
+    mutation_rate: float
+    speed: float
+    entropy_drain: float
+    survival_seconds: int
+    # (name, ((effect text, remaining seconds or None), ...))
+    traits: Tuple[Tuple[str, Tuple[Tuple[str, Optional[int]], ...]], ...]
+    # (type, name, description)
+    mutations: Tuple[Tuple[str, str, str], ...]
+    # (name, damage, time)
+    disasters: Tuple[Tuple[str, float, int], ...]
+    resistances: Tuple[Tuple[str, float], ...]
+    immunities: Tuple[str, ...]
+
+    @classmethod
+    def capture(cls,
+                player: Player,
+                trait_system: TraitSystem,
+                mutation_system: MutationSystem,
+                survival_seconds: int,
+                entropy_drain: float,
+                recent_disasters: List[Dict]) -> "HUDSnapshot":
+        traits = []
+        for tid in player.active_traits:
+            if trait := trait_system.get_trait(tid):
+                effects = tuple((effect['text'], effect.get('remaining'))
+                                for effect in trait.get('effects', []))
+                traits.append((trait['name'], effects))
+        return cls(
+            health=player.health,
+            mutation_rate=player.mutation_rate,
+            speed=player.speed,
+            entropy_drain=entropy_drain,
+            survival_seconds=survival_seconds,
+            traits=tuple(traits),
+            mutations=tuple((m.type.value, m.name, m.description)
+                            for m in mutation_system.get_mutation_list()),
+            disasters=tuple((d['name'], d['damage'], d['time']) for d in recent_disasters),
+            resistances=tuple(player.resistances.items()),
+            immunities=tuple(player.immunities),
+        )
+
+
+class GameOverScreen(Typewriter):
+    """Types the game over banner, then holds it above the final stats"""
+
+    def __init__(self, text: str, stats: List[str], color: str, char_delay: float,
+                 reset: str = "\x1b[0m", start: Optional[float] = None):
+        super().__init__(text, color, char_delay, reset, start)
+        self.stats = list(stats)
+
+    def lines(self, now: float) -> List[str]:
+        lines = super().lines(now)
+        return lines + self.stats if self.done(now) else lines
+
+
 class HUDManager:
     """Manages HUD display and updates"""
     colors = HUDColors()
     config = HUDConfig()
     anim = HUDAnimation()
+    renderer = FrameRenderer()
+    animations = Animator()
+    # Full-screen animation drawn instead of the HUD, e.g. the game over screen
+    overlay: Optional[Animation] = None
 
-    @staticmethod
+    @classmethod
     @handle_errors()
-    def clear_screen() -> None:
+    def clear_screen(cls) -> None:
         """Clear the terminal screen"""
         os.system('cls' if os.name == 'nt' else 'clear')
+        cls.renderer.invalidate()
 
     @staticmethod
     def format_hp(current: float, maximum: float) -> str:
@@ -105,29 +176,65 @@ class HUDManager:
                   survival_seconds: int,
                   entropy_drain: float,
                   recent_disasters: List[Dict]) -> None:
-        """Update the HUD display with enhanced visuals"""
-        cls.clear_screen()
+        """Update the HUD display with enhanced visuals
+
+        Draws immediately on the calling thread. Game loops that should not
+        wait on the terminal submit snapshots to a RenderScheduler instead.
+        """
+        cls.draw(HUDSnapshot.capture(player, trait_system, mutation_system,
+                                     survival_seconds, entropy_drain, recent_disasters))
+
+    @classmethod
+    def draw(cls, snapshot: HUDSnapshot) -> None:
+        """Draw a frame in place; only lines that changed are rewritten
+
+        Running animations are drawn below the HUD at their current frame.
+        While an overlay is set, only the overlay is drawn.
+        """
+        if cls.overlay is not None:
+            now = time.monotonic()
+            # The overlay holds its last frame; the animator only tracks timing
+            cls.animations.prune(now)
+            cls.renderer.render(cls.overlay.lines(now))
+            return
+        cls.renderer.render(cls.build_frame(snapshot) + cls.animations.lines())
 
+    @classmethod
+    def clear_overlay(cls) -> None:
+        """Go back to drawing the HUD"""
+        cls.overlay = None
+        cls.renderer.invalidate()
+
+    @classmethod
+    def build_frame(cls, snapshot: HUDSnapshot) -> List[str]:
+        """Lines of one HUD frame"""
         # Header with background
-        print(f"{cls.colors.HEADER_BG}{cls.colors.INFO}╔{'═' * 38}╗{cls.colors.RESET}")
-        print(f"{cls.colors.HEADER_BG}{cls.colors.INFO}║ {'[ INHALE ]':^36} ║{cls.colors.RESET}")
-        print(f"{cls.colors.HEADER_BG}{cls.colors.INFO}╚{'═' * 38}╝{cls.colors.RESET}")
+        lines = [
+            f"{cls.colors.HEADER_BG}{cls.colors.INFO}╔{'═' * 38}╗{cls.colors.RESET}",
+            f"{cls.colors.HEADER_BG}{cls.colors.INFO}║ {'[ INHALE ]':^36} ║{cls.colors.RESET}",
+            f"{cls.colors.HEADER_BG}{cls.colors.INFO}╚{'═' * 38}╝{cls.colors.RESET}",
+        ]
 
         # Stats section with dynamic coloring
-        health_color = cls._get_health_color(player.health)
-        print(f"\n{health_color}🫀 HP: {cls._format_stat(player.health)}{cls.colors.RESET}")
-        print(f"{cls.colors.MUTATION}🌀 Mutation: {cls._format_stat(player.mutation_rate)}%{cls.colors.RESET}")
-        print(f"{cls.colors.ENTROPY}💀 Entropy: {entropy_drain:.2f} HP/s{cls.colors.RESET}")
-        print(f"{cls.colors.INFO}⏳ Time: {survival_seconds//60}m {survival_seconds%60}s{cls.colors.RESET}")
+        health_color = cls._get_health_color(snapshot.health)
+        seconds = snapshot.survival_seconds
+        lines += [
+            "",
+            f"{health_color}🫀 HP: {cls._format_stat(snapshot.health)}{cls.colors.RESET}",
+            f"{cls.colors.MUTATION}🌀 Mutation: {cls._format_stat(snapshot.mutation_rate)}%{cls.colors.RESET}",
+            f"{cls.colors.ENTROPY}💀 Entropy: {snapshot.entropy_drain:.2f} HP/s{cls.colors.RESET}",
+            f"{cls.colors.INFO}⏳ Time: {seconds//60}m {seconds%60}s{cls.colors.RESET}",
+        ]
 
         # Separators
-        print(f"\n{cls.colors.INFO}{'─' * 40}{cls.colors.RESET}")
+        lines += ["", f"{cls.colors.INFO}{'─' * 40}{cls.colors.RESET}"]
 
         # Active effects
-        cls._display_traits(player, trait_system)
-        cls._display_mutations(mutation_system)
-        cls._display_disasters(recent_disasters)
-        cls._display_stats(player)
+        lines += cls._trait_lines(snapshot)
+        lines += cls._mutation_lines(snapshot)
+        lines += cls._disaster_lines(snapshot)
+        lines += cls._stat_lines(snapshot)
+        return lines
 
     @classmethod
     def _get_health_color(cls, health: float) -> str:
@@ -151,58 +258,62 @@ class HUDManager:
         print("=" * 40)
 
     @classmethod
-    def _display_traits(cls, player: Player, trait_system: TraitSystem) -> None:
-        """Display active traits"""
-        print("\n🔹 Active Traits:")
-        active_traits = [trait_system.get_trait(tid) for tid in player.active_traits]
-        if active_traits:
-            for trait in active_traits:
-                if trait:  # Check if trait exists
-                    print(f"  - {trait['name']}")
-                    for effect in trait.get('effects', []):
-                        duration = f" ({effect['remaining']}s)" if effect.get('remaining') else ""
-                        print(f"    • {effect['text']}{duration}")
+    def _trait_lines(cls, snapshot: HUDSnapshot) -> List[str]:
+        """Active traits section"""
+        lines = ["", "🔹 Active Traits:"]
+        if snapshot.traits:
+            for name, effects in snapshot.traits:
+                lines.append(f"  - {name}")
+                for text, remaining in effects:
+                    duration = f" ({remaining}s)" if remaining else ""
+                    lines.append(f"    • {text}{duration}")
         else:
-            print("  (none)")
+            lines.append("  (none)")
+        return lines
 
     @classmethod
-    def _display_mutations(cls, mutation_system: MutationSystem) -> None:
-        """Display mutations section with colors based on type"""
-        print("\n🔸 Mutations:")
-        mutations = mutation_system.get_mutation_list()
-        if mutations:
-            for mutation in mutations:
-                icon = cls.config.MUTATION_TYPES.get(mutation.type.value, '❓')
-                print(f"  {icon} {mutation.name} — {mutation.description}")
+    def _mutation_lines(cls, snapshot: HUDSnapshot) -> List[str]:
+        """Mutations section with icons based on type"""
+        lines = ["", "🔸 Mutations:"]
+        if snapshot.mutations:
+            for mutation_type, name, description in snapshot.mutations:
+                icon = cls.config.MUTATION_TYPES.get(mutation_type, '❓')
+                lines.append(f"  {icon} {name} — {description}")
         else:
-            print("  (none)")
+            lines.append("  (none)")
+        return lines
 
     @classmethod
-    def _display_disasters(cls, recent_disasters: List[Dict]) -> None:
-        """Display recent disasters with enhanced formatting"""
-        print(f"\n{cls.colors.WARNING}⚠️ Recent Disasters:{cls.colors.RESET}")
-        if recent_disasters:
-            for disaster in recent_disasters:
-                print(f"{cls.colors.DISASTER_BG} {disaster['name']} {cls.colors.RESET}")
-                print(f"  💀 Damage: {disaster['damage']:.1f}")
-                print(f"  ⌛ {disaster['time']}s ago")
-                print()
+    def _disaster_lines(cls, snapshot: HUDSnapshot) -> List[str]:
+        """Recent disasters section"""
+        lines = ["", f"{cls.colors.WARNING}⚠️ Recent Disasters:{cls.colors.RESET}"]
+        if snapshot.disasters:
+            for name, damage, seconds in snapshot.disasters:
+                lines += [
+                    f"{cls.colors.DISASTER_BG} {name} {cls.colors.RESET}",
+                    f"  💀 Damage: {damage:.1f}",
+                    f"  ⌛ {seconds}s ago",
+                    "",
+                ]
         else:
-            print("  (none)\n")
+            lines += ["  (none)", ""]
+        return lines
 
     @classmethod
-    def _display_stats(cls, player: Player) -> None:
-        """Display current player stats"""
-        print("\n📊 Current Stats:")
-        print(f"  - Speed: {cls._format_stat(player.speed)}x")
-
+    def _stat_lines(cls, snapshot: HUDSnapshot) -> List[str]:
+        """Current player stats section"""
         # Format resistances
         resistances = [
             f"{k}: {cls._format_resistance(v)}"
-            for k, v in player.resistances.items()
+            for k, v in snapshot.resistances
+        ]
+        return [
+            "",
+            "📊 Current Stats:",
+            f"  - Speed: {cls._format_stat(snapshot.speed)}x",
+            f"  - Resistances: {', '.join(resistances) if resistances else 'None'}",
+            f"  - Immunities: {', '.join(snapshot.immunities) if snapshot.immunities else 'None'}",
         ]
-        print(f"  - Resistances: {', '.join(resistances) if resistances else 'None'}")
-        print(f"  - Immunities: {', '.join(player.immunities) if player.immunities else 'None'}")
 
     @staticmethod
     def _format_stat(value: float) -> str:
@@ -216,55 +327,49 @@ class HUDManager:
 
     @classmethod
     def flash_damage(cls, amount: float) -> None:
-        """Flash screen on damage"""
+        """Flash a damage banner under the HUD; returns immediately"""
         if amount > 0:
-            sys.stdout.write(cls.colors.DAMAGE_FLASH)
-            print(f"\n💥 DAMAGE: -{amount:.1f}")
-            sys.stdout.write(cls.colors.RESET)
-            sys.stdout.flush()
-            time.sleep(cls.anim.DAMAGE_FLASH_DURATION)
+            cls.animations.add(Flash(f"💥 DAMAGE: -{amount:.1f}", cls.colors.DAMAGE_FLASH,
+                                     cls.anim.DAMAGE_FLASH_DURATION, cls.colors.RESET))
 
     @classmethod
     def flash_heal(cls, amount: float) -> None:
-        """Flash screen on healing"""
+        """Flash a heal banner under the HUD; returns immediately"""
         if amount > 0:
-            sys.stdout.write(cls.colors.HEAL_FLASH)
-            print(f"\n💚 HEAL: +{amount:.1f}")
-            sys.stdout.write(cls.colors.RESET)
-            sys.stdout.flush()
-            time.sleep(cls.anim.HEAL_FLASH_DURATION)
+            cls.animations.add(Flash(f"💚 HEAL: +{amount:.1f}", cls.colors.HEAL_FLASH,
+                                     cls.anim.HEAL_FLASH_DURATION, cls.colors.RESET))
 
     @classmethod
     def show_game_over(cls, survival_time: int, mutations: List[Mutation],
                       max_health: float, final_entropy: float) -> None:
-        """Display animated game over screen"""
-        cls.clear_screen()
+        """Start the animated game over screen; returns immediately
+
+        The screen replaces the HUD and is played by the render scheduler.
+        Use RenderScheduler.wait_idle() to let it finish before stopping.
+        """
         text = """
 ╔══════════════════════════════════════╗
 ║             GAME OVER                ║
 ╚══════════════════════════════════════╝
 """
-        for char in text:
-            sys.stdout.write(cls.colors.WARNING + char + cls.colors.RESET)
-            sys.stdout.flush()
-            time.sleep(cls.anim.GAME_OVER_DELAY)
-
-        print(f"\n{cls.colors.INFO}Final Statistics:{cls.colors.RESET}")
-        print(f"⌛ Survival Time: {survival_time//60}m {survival_time%60}s")
-        print(f"🧬 Mutations: {len(mutations)}")
-        print(f"💀 Final Entropy: {final_entropy:.2f} HP/s")
+        stats = [
+            f"{cls.colors.INFO}Final Statistics:{cls.colors.RESET}",
+            f"⌛ Survival Time: {survival_time//60}m {survival_time%60}s",
+            f"🧬 Mutations: {len(mutations)}",
+            f"💀 Final Entropy: {final_entropy:.2f} HP/s",
+        ]
+        cls.animations.clear()
+        cls.renderer.invalidate()
+        cls.overlay = cls.animations.add(GameOverScreen(
+            text, stats, cls.colors.WARNING, cls.anim.GAME_OVER_DELAY, cls.colors.RESET))
 
     @classmethod
     def display_disaster_warning(cls, disaster_name: str) -> None:
-        """Show blinking disaster warning"""
-        for _ in range(cls.anim.DISASTER_WARNING_BLINK):
-            sys.stdout.write(cls.colors.DISASTER_BG + cls.colors.WARNING)
-            print(f"\n⚠️ INCOMING: {disaster_name} ⚠️")
-            sys.stdout.write(cls.colors.RESET)
-            sys.stdout.flush()
-            time.sleep(0.2)
-            cls.clear_screen()
-            time.sleep(0.2)
+        """Blink a disaster warning under the HUD; returns immediately"""
+        cls.animations.add(Blink(f"⚠️ INCOMING: {disaster_name} ⚠️",
+                                 cls.colors.DISASTER_BG + cls.colors.WARNING,
+                                 cls.anim.DISASTER_WARNING_BLINK,
+                                 cls.anim.DISASTER_WARNING_PERIOD, cls.colors.RESET))
 
 
 # Update collapse summary for new systems
@@ -0,0 +1,70 @@
+# renderer.py
+
+from typing import Final, List, Optional, Sequence, TextIO
+import sys
+
+CSI: Final[str] = "\x1b["
+CURSOR_HOME: Final[str] = f"{CSI}H"
+CLEAR_SCREEN: Final[str] = f"{CSI}2J"
+CLEAR_LINE_END: Final[str] = f"{CSI}K"
+CLEAR_BELOW: Final[str] = f"{CSI}J"
+
+
+def move_to(row: int) -> str:
+    """Cursor to the start of a 1-based screen row"""
+    return f"{CSI}{row};1H"
+
+
+class FrameRenderer:
+    """Draws whole frames in place, rewriting only the lines that changed
+
+    The previous frame is kept in memory. Each new frame is compared line
+    by line, and the changed lines are sent with cursor moves in a single
+    write, so nothing scrolls and unchanged lines never flicker.
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None):
+        # None means sys.stdout, looked up per frame so redirects still work
+        self.stream = stream
+        self._previous: Optional[List[str]] = None
+        self.frames = 0
+        self.lines_written = 0
+
+    def invalidate(self) -> None:
+        """Repaint the whole screen on the next frame
+
+        Call this after anything else writes to the terminal.
+        """
+        self._previous = None
+
+    def _changed(self, lines: Sequence[str]) -> List[int]:
+        previous = self._previous
+        if previous is None:
+            return list(range(len(lines)))
+        return [i for i, line in enumerate(lines) if i >= len(previous) or previous[i] != line]
+
+    def compose(self, lines: Sequence[str], changed: Optional[List[int]] = None) -> str:
+        """Escape sequence that turns the previous frame into `lines`"""
+        if changed is None:
+            changed = self._changed(lines)
+        previous = self._previous
+        parts = [CURSOR_HOME + CLEAR_SCREEN] if previous is None else []
+        for i in changed:
+            parts.append(f"{move_to(i + 1)}{lines[i]}{CLEAR_LINE_END}")
+        # Park the cursor below the frame and wipe whatever was printed
+        # there since the last frame (or the tail of a longer frame)
+        parts.append(move_to(len(lines) + 1) + CLEAR_BELOW)
+        return "".join(parts)
+
+    def render(self, lines: Sequence[str]) -> int:
+        """Draw a frame; returns how many lines were rewritten"""
+        lines = list(lines)
+        changed = self._changed(lines)
+        output = self.compose(lines, changed)
+        self._previous = lines
+        self.frames += 1
+        self.lines_written += len(changed)
+        stream = self.stream or sys.stdout
+        stream.write(output)
+        stream.flush()
+        return len(changed)
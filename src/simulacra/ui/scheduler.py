@@ -0,0 +1,169 @@
+# scheduler.py
+
+from typing import Callable, Generic, Optional, TypeVar
+from dataclasses import dataclass
+import threading
+import time
+
+from modules.logger import logger
+from modules.metrics import Counter, Histogram
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class RenderStats:
+    """Frame statistics since the scheduler started"""
+    frames_rendered: int
+    frames_dropped: int      # snapshots replaced before they were drawn
+    frames_late: int         # frames that overran the frame budget
+    last_frame_time: float   # seconds
+    avg_frame_time: float
+    max_frame_time: float
+
+
+class RenderScheduler(Generic[T]):
+    """Draws the latest submitted snapshot at a target frame rate
+
+    The simulation calls submit() as often as it likes and never waits on
+    the terminal. A render thread wakes once per frame and draws only the
+    newest snapshot; any snapshot replaced before its frame came up is
+    counted as dropped.
+
+    While `animating()` is true the last snapshot is redrawn every frame,
+    so timed effects keep moving between simulation ticks.
+
+    Frame times and dropped snapshots are also reported to `frame_seconds`
+    and `frames_dropped` when given, so each screen owns its own metrics.
+    """
+
+    def __init__(self, render: Callable[[T], None], fps: float = 10.0,
+                 animating: Optional[Callable[[], bool]] = None,
+                 frame_seconds: Optional[Histogram] = None,
+                 frames_dropped: Optional[Counter] = None):
+        if fps <= 0:
+            raise ValueError("fps must be positive")
+        self.render = render
+        self.interval = 1.0 / fps
+        self.animating = animating
+        self.frame_seconds = frame_seconds
+        self.frames_dropped = frames_dropped
+        self._latest: Optional[T] = None
+        self._current: Optional[T] = None
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self._rendered = 0
+        self._dropped = 0
+        self._late = 0
+        self._last_time = 0.0
+        self._total_time = 0.0
+        self._max_time = 0.0
+
+    def start(self) -> "RenderScheduler[T]":
+        with self._cond:
+            if self._running:
+                return self
+            self._running = True
+        self._thread = threading.Thread(target=self._run, name="hud-render", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, flush: bool = True) -> None:
+        """Stop the render thread; with flush, draw the last pending snapshot"""
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if flush:
+            with self._cond:
+                snapshot, self._latest = self._latest, None
+            if snapshot is not None:
+                self._draw(snapshot)
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """Block until `animating()` turns false; False if the timeout ran out
+
+        The render thread keeps drawing meanwhile, so this is how a caller
+        lets a closing animation finish before stop().
+        """
+        if self.animating is None:
+            return True
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self.animating():
+                wait = self.interval
+                if deadline is not None:
+                    wait = min(wait, deadline - time.monotonic())
+                    if wait <= 0:
+                        return False
+                self._cond.wait(wait)
+        return True
+
+    def submit(self, snapshot: T) -> None:
+        with self._cond:
+            if self._latest is not None:
+                self._dropped += 1
+                if self.frames_dropped is not None:
+                    self.frames_dropped.inc()
+            self._latest = snapshot
+            self._cond.notify()
+
+    def stats(self) -> RenderStats:
+        with self._cond:
+            rendered = self._rendered
+            return RenderStats(rendered, self._dropped, self._late, self._last_time,
+                               self._total_time / rendered if rendered else 0.0,
+                               self._max_time)
+
+    def _draw(self, snapshot: T) -> None:
+        start = time.perf_counter()
+        try:
+            self.render(snapshot)
+        except Exception as e:
+            logger.error("HUD render failed: %s", e)
+        elapsed = time.perf_counter() - start
+        if self.frame_seconds is not None:
+            self.frame_seconds.observe(elapsed)
+        with self._cond:
+            self._rendered += 1
+            self._last_time = elapsed
+            self._total_time += elapsed
+            self._max_time = max(self._max_time, elapsed)
+            if elapsed > self.interval:
+                self._late += 1
+
+    def _redraw_due(self) -> bool:
+        return (self.animating is not None and self._current is not None
+                and self.animating())
+
+    def _run(self) -> None:
+        next_frame = time.monotonic()
+        while True:
+            with self._cond:
+                # Sleep until there is something new and its frame is due
+                while self._running:
+                    if self._latest is None and not self._redraw_due():
+                        # Animations change with time, not with submits: poll
+                        self._cond.wait(None if self.animating is None else self.interval)
+                        continue
+                    delay = next_frame - time.monotonic()
+                    if delay <= 0:
+                        break
+                    self._cond.wait(delay)
+                if not self._running:
+                    return
+                if self._latest is not None:
+                    self._current, self._latest = self._latest, None
+                snapshot = self._current
+            self._draw(snapshot)
+            # A slow frame pushes the schedule back instead of bunching up
+            next_frame = max(next_frame + self.interval, time.monotonic())
+
+    def __enter__(self) -> "RenderScheduler[T]":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
@@ -1,7 +1,13 @@
-import winsound
 from typing import Dict, Optional
 from pathlib import Path
 
+from modules.lazy_import import lazy_import
+
+try:
+    winsound = lazy_import("winsound")
+except ImportError:  # winsound only exists on Windows
+    winsound = None
+
 
 class SoundManager:
     """Manages game sound effects"""
@@ -18,5 +24,5 @@ class SoundManager:
     def play(cls, sound_id: str) -> None:
         """Play a sound effect if available"""
         sound_path = Path(__file__).parent / 'sounds' / cls.SOUNDS.get(sound_id, '')
-        if sound_path.exists():
+        if winsound is not None and sound_path.exists():
             winsound.PlaySound(str(sound_path), winsound.SND_ASYNC)
@@ -0,0 +1,49 @@
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+
+# Cumulative import time of launcher.py under -X importtime, in milliseconds.
+# Override on slow machines with SIMULACRA_IMPORT_BUDGET_MS.
+IMPORT_BUDGET_MS = float(os.environ.get("SIMULACRA_IMPORT_BUDGET_MS", 300))
+
+# Must not load before the menu is shown
+HEAVY_MODULES = ("numpy", "msgpack", "zstandard", "lz4.frame", "orjson", "aiofiles", "asyncio")
+
+IMPORT_LINE = re.compile(r"^import time:\s*(\d+)\s*\|\s*(\d+)\s*\|\s*(\S.*)$")
+
+
+def _python(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, *args], cwd=ROOT, capture_output=True, text=True,
+                          timeout=60)
+
+
+def _import_time_ms(module: str) -> float:
+    result = _python("-X", "importtime", "-c", f"import {module}")
+    assert result.returncode == 0, result.stderr
+    for line in result.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if match and match.group(3).strip() == module:
+            return int(match.group(2)) / 1000
+    raise AssertionError(f"{module} missing from -X importtime output")
+
+
+@pytest.mark.benchmark(group="startup")
+class TestStartup:
+    def test_heavy_dependencies_stay_unloaded(self):
+        check = ("import launcher\n"
+                 "from modules.lazy_import import is_loaded\n"
+                 f"print([name for name in {HEAVY_MODULES!r} if is_loaded(name)])")
+        result = _python("-c", check)
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip().splitlines()[-1] == "[]"
+
+    def test_cold_start_within_budget(self):
+        _import_time_ms("launcher")  # warm the bytecode cache
+        best = min(_import_time_ms("launcher") for _ in range(3))
+        assert best <= IMPORT_BUDGET_MS, (
+            f"launcher import took {best:.0f}ms, budget {IMPORT_BUDGET_MS:.0f}ms")
@@ -4,7 +4,9 @@ import tempfile
 import shutil
 from io import StringIO
 import sys
+import time
 from modules.achievements import Achievement, AchievementManager, AchievementCategory
+from modules.achievement_rules import AchievementRule, CompiledRules
 
 class TestAchievements:
     @pytest.fixture
@@ -74,6 +76,7 @@ class TestAchievements:
             category=AchievementCategory.SURVIVAL
         )
         achievement_manager.unlock("test_save")
+        achievement_manager.flush()
 
         # Create new manager instance to test loading
         AchievementManager.ACHIEVEMENTS_PATH = temp_dir / "achievements.json"
@@ -187,4 +190,183 @@ class TestAchievements:
         assert achievement.is_unlocked()
 
         # Test update on non-existent achievement
-        achievement_manager.update_progress("non_existent", 1)
\ No newline at end of file
+        achievement_manager.update_progress("non_existent", 1)
+
+    def test_rule_based_unlock(self, achievement_manager):
+        """Declarative rules unlock only when satisfied"""
+        achievement_manager.achievements.update({
+            "long_run": Achievement(
+                id="long_run", name="Long Run", description="Survive 5 minutes",
+                category=AchievementCategory.SURVIVAL,
+                rule=AchievementRule("survival_seconds", ">=", 300)
+            ),
+            "glass": Achievement(
+                id="glass", name="Glass", description="Finish with max HP under 50",
+                category=AchievementCategory.SPECIAL,
+                rule=AchievementRule("max_hp", "<", 50)
+            )
+        })
+
+        unlocked = achievement_manager.check_run_achievements(
+            {"survival_seconds": 320, "max_hp": 120, "total_runs": 1})
+        assert unlocked == {"long_run", "first_run"}
+        assert not achievement_manager.achievements["glass"].is_unlocked()
+
+        # Already unlocked achievements are not reported again
+        assert achievement_manager.check_run_achievements({"survival_seconds": 400}) == set()
+
+    def test_rule_persistence(self, achievement_manager, temp_dir):
+        """Rules survive a save/load round trip"""
+        achievement_manager.achievements["ruled"] = Achievement(
+            id="ruled", name="Ruled", description="",
+            category=AchievementCategory.MUTATION,
+            rule=AchievementRule("mutations", ">=", 3)
+        )
+        achievement_manager._save_achievements()
+
+        new_manager = AchievementManager()
+        assert new_manager.achievements["ruled"].rule == AchievementRule("mutations", ">=", 3)
+
+    def test_invalid_comparator(self):
+        with pytest.raises(ValueError):
+            AchievementRule("health", "=>", 10)
+
+    def test_missing_stats_never_match(self):
+        rules = CompiledRules([AchievementRule("hp", "!=", 0), None])
+        assert not rules.evaluate({}).any()
+        assert rules.evaluate({"hp": 5}).tolist() == [True, False]
+
+    def test_large_catalog_check(self, achievement_manager):
+        """A check over 1e5 definitions is a handful of array operations"""
+        count = 100_000
+        achievement_manager.achievements = {
+            f"ach_{i}": Achievement(
+                id=f"ach_{i}", name=f"Achievement {i}", description="",
+                category=AchievementCategory.SURVIVAL,
+                rule=AchievementRule(f"stat_{i % 50}", ">=", float(i % 1000))
+            )
+            for i in range(count)
+        }
+        achievement_manager._update_caches()
+
+        stats = {f"stat_{i}": 499.0 for i in range(50)}
+        start = time.perf_counter()
+        to_unlock = achievement_manager._batch_check_achievements(stats)
+        elapsed = time.perf_counter() - start
+
+        assert len(to_unlock) == count // 2
+        assert elapsed < 0.5
+
+    def test_apply_progress_write_behind(self, achievement_manager, monkeypatch):
+        """Bulk progress stays in memory until a single flush"""
+        for i in range(20):
+            achievement_manager.achievements[f"p{i}"] = Achievement(
+                id=f"p{i}", name=f"P{i}", description="",
+                category=AchievementCategory.COLLECTION, max_progress=2
+            )
+        saves = []
+        original_save = achievement_manager._save_achievements
+        monkeypatch.setattr(achievement_manager, "_save_achievements",
+                            lambda **kwargs: saves.append(1) or original_save(**kwargs))
+
+        unlocked = achievement_manager.apply_progress({f"p{i}": 2 for i in range(20)})
+        assert len(unlocked) == 20
+        assert saves == []
+
+        assert achievement_manager.flush()
+        assert len(saves) == 1
+        assert not achievement_manager.flush()  # Nothing left to write
+
+        reloaded = AchievementManager()
+        assert all(reloaded.achievements[f"p{i}"].is_unlocked() for i in range(20))
+
+    def test_flush_interval(self, temp_dir):
+        """Progress is flushed once the interval has elapsed"""
+        AchievementManager.ACHIEVEMENTS_PATH = temp_dir / "achievements.json"
+        manager = AchievementManager(flush_interval=0)
+        manager.achievements["p"] = Achievement(
+            id="p", name="P", description="", category=AchievementCategory.COLLECTION,
+            max_progress=5
+        )
+        manager.apply_progress({"p": 1})
+        assert not manager._dirty
+        assert AchievementManager().achievements["p"].progress == 1
+
+    def test_incremental_evaluation(self, achievement_manager, monkeypatch):
+        """Only achievements depending on a changed stat are re-evaluated"""
+        achievement_manager.achievements = {
+            f"ach_{i}": Achievement(
+                id=f"ach_{i}", name=f"A{i}", description="",
+                category=AchievementCategory.SURVIVAL,
+                rule=AchievementRule(f"stat_{i % 100}", ">=", 10)
+            )
+            for i in range(10_000)
+        }
+        achievement_manager._update_caches()
+        achievement_manager.update_stats({f"stat_{i}": 0 for i in range(100)})
+
+        evaluated = []
+        original = CompiledRules.evaluate_rows
+        monkeypatch.setattr(CompiledRules, "evaluate_rows",
+                            lambda self, vector, rows: evaluated.append(len(rows)) or original(self, vector, rows))
+
+        unlocked = achievement_manager.update_stats({"stat_7": 12, "stat_8": 0})
+        assert evaluated == [100]  # stat_8 did not change
+        assert len(unlocked) == 100
+        assert all(achievement_manager.achievements[aid].is_unlocked() for aid in unlocked)
+
+        # Unchanged stats cost nothing
+        evaluated.clear()
+        assert achievement_manager.update_stats({"stat_7": 12}) == set()
+        assert evaluated == []
+
+    def test_declared_dependencies(self, achievement_manager):
+        """Extra declared keys also trigger re-evaluation"""
+        achievement = Achievement(
+            id="combo", name="Combo", description="", category=AchievementCategory.SPECIAL,
+            rule=AchievementRule("score", ">=", 5), depends_on=["combo_meter"]
+        )
+        assert achievement.dependencies() == ("score", "combo_meter")
+        achievement_manager.achievements["combo"] = achievement
+        achievement_manager._update_caches()
+
+        assert achievement_manager.update_stats({"score": 2}) == set()
+        assert achievement_manager._index["combo"] in achievement_manager._dependents["combo_meter"]
+
+    def test_stats_survive_rebuild(self, achievement_manager):
+        """Stats reported before a catalog rebuild still count afterwards"""
+        assert achievement_manager.update_stats({"score": 6, "level": 1}) == set()
+        for aid in ("pair", "extra"):
+            achievement_manager.achievements[aid] = Achievement(
+                id=aid, name=aid.title(), description="", category=AchievementCategory.SPECIAL,
+                rule=AchievementRule("score", ">=", 5), depends_on=["level"]
+            )
+
+        # Unlocking an unindexed achievement rebuilds the arrays
+        achievement_manager.unlock("extra")
+        assert achievement_manager.update_stats({"level": 2}) == {"pair"}
+
+    def test_rebuild_reevaluates_locked_rows(self, achievement_manager):
+        """A rule added after its stat was reported is satisfied on rebuild"""
+        achievement_manager.update_stats({"depth": 12})
+        achievement_manager.achievements["deep"] = Achievement(
+            id="deep", name="Deep", description="", category=AchievementCategory.SPECIAL,
+            rule=AchievementRule("depth", ">=", 10)
+        )
+        achievement_manager._update_caches()
+        assert achievement_manager.update_stats({}) == {"deep"}
+
+    def test_legacy_first_run_gets_rule(self, temp_dir):
+        """Saves written before rules existed still unlock first_run"""
+        import json
+        path = temp_dir / "achievements.json"
+        path.write_text(json.dumps({"first_run": {
+            "id": "first_run", "name": "First Steps", "description": "Complete your first run",
+            "category": "SPECIAL", "unlocked": False, "hidden": False, "unlock_date": None,
+            "progress": 0, "max_progress": 1
+        }}))
+        AchievementManager.ACHIEVEMENTS_PATH = path
+        manager = AchievementManager()
+
+        assert manager.achievements["first_run"].rule == AchievementRule("total_runs", ">=", 1)
+        assert manager.check_run_achievements({"total_runs": 1}) == {"first_run"}
@@ -0,0 +1,79 @@
+import io
+import time
+import pytest
+from simulacra.ui.animations import Animation, Animator, Blink, Flash, Typewriter
+from simulacra.ui.hud import HUDManager
+from simulacra.ui.renderer import FrameRenderer
+from simulacra.ui.scheduler import RenderScheduler
+
+
+class TestAnimations:
+    def test_flash_shows_until_duration(self):
+        flash = Flash("HIT", "", 0.5, reset="", start=10.0)
+        assert flash.lines(10.2) == ["HIT"]
+        assert flash.lines(10.5) == []
+        assert flash.done(10.5)
+
+    def test_blink_keeps_its_line(self):
+        blink = Blink("WARN", "", blinks=3, period=0.4, reset="", start=0.0)
+        assert blink.lines(0.1) == ["WARN"]
+        assert blink.lines(0.3) == [""]
+        assert blink.lines(0.9) == ["WARN"]
+        assert blink.lines(1.3) == []
+
+    def test_typewriter_reveals_over_time(self):
+        writer = Typewriter("ab\ncd", "", 0.1, reset="", start=0.0)
+        assert writer.lines(0.0) == [""]
+        assert writer.lines(0.25) == ["ab"]
+        assert writer.lines(0.45) == ["ab", "c"]
+        assert writer.lines(5.0) == ["ab", "cd"]
+
+    def test_animation_requires_lines(self):
+        with pytest.raises(TypeError):
+            Animation(1.0)
+
+    def test_animator_drops_finished(self):
+        animator = Animator()
+        animator.add(Flash("short", "", 0.1, reset="", start=0.0))
+        animator.add(Flash("long", "", 1.0, reset="", start=0.0))
+        assert animator.lines(0.05) == ["short", "long"]
+        assert animator.lines(0.5) == ["long"]
+        assert animator.lines(2.0) == []
+        assert not animator.active
+
+    def test_scheduler_redraws_while_animating(self):
+        animator = Animator()
+        drawn = []
+        scheduler = RenderScheduler(lambda snapshot: drawn.append(animator.lines()), fps=50,
+                                    animating=lambda: animator.active).start()
+        animator.add(Flash("HIT", "", 0.2, reset=""))
+        scheduler.submit("tick")
+        time.sleep(0.4)
+        scheduler.stop()
+
+        # One submit, but the flash kept the frames coming until it ended
+        assert len(drawn) > 3
+        assert drawn[0] == ["HIT"]
+        assert drawn[-1] == []
+
+    def test_game_over_plays_on_scheduler(self, monkeypatch):
+        """show_game_over returns at once; the scheduler types it out"""
+        stream = io.StringIO()
+        monkeypatch.setattr(HUDManager, "renderer", FrameRenderer(stream))
+        monkeypatch.setattr(HUDManager, "animations", Animator())
+        monkeypatch.setattr(HUDManager.anim, "GAME_OVER_DELAY", 0.002)
+        scheduler = RenderScheduler(HUDManager.draw, fps=100,
+                                    animating=lambda: HUDManager.animations.active).start()
+
+        started = time.monotonic()
+        HUDManager.show_game_over(75, [], 100.0, 4.5)
+        assert time.monotonic() - started < 0.05
+        scheduler.submit("final tick")
+        assert scheduler.wait_idle(timeout=5)
+        scheduler.stop()
+        HUDManager.clear_overlay()
+
+        output = stream.getvalue()
+        assert "GAME OVER" in output
+        assert "Survival Time: 1m 15s" in output
+        assert scheduler.stats().frames_rendered > 3
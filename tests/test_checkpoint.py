@@ -0,0 +1,81 @@
+import pytest
+from pathlib import Path
+import tempfile
+import shutil
+from modules.checkpoint import BASE_FILE, Checkpointer
+from modules.storage import storage
+
+
+class TestCheckpointer:
+    @pytest.fixture
+    def checkpoint_dir(self):
+        path = Path(tempfile.mkdtemp())
+        yield path
+        storage.commit()
+        shutil.rmtree(path)
+
+    def state(self, hp: float, log_size: int = 1000) -> dict:
+        return {"stats": {"hp": hp}, "log": list(range(log_size))}
+
+    def test_deltas_contain_only_changes(self, checkpoint_dir):
+        checkpoints = Checkpointer(checkpoint_dir, base_interval=5)
+        assert checkpoints.save(self.state(100))
+        assert checkpoints.save(self.state(90))
+        storage.commit()
+
+        base = (checkpoint_dir / BASE_FILE).stat().st_size
+        delta = (checkpoint_dir / "delta_00000002.lz4").stat().st_size
+        assert delta < base
+        assert checkpoints._read_frame(storage.read(checkpoint_dir / "delta_00000002.lz4"))["sections"] \
+            == {"stats": {"hp": 90}}
+
+    def test_unchanged_state_skips_write(self, checkpoint_dir):
+        checkpoints = Checkpointer(checkpoint_dir)
+        checkpoints.save(self.state(100))
+        assert not checkpoints.save(self.state(100))
+        assert checkpoints.seq == 1
+
+    def test_replay_base_and_deltas(self, checkpoint_dir):
+        checkpoints = Checkpointer(checkpoint_dir, base_interval=4)
+        for hp in range(100, 90, -1):
+            checkpoints.save({**self.state(hp), "extra": hp} if hp % 2 else self.state(hp))
+
+        restored = Checkpointer(checkpoint_dir).load()
+        assert restored == self.state(91) | {"extra": 91}
+
+        # Removed sections stay removed after replay
+        checkpoints.save(self.state(50))
+        assert Checkpointer(checkpoint_dir).load() == self.state(50)
+
+    def test_base_every_k_saves(self, checkpoint_dir):
+        checkpoints = Checkpointer(checkpoint_dir, base_interval=3)
+        for hp in range(7):
+            checkpoints.save(self.state(hp))
+        storage.commit()
+        # Saves 1, 4 and 7 are bases, and each base clears the deltas before it
+        assert checkpoints.base_seq == 7
+        assert not list(checkpoint_dir.glob("delta_*.lz4"))
+
+    def test_stale_chain_ignored(self, checkpoint_dir):
+        """Deltas from an older chain are never applied to a newer base"""
+        old = Checkpointer(checkpoint_dir, base_interval=10)
+        old.save(self.state(1))
+        old.save(self.state(2))
+        storage.commit()
+        stale = (checkpoint_dir / "delta_00000002.lz4").read_bytes()
+
+        new = Checkpointer(checkpoint_dir, base_interval=10)
+        new.save(self.state(3, log_size=5))
+        (checkpoint_dir / "delta_00000002.lz4").write_bytes(stale)
+        assert Checkpointer(checkpoint_dir).load() == self.state(3, log_size=5)
+
+    def test_resume_numbering_after_load(self, checkpoint_dir):
+        first = Checkpointer(checkpoint_dir, base_interval=10)
+        first.save(self.state(1))
+        first.save(self.state(2))
+
+        resumed = Checkpointer(checkpoint_dir, base_interval=10)
+        resumed.load()
+        assert resumed.seq == 2
+        resumed.save(self.state(3))
+        assert Checkpointer(checkpoint_dir).load() == self.state(3)
@@ -21,7 +21,7 @@ class TestConfigManager:
         assert isinstance(config, GameConfig)
         assert config.trait_slots == 3
         assert config.reflection_points == 0
-        assert isinstance(config.unlocked_themes, list)
+        assert isinstance(config.unlocked_themes, tuple)
 
     def test_save_config(self, config_manager: ConfigurationManager):
         """Test config saving and reloading"""
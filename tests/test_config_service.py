@@ -0,0 +1,105 @@
+import pytest
+from pathlib import Path
+from dataclasses import FrozenInstanceError, asdict, replace
+import tempfile
+import shutil
+import json
+import os
+from modules.config_manager import ConfigurationManager, GameConfig
+from modules.config_service import ConfigService
+from modules.player import PlayerConfig, PlayerManager
+from modules.storage import storage
+
+
+class TestConfigService:
+    @pytest.fixture
+    def config_dir(self):
+        path = Path(tempfile.mkdtemp())
+        yield path
+        storage.commit()
+        shutil.rmtree(path)
+
+    def document(self, service: ConfigService, path: Path):
+        return service.document(path, GameConfig.from_dict, asdict, GameConfig,
+                                backup_path=path.with_suffix(".backup"))
+
+    def test_loads_once_until_file_changes(self, config_dir):
+        path = config_dir / "game_config.json"
+        path.write_text(json.dumps({"trait_slots": 4}))
+        doc = self.document(ConfigService(), path)
+        assert doc.get().trait_slots == 4
+        assert doc.get() is doc.get()
+        assert doc.loads == 1
+
+        path.write_text(json.dumps({"trait_slots": 6, "rp": 10}))
+        os.utime(path, ns=(1, 1))
+        assert doc.get().trait_slots == 6
+        assert doc.get().reflection_points == 10
+        assert doc.loads == 2
+
+    def test_missing_file_written_with_defaults(self, config_dir):
+        path = config_dir / "game_config.json"
+        doc = self.document(ConfigService(), path)
+        assert doc.get() == GameConfig()
+        storage.commit()
+        assert GameConfig.from_dict(json.loads(path.read_text())) == GameConfig()
+
+    def test_snapshots_are_immutable(self, config_dir):
+        doc = self.document(ConfigService(), config_dir / "game_config.json")
+        with pytest.raises(FrozenInstanceError):
+            doc.get().trait_slots = 9
+
+    def test_snapshot_collections_are_immutable(self, config_dir):
+        doc = self.document(ConfigService(), config_dir / "game_config.json")
+        themes = ["dark"]
+        doc.set(GameConfig(unlocked_themes=themes))
+        themes.append("neon")
+        assert doc.get().unlocked_themes == ("dark",)
+        with pytest.raises(AttributeError):
+            doc.get().unlocked_themes.append("light")
+
+        flags = {"debug_mode": True}
+        config = PlayerConfig(dev_flags=flags)
+        flags["debug_mode"] = False
+        assert config.dev_flags == {"debug_mode": True, "mutation_log_visible": False}
+        with pytest.raises(TypeError):
+            config.dev_flags["debug_mode"] = False
+
+    def test_update_stores_a_copy(self, config_dir):
+        service = ConfigService()
+        doc = service.document(config_dir / "player_config.json", lambda data: PlayerConfig(**data),
+                               PlayerConfig.to_dict, PlayerConfig)
+        toggled = doc.update(PlayerManager.toggle_debug_mode)
+        assert toggled.dev_flags["debug_mode"] is True
+        assert doc.get() is toggled
+        storage.commit()
+        saved = json.loads((config_dir / "player_config.json").read_text())
+        assert saved["dev_flags"]["debug_mode"] is True
+        assert PlayerManager.unlock_theme(toggled, "neon").unlocked_themes == ("neon",)
+
+    def test_changes_batched_into_one_commit(self, config_dir):
+        path = config_dir / "game_config.json"
+        doc = self.document(ConfigService(), path)
+        storage.commit()
+        commits = storage.commits
+        for _ in range(5):
+            doc.update(lambda c: replace(c, reflection_points=c.reflection_points + 1))
+        assert doc.get().reflection_points == 5
+        assert not path.exists()
+
+        storage.commit()
+        assert storage.commits == commits + 1
+        assert json.loads(path.read_text())["reflection_points"] == 5
+        assert json.loads(path.with_suffix(".backup").read_text())["reflection_points"] == 5
+
+    def test_corrupt_file_falls_back_to_backup(self, config_dir):
+        path = config_dir / "game_config.json"
+        path.write_text("{not json")
+        path.with_suffix(".backup").write_text(json.dumps({"trait_slots": 2}))
+        assert self.document(ConfigService(), path).get().trait_slots == 2
+
+    def test_managers_share_one_document(self, config_dir):
+        path = config_dir / "game_config.json"
+        ConfigurationManager(path).save(GameConfig(trait_slots=8))
+        assert ConfigurationManager(path).load_config().trait_slots == 8
+        assert ConfigurationManager(path).document is ConfigurationManager(path).document
@@ -0,0 +1,50 @@
+import io
+import queue
+import re
+import threading
+from simulacra.ui.dashboard import CELL_WIDTH, RunSnapshot, SpectatorDashboard
+
+ANSI = re.compile(r"\x1b\[[0-9;]*[A-Za-z]")
+
+
+def plain(lines):
+    return [ANSI.sub("", line) for line in lines]
+
+
+class TestSpectatorDashboard:
+    def test_runs_laid_out_side_by_side(self):
+        dashboard = SpectatorDashboard(columns=2, stream=io.StringIO())
+        runs = [RunSnapshot(f"run-{i}", 80.0, 100.0, 1.5, 65, disasters=i, last_disaster="fire")
+                for i in range(3)]
+        runs.append(RunSnapshot("run-3", 0.0, 100.0, 4.0, 200, alive=False))
+        lines = plain(dashboard.build_frame(runs))
+
+        assert lines[0] == "SIMULACRA SPECTATOR — 4 runs, 3 alive"
+        # Two rows of cells, three lines each, each followed by a blank line
+        assert len(lines) == 2 + 2 * 4
+        assert lines[2].startswith("run-0 1m05s") and "run-1 1m05s" in lines[2]
+        assert lines[3].startswith("HP  80.0/100.0")
+        assert lines[4].startswith("EN 1.5/s  DIS 0 fire")
+        assert lines[6].startswith("run-2") and "COLLAPSED" in lines[7]
+        assert all(len(line) <= 2 * CELL_WIDTH + 2 for line in lines)
+
+    def test_updates_from_threads_and_queues(self):
+        stream = io.StringIO()
+        dashboard = SpectatorDashboard(fps=100, columns=4, stream=stream).start()
+        workers = [threading.Thread(target=lambda i=i: [
+            dashboard.update(RunSnapshot(f"run-{i}", 100.0 - t, 100.0, 1.0, t)) for t in range(50)])
+            for i in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        snapshots: "queue.Queue[RunSnapshot]" = queue.Queue()
+        snapshots.put(RunSnapshot("run-9", 10.0, 100.0, 3.0, 99))
+        assert dashboard.drain(snapshots) == 1
+        dashboard.stop()
+
+        final = plain(dashboard.build_frame(tuple(dashboard._runs.values())))
+        assert final[0].startswith("SIMULACRA SPECTATOR — 5 runs")
+        assert "HP  51.0/100.0" in final[3]
+        assert dashboard.scheduler.stats().frames_rendered < 4 * 50
+        assert "run-9" in stream.getvalue()
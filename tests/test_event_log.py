@@ -0,0 +1,57 @@
+import pytest
+import numpy as np
+from modules.event_log import (EVENT_DTYPE, EventRecorder, EventType, disaster_type_id,
+                               disaster_type_name, read_events)
+
+
+class TestEventLog:
+    def test_records_readable_with_fromfile(self, tmp_path):
+        path = tmp_path / "run.events"
+        with EventRecorder(path) as events:
+            events.mutation(3, 95.0)
+            events.disaster(10, "Fire", 12.5, 82.5)
+            events.record(20, EventType.IMMUNE, hp_after=80.0, disaster_type="void")
+
+        data = np.fromfile(path, dtype=EVENT_DTYPE)
+        assert EVENT_DTYPE.itemsize == 16
+        assert data["tick"].tolist() == [3, 10, 20]
+        assert data["event"].tolist() == [EventType.MUTATION, EventType.DISASTER, EventType.IMMUNE]
+        assert disaster_type_name(data["disaster_type"][1]) == "fire"
+        assert data["damage"][1] == pytest.approx(12.5)
+        assert data["hp_after"][1] == pytest.approx(82.5)
+
+    def test_buffer_flushes_in_blocks(self, tmp_path):
+        path = tmp_path / "run.events"
+        events = EventRecorder(path, buffer_size=4)
+        for tick in range(10):
+            events.mutation(tick, 100.0)
+        assert len(read_events(path)) == 8
+        events.close()
+        assert read_events(path)["tick"].tolist() == list(range(10))
+
+    def test_interval_flush(self, tmp_path):
+        """Events reach the file once the flush interval has passed"""
+        path = tmp_path / "run.events"
+        events = EventRecorder(path, flush_interval=0.0)
+        events.mutation(1, 99.0)
+        assert read_events(path)["tick"].tolist() == [1]
+        events.close()
+
+    def test_run_files_are_unique(self, tmp_path):
+        first, second = EventRecorder.for_run(tmp_path), EventRecorder.for_run(tmp_path)
+        assert first.path != second.path
+        first.close()
+        second.close()
+
+    def test_torn_tail_ignored(self, tmp_path):
+        path = tmp_path / "run.events"
+        with EventRecorder(path) as events:
+            events.disaster(1, "data", 5.0, 95.0)
+        with open(path, "ab") as f:
+            f.write(b"\x01\x02\x03")
+        assert len(read_events(path)) == 1
+
+    def test_disaster_type_ids(self):
+        assert disaster_type_id(None) == 0
+        assert disaster_type_id("Radiation") == disaster_type_id("radiation") > 0
+        assert disaster_type_name(disaster_type_id("unheard of")) == "other"
@@ -0,0 +1,110 @@
+import pytest
+from pathlib import Path
+import tempfile
+import shutil
+import json
+import os
+from modules import highlights as highlights_module
+from modules.highlight_ring import HEADER_SIZE, HighlightRing, open_ring
+from modules.highlights import HighlightManager, render_highlight
+
+
+def make_record(i: int) -> dict:
+    return {"timestamp": f"2025-05-03T15:00:{i % 60:02d}", "survival_time": i}
+
+
+class TestHighlightRing:
+    @pytest.fixture
+    def ring_dir(self):
+        path = Path(tempfile.mkdtemp())
+        yield path
+        shutil.rmtree(path)
+
+    def test_wraps_and_keeps_newest(self, ring_dir):
+        ring = HighlightRing(ring_dir / "h.ring", slots=5, slot_size=512)
+        for i in range(12):
+            ring.append(make_record(i))
+        assert len(ring) == 5
+        assert [r["survival_time"] for r in ring.records()] == [11, 10, 9, 8, 7]
+        assert [r["survival_time"] for r in ring.records(limit=2)] == [11, 10]
+        # The file never grows past its preallocated slots
+        assert (ring_dir / "h.ring").stat().st_size == HEADER_SIZE + 5 * 512
+
+    def test_reopen_restores_head(self, ring_dir):
+        ring = HighlightRing(ring_dir / "h.ring", slots=4, slot_size=512)
+        ring.extend(make_record(i) for i in range(6))
+        reopened = HighlightRing(ring_dir / "h.ring")
+        assert (reopened.slots, reopened.head, len(reopened)) == (4, 2, 4)
+        reopened.append(make_record(6))
+        assert reopened.records(1)[0]["survival_time"] == 6
+
+    def test_instances_share_head(self, ring_dir):
+        """Two instances on one file see each other's appends"""
+        first = HighlightRing(ring_dir / "h.ring", slots=4, slot_size=512)
+        second = HighlightRing(ring_dir / "h.ring")
+        first.append(make_record(0))
+        second.append(make_record(1))
+        first.append(make_record(2))
+        assert [r["survival_time"] for r in second.records()] == [2, 1, 0]
+        assert len(first) == 3
+
+    def test_damaged_slot_skipped(self, ring_dir):
+        ring = HighlightRing(ring_dir / "h.ring", slots=3, slot_size=512)
+        ring.extend(make_record(i) for i in range(3))
+        with open(ring_dir / "h.ring", "r+b") as f:
+            f.seek(HEADER_SIZE + 512 + 10)
+            f.write(b"\xff\xff")
+        assert [r["survival_time"] for r in ring.records()] == [2, 0]
+
+    def test_oversized_record_rejected(self, ring_dir):
+        ring = HighlightRing(ring_dir / "h.ring", slots=2, slot_size=64)
+        with pytest.raises(ValueError):
+            # Lists can be trimmed, but not an incompressible scalar
+            ring.append({"blob": os.urandom(2048).hex(), "more": list(range(200))})
+
+    def test_long_record_trimmed_to_fit(self, ring_dir):
+        """A record bigger than a slot keeps its newest list entries"""
+        ring = HighlightRing(ring_dir / "h.ring", slots=2, slot_size=512)
+        mutations = [{"name": f"Mutation {i}", "effect": os.urandom(20).hex()} for i in range(100)]
+        record = {**make_record(1), "mutations": mutations}
+        assert len(ring.codec.encode(record)) > ring.capacity
+
+        ring.append(record)
+        stored = ring.records()[0]
+        assert stored["survival_time"] == 1
+        assert stored["mutations"]
+        assert stored["mutations"] == mutations[-len(stored["mutations"]):]
+
+    def test_legacy_json_imported_once(self, ring_dir):
+        legacy = ring_dir / "highlights.json"
+        legacy.write_text(json.dumps([make_record(i) for i in range(4)]))
+        ring = open_ring(ring_dir / "h.ring", legacy_json=legacy, slots=3)
+        assert [r["survival_time"] for r in ring.records()] == [3, 2, 1]
+        assert len(open_ring(ring_dir / "h.ring", legacy_json=legacy, slots=3)) == 3
+
+
+class TestHighlightManager:
+    @pytest.fixture
+    def manager(self, monkeypatch):
+        path = Path(tempfile.mkdtemp())
+        monkeypatch.setattr(highlights_module, "DATA_DIR", path)
+        yield HighlightManager()
+        shutil.rmtree(path)
+
+    def test_save_and_render(self, manager, monkeypatch):
+        stats = {"current_hp": 12.5, "max_hp": 100, "mutation_rate": 3.0,
+                 "resistances": {"Heat": 20}}
+        traits = [{"name": "Nullcore", "effects": [{"text": "+20% Resilience"}]}]
+        mutations = [{"name": "Regrowth", "effect": "+5% HP"}]
+        manager.save_highlight(stats, 75, mutations, traits)
+
+        # No text files are written; the report is rendered from the record
+        assert list(manager.highlights_dir.glob("*.txt")) == []
+        highlight = manager.get_highlights()[0]
+        text = render_highlight(highlight)
+        assert "Survival Time: 1m 15s" in text
+        assert "Nullcore (+20% Resilience)" in text
+        assert "Regrowth (+5% HP)" in text
+
+        monkeypatch.setattr("builtins.input", lambda _: "1")
+        manager.display_highlights()
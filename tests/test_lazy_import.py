@@ -0,0 +1,68 @@
+import sys
+import threading
+import pytest
+from modules.lazy_import import is_loaded, lazy_import
+
+
+@pytest.fixture
+def package(tmp_path, monkeypatch):
+    root = tmp_path / "lazy_pkg"
+    root.mkdir()
+    (root / "__init__.py").write_text("")
+    (root / "heavy.py").write_text("import sys\nsys.heavy_runs = getattr(sys, 'heavy_runs', 0) + 1\n"
+                                   "VALUE = 42\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield "lazy_pkg.heavy"
+    for name in ("lazy_pkg.heavy", "lazy_pkg"):
+        sys.modules.pop(name, None)
+    if hasattr(sys, "heavy_runs"):
+        del sys.heavy_runs
+
+
+class TestLazyImport:
+    def test_runs_on_first_attribute_access(self, package):
+        heavy = lazy_import(package)
+        assert not hasattr(sys, "heavy_runs")
+        assert not is_loaded(package)
+
+        assert heavy.VALUE == 42
+        assert sys.heavy_runs == 1
+        assert is_loaded(package)
+        assert lazy_import(package) is heavy
+        import lazy_pkg
+        assert lazy_pkg.heavy is heavy
+        assert sys.heavy_runs == 1
+
+    def test_missing_module_fails_at_import(self):
+        with pytest.raises(ImportError):
+            lazy_import("no_such_module_simulacra")
+        assert not is_loaded("no_such_module_simulacra")
+
+    def test_first_access_from_many_threads(self, package, tmp_path):
+        """Threads racing to load a module all wait for it to finish running"""
+        (tmp_path / "lazy_pkg" / "slow.py").write_text(
+            "import sys, time\nsys.slow_runs = getattr(sys, 'slow_runs', 0) + 1\n"
+            "time.sleep(0.2)\nVALUE = 42\n")
+        try:
+            slow = lazy_import("lazy_pkg.slow")
+            results, errors = [], []
+
+            def read():
+                try:
+                    results.append(slow.VALUE)
+                except Exception as e:
+                    errors.append(e)
+
+            threads = [threading.Thread(target=read) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            assert errors == []
+            assert results == [42] * 8
+            assert sys.slow_runs == 1
+        finally:
+            sys.modules.pop("lazy_pkg.slow", None)
+            if hasattr(sys, "slow_runs"):
+                del sys.slow_runs
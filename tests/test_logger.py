@@ -0,0 +1,132 @@
+import pytest
+from pathlib import Path
+import tempfile
+import shutil
+import threading
+import gzip
+import os
+from modules.logger import SimulacraLogger
+
+
+class TestSimulacraLogger:
+    @pytest.fixture
+    def log(self):
+        path = Path(tempfile.mkdtemp())
+        log = SimulacraLogger(path, name="simulacra.test")
+        log.configure()
+        yield log
+        log.close()
+        shutil.rmtree(path)
+
+    def test_handlers_run_on_listener_thread(self, log, monkeypatch):
+        threads = set()
+        for handler in log.handlers:
+            emit = handler.emit
+            monkeypatch.setattr(handler, "emit",
+                                lambda record, emit=emit: (threads.add(threading.get_ident()),
+                                                           emit(record)))
+        log.info("queued")
+        log.flush()
+        assert threads and threading.get_ident() not in threads
+
+    def test_run_log_receives_run_events_only(self, log):
+        log.info("not a run event")
+        log.mutation("Glass Bones", "rare", "shatters", 12)
+        log.disaster("Void Rift", "void", "tears reality", 20.0, 30)
+        log.flush()
+        lines = log.run_log.read_text(encoding="utf-8").splitlines()
+        assert "not a run event" not in lines
+        assert any("Glass Bones" in line for line in lines)
+        assert any("Void Rift" in line for line in lines)
+
+    def test_console_and_file_output(self, log, capsys):
+        log.warning("low hp")
+        log.flush()
+        assert "WARNING: low hp" in capsys.readouterr().out
+        assert "[WARNING] low hp" in log.main_log.read_text(encoding="utf-8")
+
+    def test_close_drains_queue(self, log):
+        for i in range(500):
+            log.mutation(f"M{i}", "common", "grows", i)
+        log.close()
+        assert "M499" in log.run_log.read_text(encoding="utf-8")
+
+    def test_logging_after_close_is_dropped(self, log):
+        log.mutation("Glass Bones", "rare", "shatters", 12)
+        log.close()
+        log.mutation("Late Bloom", "common", "grows", 13)
+        assert not log.configured
+        text = log.run_log.read_text(encoding="utf-8")
+        assert "Glass Bones" in text and "Late Bloom" not in text
+
+    def test_disabled_debug_never_formats(self, log):
+        log.set_debug(False)
+        calls = []
+        log.debug(lambda: calls.append("built") or "expensive")
+        log.debug("value %s", type("Loud", (), {"__str__": lambda self: calls.append("str") or "x"})())
+        log.flush()
+        assert calls == []
+
+    def test_deferred_arguments(self, log, capsys):
+        log.set_debug(True)
+        log.debug("hp %.1f of %d", 42.25, 100)
+        log.debug(lambda: "built lazily")
+        log.flush()
+        out = capsys.readouterr().out
+        assert "DEBUG: hp 42.2 of 100" in out
+        assert "DEBUG: built lazily" in out
+
+    def test_arguments_captured_when_logged(self, log, capsys, monkeypatch):
+        """Mutable arguments are formatted before the caller can change them"""
+        log.set_debug(True)
+        gate = threading.Event()
+        for handler in log.handlers:
+            emit = handler.emit
+            monkeypatch.setattr(handler, "emit",
+                                lambda record, emit=emit: (gate.wait(), emit(record)))
+        stats = {"hp": 10}
+        log.debug("Final stats: %s", stats)
+        stats["hp"] = 0
+        stats["mutations"] = 3
+        gate.set()
+        log.flush()
+        assert "DEBUG: Final stats: {'hp': 10}" in capsys.readouterr().out
+
+    def test_construction_creates_nothing(self, tmp_path):
+        log = SimulacraLogger(tmp_path / "logs", name="simulacra.lazy")
+        assert not (tmp_path / "logs").exists()
+        log.set_debug(False)
+        log.debug("disabled calls do not configure output")
+        assert not log.configured
+        log.info("first real record")
+        assert log.configured and log.run_log.exists()
+        log.close()
+
+    def test_run_log_is_per_process(self, log):
+        assert str(os.getpid()) in log.run_log.name
+
+    def test_rotated_logs_compressed_once(self, tmp_path):
+        log_dir = tmp_path / "logs"
+        log_dir.mkdir()
+        (log_dir / "simulacra.log.1").write_text("old main log")
+        (log_dir / "debug.log.2024-01-01").write_text("old debug log")
+        stale = log_dir / "current_run.99999999.log"
+        stale.write_text("old run")
+        os.utime(stale, (0, 0))
+        (log_dir / "current_run.12345678.log").write_text("live run")
+
+        log = SimulacraLogger(log_dir, name="simulacra.compress")
+        log.configure()
+        log.compressor.join()
+        names = sorted(p.name for p in log_dir.iterdir())
+        assert not any(n in names for n in ("simulacra.log.1", "debug.log.2024-01-01", stale.name))
+        assert "current_run.12345678.log" in names
+        gz = [n for n in names if n.endswith(".gz")]
+        assert len(gz) == 3
+        with gzip.open(log_dir / next(n for n in gz if n.startswith("simulacra.log.1"))) as f:
+            assert f.read() == b"old main log"
+
+        # A second process finds nothing left to claim
+        log._compress_old_logs()
+        assert len([p for p in log_dir.iterdir() if p.name.endswith(".gz")]) == 3
+        log.close()
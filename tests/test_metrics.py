@@ -0,0 +1,72 @@
+import urllib.request
+import pytest
+from modules.metrics import Metric, MetricsRegistry
+
+
+@pytest.fixture
+def registry():
+    return MetricsRegistry()
+
+
+class TestMetrics:
+    def test_counter_and_gauge_render(self, registry):
+        ticks = registry.counter("ticks_total", "Ticks")
+        disasters = registry.counter("disasters_total", "Disasters", labels=("type",))
+        hp = registry.gauge("hp", "HP")
+        ticks.inc()
+        ticks.inc(2)
+        disasters.inc(type="fire")
+        disasters.inc(type='say "hi"')
+        hp.set(42.5)
+
+        text = registry.render()
+        assert "# TYPE ticks_total counter" in text
+        assert "ticks_total 3\n" in text
+        assert 'disasters_total{type="fire"} 1' in text
+        assert 'disasters_total{type="say \\"hi\\""} 1' in text
+        assert "# TYPE hp gauge" in text
+        assert "hp 42.5" in text
+
+    def test_histogram_buckets_are_cumulative(self, registry):
+        damage = registry.histogram("damage", "Damage", buckets=(1, 5, 10))
+        for value in (0.5, 3, 3, 20):
+            damage.observe(value)
+
+        text = registry.render()
+        assert 'damage_bucket{le="1"} 1' in text
+        assert 'damage_bucket{le="5"} 3' in text
+        assert 'damage_bucket{le="10"} 3' in text
+        assert 'damage_bucket{le="+Inf"} 4' in text
+        assert "damage_sum 26.5" in text
+        assert "damage_count 4" in text
+
+    def test_labels_and_registration_checked(self, registry):
+        disasters = registry.counter("disasters_total", "Disasters", labels=("type",))
+        assert registry.counter("disasters_total", "Disasters", labels=("type",)) is disasters
+        with pytest.raises(ValueError):
+            disasters.inc()
+        with pytest.raises(ValueError):
+            disasters.inc(-1, type="fire")
+        with pytest.raises(ValueError):
+            registry.gauge("disasters_total", "Disasters")
+
+    def test_metric_requires_samples(self):
+        with pytest.raises(TypeError):
+            Metric("bare", "No samples")
+
+    def test_textfile_and_http(self, registry, tmp_path):
+        registry.histogram("save_seconds", "Save", labels=("kind",)).observe(0.02, kind="slot")
+        path = tmp_path / "simulacra.prom"
+        registry.write_textfile(path)
+        assert 'save_seconds_count{kind="slot"} 1' in path.read_text()
+        assert list(tmp_path.iterdir()) == [path]
+
+        server = registry.serve(0)
+        try:
+            port = server.server_address[1]
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics") as response:
+                assert response.headers["Content-Type"].startswith("text/plain")
+                assert response.read().decode() == registry.render()
+        finally:
+            server.shutdown()
+            server.server_close()
@@ -0,0 +1,144 @@
+import pytest
+import threading
+import time
+from modules.persistence_worker import PersistenceWorker, Priority
+
+
+class TestPersistenceWorker:
+    @pytest.fixture
+    def worker(self):
+        worker = PersistenceWorker(maxsize=8)
+        yield worker
+        worker.close()
+
+    def test_jobs_run_in_background(self, worker):
+        """submit returns before the job touches the disk"""
+        release = threading.Event()
+        done = []
+        worker.submit("slow", lambda record: release.wait() and done.append(record), "run")
+        assert done == []
+        release.set()
+        worker.flush()
+        assert done == ["run"]
+        assert worker.completed == 1
+
+    def test_priority_order(self, worker):
+        gate = threading.Event()
+        order = []
+        worker.submit("gate", lambda _: gate.wait(), None)
+        time.sleep(0.05)  # let the worker pick up the gate job
+        worker.submit("low", order.append, "low", Priority.LOW)
+        worker.submit("normal", order.append, "normal")
+        worker.submit("critical", order.append, "critical", Priority.CRITICAL)
+        worker.submit("normal-2", order.append, "normal-2")
+        gate.set()
+        worker.flush()
+        assert order == ["critical", "normal", "normal-2", "low"]
+
+    def test_close_drains_queue(self):
+        worker = PersistenceWorker()
+        done = []
+        for i in range(20):
+            worker.submit(f"job {i}", lambda r: (time.sleep(0.001), done.append(r)), i, Priority.LOW)
+        worker.close()
+        assert done == list(range(20))
+
+    def test_full_queue_runs_inline(self, monkeypatch):
+        monkeypatch.setattr("modules.persistence_worker.SUBMIT_TIMEOUT", 0.01)
+        worker = PersistenceWorker(maxsize=1)
+        gate = threading.Event()
+        worker.submit("gate", lambda _: gate.wait(), None)
+        time.sleep(0.05)
+        worker.submit("queued", lambda _: None, None)
+        inline = []
+        assert not worker.submit("overflow", inline.append, "now")
+        assert inline == ["now"]
+        gate.set()
+        worker.close()
+
+    def test_failures_do_not_stop_worker(self, worker):
+        done = []
+        worker.submit("broken", lambda _: 1 / 0, None)
+        worker.submit("ok", done.append, "ok")
+        worker.flush()
+        assert done == ["ok"]
+        assert worker.failed == 1
+
+
+class TestPersistRun:
+    class Recorder:
+        """Stands in for a manager; records which method was called"""
+        def __init__(self, calls):
+            self.calls = calls
+            self.history = []
+
+        def __getattr__(self, name):
+            return lambda *args, **kwargs: self.calls.append((name, args))
+
+    def test_jobs_use_shared_managers(self):
+        """End-of-run jobs write through the managers they are given"""
+        from main import RunRecord, RunServices, persist_run
+        from modules.persistence_worker import persistence_worker
+
+        calls = []
+        services = RunServices(*(self.Recorder(calls) for _ in range(3)))
+        record = RunRecord("2025-05-03T15:00:00", 42, {"current_hp": 0}, [], [])
+        persist_run(record, services)
+        persistence_worker.flush()
+
+        assert sorted(name for name, _ in calls) == [
+            "check_run_achievements", "save_highlight", "save_run"]
+
+    def test_achievements_see_run_count(self):
+        """The achievement job reports how many runs the history holds"""
+        from main import RunRecord, RunServices, persist_run
+        from modules.persistence_worker import persistence_worker
+
+        calls = []
+        services = RunServices(*(self.Recorder(calls) for _ in range(3)))
+        services.save_manager.history.extend([{}, {}])
+        record = RunRecord("2025-05-03T15:00:00", 42, {"current_hp": 0}, [], [])
+        persist_run(record, services)
+        persistence_worker.flush()
+
+        stats = next(args[0] for name, args in calls if name == "check_run_achievements")
+        assert stats["total_runs"] == 2
+
+    def test_finished_run_is_saved(self, tmp_path, monkeypatch):
+        """A game played to game over reaches the history, highlights and achievements"""
+        import io
+        import main
+        from modules import highlights as highlights_module
+        from modules.achievements import AchievementManager
+        from modules.highlights import HighlightManager
+        from modules.persistence_worker import persistence_worker
+        from modules.save_load import SaveManager
+        from simulacra.core.mutations import MutationSystem
+        from simulacra.core.traits import TraitSystem
+        from simulacra.ui.animations import Animator
+        from simulacra.ui.hud import HUDManager
+        from simulacra.ui.renderer import FrameRenderer
+
+        monkeypatch.setattr(main.StartScreen, "show_title", staticmethod(lambda: None))
+        monkeypatch.setattr(HUDManager, "renderer", FrameRenderer(io.StringIO()))
+        monkeypatch.setattr(HUDManager, "animations", Animator())
+        monkeypatch.setattr(HUDManager.anim, "GAME_OVER_DELAY", 0)
+        monkeypatch.setattr(SaveManager, "SAVE_DIR", tmp_path / "runs")
+        monkeypatch.setattr(AchievementManager, "ACHIEVEMENTS_PATH", tmp_path / "achievements.json")
+        monkeypatch.setattr(highlights_module, "DATA_DIR", tmp_path)
+        services = main.RunServices(SaveManager(), AchievementManager(), HighlightManager())
+
+        game = main.SimulacraGame(TraitSystem(), MutationSystem(), tick_interval=0,
+                                  services=services)
+        game.run()
+        persistence_worker.flush()
+        HUDManager.clear_overlay()
+
+        assert game.game_over
+        runs = services.save_manager.load_runs()
+        assert [run.survival_seconds for run in runs] == [game.survival_seconds]
+        assert {m["name"] for m in runs[0].mutations} >= {"Regeneration"}
+        highlights = services.highlight_manager.get_highlights()
+        assert [h.survival_time for h in highlights] == [game.survival_seconds]
+        assert services.achievement_manager.achievements["first_run"].is_unlocked()
+        services.save_manager.history.close()
@@ -0,0 +1,120 @@
+import pytest
+from pathlib import Path
+from unittest.mock import patch
+import asyncio
+import tempfile
+import shutil
+import json
+import os
+import threading
+from modules.read_cache import ReadCache
+
+
+class TestReadCache:
+    @pytest.fixture
+    def data_dir(self):
+        path = Path(tempfile.mkdtemp())
+        yield path
+        shutil.rmtree(path)
+
+    def _touch(self, path: Path, data: dict, mtime_ns: int) -> None:
+        path.write_text(json.dumps(data))
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+    def test_repeated_reads_served_from_memory(self, data_dir):
+        path = data_dir / "names.json"
+        path.write_text(json.dumps(["Void Rift"]))
+        cache = ReadCache(ttl=60)
+        assert cache.get_json(path) == ["Void Rift"]
+        assert cache.get_json(path) == ["Void Rift"]
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_counters_exact_across_threads(self, data_dir):
+        path = data_dir / "names.json"
+        path.write_text(json.dumps(["Void Rift"]))
+        cache = ReadCache(ttl=60)
+        threads = [threading.Thread(target=lambda: [cache.get_bytes(path) for _ in range(2000)])
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert cache.hits + cache.misses == 16000
+
+    def test_json_values_are_not_shared(self, data_dir):
+        path = data_dir / "config.json"
+        path.write_text(json.dumps({"themes": []}))
+        cache = ReadCache()
+        cache.get_json(path)["themes"].append("neon")
+        assert cache.get_json(path) == {"themes": []}
+
+    def test_reload_after_ttl_when_file_changes(self, data_dir):
+        path = data_dir / "types.json"
+        self._touch(path, ["fire"], 1_000_000_000)
+        cache = ReadCache(ttl=0)
+        assert cache.get_json(path) == ["fire"]
+        self._touch(path, ["frost"], 2_000_000_000)
+        assert cache.get_json(path) == ["frost"]
+        assert cache.misses == 2
+
+    def test_ttl_skips_stat(self, data_dir):
+        path = data_dir / "effects.json"
+        path.write_text(json.dumps(["decays"]))
+        cache = ReadCache(ttl=60)
+        cache.get_json(path)
+        with patch.object(ReadCache, "_file_key", side_effect=AssertionError("stat")):
+            assert cache.get_json(path) == ["decays"]
+
+    def test_lru_bounded_by_bytes(self, data_dir):
+        cache = ReadCache(max_bytes=250)
+        paths = []
+        for i in range(3):
+            path = data_dir / f"part_{i}.bin"
+            path.write_bytes(bytes(100))
+            paths.append(path)
+        cache.get_bytes(paths[0])
+        cache.get_bytes(paths[1])
+        cache.get_bytes(paths[0])  # paths[1] is now least recently used
+        cache.get_bytes(paths[2])
+        assert len(cache) == 2
+        assert cache.size == 200
+        cache.get_bytes(paths[0])
+        assert cache.misses == 3
+
+    def test_concurrent_reads_coalesce(self, data_dir):
+        path = data_dir / "state.json"
+        path.write_text(json.dumps({"health": 100}))
+        cache = ReadCache()
+
+        async def read_many():
+            return await asyncio.gather(*(cache.read_json(path) for _ in range(10)))
+
+        results = asyncio.run(read_many())
+        assert all(r == {"health": 100} for r in results)
+        assert cache.misses == 1
+
+    def test_cancelled_reader_leaves_others(self, data_dir):
+        """Cancelling the reader that started a shared read does not fail the rest"""
+        path = data_dir / "state.json"
+        path.write_text(json.dumps({"health": 100}))
+        cache = ReadCache()
+
+        async def cancel_first():
+            first = asyncio.create_task(cache.read_json(path))
+            await asyncio.sleep(0)
+            second = asyncio.create_task(cache.read_json(path))
+            await asyncio.sleep(0)
+            first.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await first
+            return await second
+
+        assert asyncio.run(cancel_first()) == {"health": 100}
+        assert cache.misses == 1
+
+    def test_missing_file_raises(self, data_dir):
+        cache = ReadCache()
+        with pytest.raises(FileNotFoundError):
+            asyncio.run(cache.read_json(data_dir / "missing.json"))
+        with pytest.raises(FileNotFoundError):
+            cache.get_json(data_dir / "missing.json")
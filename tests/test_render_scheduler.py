@@ -0,0 +1,74 @@
+import threading
+import time
+import pytest
+from modules.metrics import HUD_FRAME_SECONDS, HUD_FRAMES_DROPPED, Counter, Histogram
+from simulacra.ui.scheduler import RenderScheduler
+
+
+class TestRenderScheduler:
+    def test_draws_latest_and_drops_superseded(self):
+        drawn = []
+        release = threading.Event()
+
+        def render(snapshot):
+            drawn.append(snapshot)
+            release.wait(1)
+
+        scheduler = RenderScheduler(render, fps=1000).start()
+        scheduler.submit(0)
+        while not drawn:
+            time.sleep(0.001)
+        # The renderer is busy with 0; only the newest of these gets drawn
+        for tick in range(1, 6):
+            scheduler.submit(tick)
+        release.set()
+        scheduler.stop()
+
+        assert drawn == [0, 5]
+        stats = scheduler.stats()
+        assert stats.frames_rendered == 2
+        assert stats.frames_dropped == 4
+        assert stats.max_frame_time >= stats.avg_frame_time > 0
+
+    def test_frame_rate_caps_renders(self):
+        drawn = []
+        scheduler = RenderScheduler(drawn.append, fps=20).start()
+        deadline = time.monotonic() + 0.25
+        tick = 0
+        while time.monotonic() < deadline:
+            scheduler.submit(tick)
+            tick += 1
+            time.sleep(0.0005)
+        scheduler.stop(flush=False)
+
+        assert 2 <= len(drawn) <= 8
+        assert drawn == sorted(drawn)
+        stats = scheduler.stats()
+        assert stats.frames_rendered == len(drawn)
+        assert stats.frames_dropped >= tick - len(drawn) - 1
+
+    def test_stop_flushes_pending_snapshot(self):
+        drawn = []
+        scheduler = RenderScheduler(drawn.append, fps=1)
+        scheduler.submit("final")
+        scheduler.stop()
+        assert drawn == ["final"]
+        with pytest.raises(ValueError):
+            RenderScheduler(drawn.append, fps=0)
+
+    def test_metrics_only_where_given(self):
+        """Frames count toward the metrics a scheduler was given and no others"""
+        frame_seconds = Histogram("test_frame_seconds", "")
+        frames_dropped = Counter("test_frames_dropped_total", "")
+        hud_frames, hud_dropped = HUD_FRAME_SECONDS.count(), HUD_FRAMES_DROPPED.value()
+
+        with_metrics = RenderScheduler(lambda _: None, fps=1, frame_seconds=frame_seconds,
+                                       frames_dropped=frames_dropped)
+        without = RenderScheduler(lambda _: None, fps=1)
+        for scheduler in (with_metrics, without):
+            scheduler.submit("a")
+            scheduler.submit("b")
+            scheduler.stop()
+
+        assert (frame_seconds.count(), frames_dropped.value()) == (1, 1)
+        assert (HUD_FRAME_SECONDS.count(), HUD_FRAMES_DROPPED.value()) == (hud_frames, hud_dropped)
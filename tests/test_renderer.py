@@ -0,0 +1,44 @@
+import io
+from simulacra.ui.renderer import CLEAR_BELOW, CLEAR_SCREEN, FrameRenderer, move_to
+
+
+class TestFrameRenderer:
+    def test_first_frame_draws_everything_in_one_write(self):
+        stream = io.StringIO()
+        renderer = FrameRenderer(stream)
+        assert renderer.render(["HP: 100", "Time: 0s"]) == 2
+        output = stream.getvalue()
+        assert output.startswith("\x1b[H" + CLEAR_SCREEN)
+        assert f"{move_to(1)}HP: 100" in output
+        assert f"{move_to(2)}Time: 0s" in output
+
+    def test_only_changed_lines_rewritten(self):
+        stream = io.StringIO()
+        renderer = FrameRenderer(stream)
+        renderer.render(["header", "HP: 100", "Time: 0s"])
+        stream.seek(0)
+        stream.truncate()
+
+        assert renderer.render(["header", "HP: 100", "Time: 1s"]) == 1
+        output = stream.getvalue()
+        assert "header" not in output and "HP" not in output
+        assert f"{move_to(3)}Time: 1s" in output
+        assert CLEAR_SCREEN not in output
+
+    def test_shorter_frame_clears_below(self):
+        stream = io.StringIO()
+        renderer = FrameRenderer(stream)
+        renderer.render(["a", "b", "c"])
+        stream.seek(0)
+        stream.truncate()
+        assert renderer.render(["a"]) == 0
+        assert stream.getvalue().endswith(move_to(2) + CLEAR_BELOW)
+
+    def test_invalidate_forces_full_repaint(self):
+        stream = io.StringIO()
+        renderer = FrameRenderer(stream)
+        renderer.render(["a", "b"])
+        renderer.invalidate()
+        assert renderer.render(["a", "b"]) == 2
+        assert renderer.frames == 2
+        assert renderer.lines_written == 4
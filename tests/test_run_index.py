@@ -0,0 +1,115 @@
+import pytest
+from pathlib import Path
+import tempfile
+import shutil
+import time
+import random
+from modules.run_index import RunIndex
+from modules.run_store import RunHistoryStore
+from modules.save_load import RunData, SaveManager
+
+
+def make_run(survival: int, traits, mutations) -> dict:
+    return {
+        "timestamp": "2025-05-03T15:00:00",
+        "traits": [{"name": name, "tier": tier} for name, tier in traits],
+        "mutations": [{"name": name} for name in mutations],
+        "reflection_points": 1,
+        "survival_seconds": survival
+    }
+
+
+class TestRunIndex:
+    @pytest.fixture
+    def tmp_dir(self):
+        path = Path(tempfile.mkdtemp())
+        yield path
+        shutil.rmtree(path)
+
+    @pytest.fixture
+    def index(self, tmp_dir):
+        index = RunIndex(tmp_dir / "runs.sqlite3")
+        index.add_runs(enumerate([
+            make_run(10, [("Nullcore", 1)], ["Glitch"]),
+            make_run(40, [("Nullcore", 1), ("Aegis", 2)], ["Regrowth"]),
+            make_run(60, [("Aegis", 2)], ["Regrowth", "Glitch"]),
+            make_run(90, [("Aegis", 2)], ["Regrowth"]),
+        ]))
+        yield index
+        index.close()
+
+    def test_queries(self, index):
+        assert index.run_count() == 4
+        assert index.best_survival_with_trait("Nullcore") == 40
+        assert index.best_survival_with_trait("Missing") is None
+        assert index.mean_survival_by_tier() == {1: 25.0, 2: pytest.approx(190 / 3)}
+
+        correlations = index.mutation_correlations()
+        assert correlations[0].name == "Regrowth"
+        assert correlations[0].correlation > 0 > correlations[-1].correlation
+
+        picks = index.recommend_traits(min_runs=2)
+        assert [p.name for p in picks] == ["Aegis", "Nullcore"]
+        assert picks[0].best_survival == 90
+
+    def test_duplicate_ids_ignored(self, index):
+        """Re-indexing a run does not double count it"""
+        assert index.add_runs([(0, make_run(10, [("Nullcore", 1)], []))]) == 0
+        assert index.run_count() == 4
+        assert index.next_run_id == 4
+
+    def test_repeated_names_count_once(self, tmp_dir):
+        """A trait or mutation listed twice in one run still counts as one run"""
+        index = RunIndex(tmp_dir / "runs.sqlite3")
+        index.add_runs(enumerate([
+            make_run(10, [("Aegis", 2), ("Aegis", 2)], ["Glitch", "Glitch"]),
+            make_run(30, [], []),
+        ]))
+        glitch = index.mutation_correlations()[-1]
+        assert (glitch.name, glitch.runs, glitch.mean_survival) == ("Glitch", 1, 10.0)
+        assert index.recommend_traits(min_runs=1)[0].runs == 1
+        index.close()
+
+    def test_tier_mean_is_per_run(self, tmp_dir):
+        """A run with several traits of one tier weighs the same as any other run"""
+        index = RunIndex(tmp_dir / "runs.sqlite3")
+        index.add_runs(enumerate([
+            make_run(10, [("Aegis", 1), ("Nullcore", 1), ("Echo", 1)], []),
+            make_run(50, [("Aegis", 1)], []),
+        ]))
+        assert index.mean_survival_by_tier() == {1: 30.0}
+        index.close()
+
+    def test_large_index_queries_fast(self, tmp_dir):
+        """Aggregate queries stay in milliseconds at 100k runs"""
+        rng = random.Random(7)
+        names = [f"Trait {i}" for i in range(50)]
+        index = RunIndex(tmp_dir / "large.sqlite3")
+        index.add_runs(
+            (i, make_run(rng.randint(1, 300),
+                         [(rng.choice(names), rng.randint(1, 5)) for _ in range(3)],
+                         [f"Mutation {rng.randint(0, 30)}"]))
+            for i in range(100_000)
+        )
+
+        start = time.perf_counter()
+        index.best_survival_with_trait("Trait 3")
+        index.mean_survival_by_tier()
+        index.mutation_correlations()
+        index.recommend_traits()
+        assert time.perf_counter() - start < 0.05
+        index.close()
+
+    def test_save_manager_catches_up(self, tmp_dir, monkeypatch):
+        """Runs present in history but missing from the index are indexed on start"""
+        monkeypatch.setattr(SaveManager, "SAVE_DIR", tmp_dir)
+        store = RunHistoryStore(tmp_dir / "history", background=False)
+        store.append(make_run(30, [("Aegis", 2)], []))
+        store.close()
+
+        manager = SaveManager()
+        assert manager.index.run_count() == 1
+        manager.save_run(RunData(**make_run(50, [("Aegis", 2)], [])))
+        assert manager.index.best_survival_with_trait("Aegis") == 50
+        assert manager.index.next_run_id == 2
+        manager.display_stats()
@@ -0,0 +1,238 @@
+import pytest
+from pathlib import Path
+import tempfile
+import shutil
+import json
+import threading
+import time
+from modules.run_store import INDEX_ENTRY, RunHistoryStore
+from modules.save_load import RunData, SaveManager
+from modules.storage_codecs import CodecType, StorageCodec
+
+
+def make_run(i: int) -> dict:
+    return {
+        "timestamp": f"2025-05-03T15:{i // 60 % 60:02d}:{i % 60:02d}",
+        "traits": [{"name": "Nullcore", "tier": 1}],
+        "mutations": [{"name": f"Mutation {i % 7}"}],
+        "reflection_points": i % 5,
+        "survival_seconds": i
+    }
+
+
+class TestRunHistoryStore:
+    @pytest.fixture
+    def history_dir(self):
+        path = Path(tempfile.mkdtemp())
+        yield path
+        shutil.rmtree(path)
+
+    def open_store(self, history_dir, **kwargs):
+        kwargs.setdefault("codec", StorageCodec(CodecType.ZSTD))
+        kwargs.setdefault("background", False)
+        return RunHistoryStore(history_dir, **kwargs)
+
+    def test_latest_and_iteration(self, history_dir):
+        """Latest reads newest first across segments; iteration streams oldest first"""
+        store = self.open_store(history_dir, segment_records=16)
+        for i in range(50):
+            assert store.append(make_run(i)) == i
+
+        assert len(store) == 50
+        assert [r["survival_seconds"] for r in store.latest(20)] == list(range(49, 29, -1))
+        assert [r["survival_seconds"] for r in store] == list(range(50))
+        assert len(list(history_dir.glob("*.log"))) == 4
+        store.close()
+
+    def test_sessions_reopen(self, history_dir):
+        """Each session writes its own segment and sequence numbers continue"""
+        for session in range(3):
+            store = self.open_store(history_dir)
+            for i in range(5):
+                store.append(make_run(session * 5 + i))
+            store.close()
+
+        store = self.open_store(history_dir)
+        assert len(store) == 15
+        assert store.latest(1)[0]["survival_seconds"] == 14
+        assert len(store.latest(100)) == 15
+
+    def test_torn_tail_recovery(self, history_dir):
+        """Unindexed blocks are recovered and partial blocks are dropped"""
+        store = self.open_store(history_dir)
+        for i in range(3):
+            store.append(make_run(i))
+        store.close()
+
+        index_path = next(history_dir.glob("*.idx"))
+        log_path = index_path.with_suffix(".log")
+        # Lose the last index entry and leave half a block on the log
+        with open(index_path, "r+b") as f:
+            f.truncate(2 * INDEX_ENTRY.size + 5)
+        with open(log_path, "ab") as f:
+            f.write(b"\x40\x00\x00\x00partial")
+
+        store = self.open_store(history_dir)
+        assert [r["survival_seconds"] for r in store] == [0, 1, 2]
+        assert index_path.stat().st_size == 3 * INDEX_ENTRY.size
+
+    def test_compaction_merges_sessions(self, history_dir):
+        """Small sealed segments merge into one without changing order"""
+        for session in range(5):
+            store = self.open_store(history_dir)
+            store.append(make_run(session))
+            store.close()
+
+        store = self.open_store(history_dir, compact_threshold=4)
+        assert store.needs_compaction()
+        iterator = iter(store)
+        assert next(iterator)["survival_seconds"] == 0
+        assert store.compact() == 4
+        assert [r["survival_seconds"] for r in iterator] == [1, 2, 3, 4]
+        assert len(list(history_dir.glob("*.log"))) == 1
+
+        reopened = self.open_store(history_dir)
+        assert [r["survival_seconds"] for r in reopened] == list(range(5))
+
+    def test_background_compaction(self, history_dir):
+        for session in range(4):
+            store = self.open_store(history_dir)
+            store.append(make_run(session))
+            store.close()
+
+        store = self.open_store(history_dir, compact_threshold=4, background=True)
+        store.close()
+        assert len(list(history_dir.glob("*.log"))) == 1
+        assert len(store) == 4
+
+    def test_stale_generation_discarded(self, history_dir):
+        """Segments left behind by an interrupted compaction are cleaned up"""
+        for session in range(2):
+            store = self.open_store(history_dir)
+            store.append(make_run(session))
+            store.close()
+        stale = sorted(history_dir.glob("*"))
+        copies = {p: p.read_bytes() for p in stale}
+
+        store = self.open_store(history_dir, compact_threshold=2)
+        store.compact()
+        for path, data in copies.items():
+            path.write_bytes(data)
+
+        store = self.open_store(history_dir)
+        assert [r["survival_seconds"] for r in store] == [0, 1]
+        assert len(list(history_dir.glob("*.log"))) == 1
+
+    def test_open_during_compaction(self, history_dir, monkeypatch):
+        """A store opened mid-merge waits for the lock instead of deleting the merged log"""
+        for session in range(4):
+            store = self.open_store(history_dir)
+            store.append(make_run(session))
+            store.close()
+
+        opened, blocked = [], []
+        merge = RunHistoryStore._merge
+
+        def slow_merge(store, group):
+            merged = merge(store, group)
+            opener = threading.Thread(target=lambda: opened.append(self.open_store(history_dir)))
+            opener.start()
+            time.sleep(0.2)
+            blocked.append(not opened)
+            slow_merge.opener = opener
+            return merged
+
+        monkeypatch.setattr(RunHistoryStore, "_merge", slow_merge)
+        store = self.open_store(history_dir, compact_threshold=2)
+        assert store.compact() == 3
+        slow_merge.opener.join()
+
+        assert blocked == [True]
+        assert [r["survival_seconds"] for r in opened[0]] == [0, 1, 2, 3]
+        assert [r["survival_seconds"] for r in self.open_store(history_dir)] == [0, 1, 2, 3]
+
+    def test_compaction_by_another_store(self, history_dir):
+        """A store whose segments were compacted elsewhere reloads them"""
+        for session in range(4):
+            store = self.open_store(history_dir)
+            store.append(make_run(session))
+            store.close()
+
+        first = self.open_store(history_dir, compact_threshold=2)
+        second = self.open_store(history_dir, compact_threshold=2)
+        assert second.compact() == 3
+        assert first.compact() == 0
+        assert [r["survival_seconds"] for r in first] == [0, 1, 2, 3]
+
+    def test_stores_share_sequence(self, history_dir):
+        """Stores appending side by side never reuse a base or sequence number"""
+        first = self.open_store(history_dir)
+        assert [first.append(make_run(i)) for i in range(3)] == [0, 1, 2]
+        second = self.open_store(history_dir)
+        assert second.append(make_run(3)) == 3
+        # The first store sees the newer segment and rolls over past it
+        assert first.append(make_run(4)) == 4
+        first.close()
+        second.close()
+
+        assert [r["survival_seconds"] for r in self.open_store(history_dir)] == [0, 1, 2, 3, 4]
+        assert not list(history_dir.glob("seg_*.lock"))
+
+    def test_live_segment_untouched(self, history_dir):
+        """Opening and compacting leave another store's active segment alone"""
+        for session in range(2):
+            store = self.open_store(history_dir)
+            store.append(make_run(session))
+            store.close()
+        writer = self.open_store(history_dir)
+        writer.append(make_run(2))
+        live = writer._active.path
+        size = live.stat().st_size
+
+        other = self.open_store(history_dir, compact_threshold=2)
+        assert other.compact() == 1
+        assert live.stat().st_size == size
+        writer.append(make_run(3))
+        writer.close()
+
+        assert [r["survival_seconds"] for r in self.open_store(history_dir)] == [0, 1, 2, 3]
+
+    def test_compaction_temp_files_removed(self, history_dir):
+        """Temp files from a crashed compaction are deleted on open"""
+        store = self.open_store(history_dir)
+        store.append(make_run(0))
+        store.close()
+        for suffix in (".log.tmp", ".idx.tmp"):
+            (history_dir / f"seg_000000000000_0001{suffix}").write_bytes(b"partial")
+
+        store = self.open_store(history_dir)
+        assert not list(history_dir.glob("*.tmp"))
+        assert [r["survival_seconds"] for r in store] == [0]
+
+
+class TestSaveManagerHistory:
+    @pytest.fixture
+    def save_dir(self, monkeypatch):
+        path = Path(tempfile.mkdtemp())
+        monkeypatch.setattr(SaveManager, "SAVE_DIR", path)
+        yield path
+        shutil.rmtree(path)
+
+    def test_save_and_load_runs(self, save_dir):
+        manager = SaveManager()
+        for i in range(3):
+            assert manager.save_run(RunData(**make_run(i)))
+        runs = manager.load_runs(limit=2)
+        assert [r.survival_seconds for r in runs] == [2, 1]
+        assert [r.survival_seconds for r in manager.iter_runs()] == [0, 1, 2]
+
+    def test_legacy_runs_imported(self, save_dir):
+        for i in range(3):
+            with open(save_dir / f"run_2025-05-03_15-00-0{i}.json", "w") as f:
+                json.dump(make_run(i), f)
+
+        manager = SaveManager()
+        assert [r.survival_seconds for r in manager.load_runs()] == [2, 1, 0]
+        manager.history.close()
+        # A second start must not import the same files again
+        assert len(SaveManager().history) == 3
@@ -0,0 +1,67 @@
+import pytest
+from pathlib import Path
+import tempfile
+import shutil
+import orjson
+import lz4.frame
+from modules.save_format import SaveFile, SaveFormatError, encode_save, read_meta
+from modules.checkpoint import LEGACY_BASE_FILE, Checkpointer
+from modules.storage import storage
+
+
+class TestSaveFormat:
+    @pytest.fixture
+    def save_dir(self):
+        path = Path(tempfile.mkdtemp())
+        yield path
+        storage.commit()
+        shutil.rmtree(path)
+
+    def write(self, path: Path, sections: dict, meta: dict = None) -> Path:
+        path.write_bytes(encode_save({k: orjson.dumps(v) for k, v in sections.items()}, meta))
+        return path
+
+    def test_round_trip(self, save_dir):
+        sections = {"stats": {"hp": 80}, "mutations": {"m1": {"tier": 2}}}
+        with SaveFile.open(self.write(save_dir / "save.sims", sections)) as save:
+            assert dict(save) == sections
+
+    def test_sections_decode_lazily(self, save_dir):
+        path = self.write(save_dir / "save.sims", {"stats": {"hp": 80}, "log": list(range(10000))})
+        with SaveFile.open(path) as save:
+            assert save["stats"] == {"hp": 80}
+            assert "log" not in save._decoded
+
+    def test_meta_reads_header_only(self, save_dir):
+        path = self.write(save_dir / "save.sims", {"log": list(range(10000))},
+                          {"seq": 7, "chain": "abc"})
+        assert read_meta(path) == {"seq": 7, "chain": "abc"}
+
+    def test_corrupt_section_detected(self, save_dir):
+        path = self.write(save_dir / "save.sims", {"stats": {"hp": 80}, "extra": [1, 2, 3]})
+        data = bytearray(path.read_bytes())
+        data[-3] ^= 0xFF
+        path.write_bytes(bytes(data))
+        with SaveFile.open(path) as save:
+            assert save["stats"] == {"hp": 80}
+            with pytest.raises(SaveFormatError):
+                save["extra"]
+
+    def test_rejects_other_files(self, save_dir):
+        path = save_dir / "save.lz4"
+        path.write_bytes(lz4.frame.compress(b"{}"))
+        with pytest.raises(SaveFormatError):
+            SaveFile.open(path)
+
+    def test_legacy_checkpoint_base_loads(self, save_dir):
+        """Bases from before the sectioned format are still replayed"""
+        frame = Checkpointer._frame("base", 1, "chain", {"stats": orjson.dumps({"hp": 55})}, [])
+        (save_dir / LEGACY_BASE_FILE).write_bytes(frame)
+        checkpoints = Checkpointer(save_dir)
+        assert checkpoints.load() == {"stats": {"hp": 55}}
+
+        checkpoints.base_interval = 1
+        checkpoints.save({"stats": {"hp": 40}})
+        assert not (save_dir / LEGACY_BASE_FILE).exists()
+        assert Checkpointer(save_dir).load() == {"stats": {"hp": 40}}
+        assert Checkpointer(save_dir).metadata()["seq"] == 2
@@ -0,0 +1,73 @@
+import pytest
+from pathlib import Path
+import tempfile
+import shutil
+import time
+import os
+import orjson
+from modules.save_format import FILE_HEADER, MAGIC, SaveSummary
+from modules.save_slots import SaveSlots
+
+
+class TestSaveSlots:
+    @pytest.fixture
+    def slots(self):
+        path = Path(tempfile.mkdtemp())
+        yield SaveSlots(path)
+        shutil.rmtree(path)
+
+    def summary(self, hp: float, survival: int, stamp: float = None) -> SaveSummary:
+        return SaveSummary(stamp or time.time(), hp, 100.0, survival, ("Iron Skin", "Void Walker"))
+
+    def test_catalog_lists_summaries(self, slots):
+        slots.save("alpha", {"stats": {"current_hp": 80}}, self.summary(80, 120, 1000.0))
+        slots.save("beta", {"stats": {"current_hp": 40}}, self.summary(40, 300, 2000.0))
+        infos = slots.list()
+        assert [i.slot for i in infos] == ["beta", "alpha"]
+        assert infos[0].summary == self.summary(40, 300, 2000.0)
+
+    def test_catalog_rereads_only_changed_slots(self, slots):
+        for i in range(3):
+            slots.save(f"slot{i}", {"stats": {}}, self.summary(50, i))
+        slots.list()
+        assert slots.catalog.header_reads == 3
+
+        slots.list()
+        assert slots.catalog.header_reads == 3
+
+        slots.save("slot1", {"stats": {}}, self.summary(10, 999))
+        os.utime(slots.path("slot1"), ns=(1, 1))
+        infos = {i.slot: i for i in slots.list()}
+        assert slots.catalog.header_reads == 4
+        assert infos["slot1"].summary.survival_seconds == 999
+
+        slots.delete("slot0")
+        assert "slot0" not in {i.slot for i in slots.list()}
+
+    def test_slot_round_trip(self, slots):
+        sections = {"stats": {"current_hp": 80}, "mutations": {"m1": {"tier": 2}}}
+        slots.save("main", sections, self.summary(80, 60))
+        with slots.open("main") as save:
+            assert dict(save) == sections
+            assert save.summary.loadout == ("Iron Skin", "Void Walker")
+
+    def test_long_loadout_keeps_whole_names(self):
+        names = tuple(f"Trait Number {i}" for i in range(40))
+        packed = SaveSummary(1.0, 1.0, 1.0, 1, names).pack()
+        loadout = SaveSummary.unpack(packed).loadout
+        assert 0 < len(loadout) < len(names)
+        assert loadout == names[:len(loadout)]
+
+    def test_version_one_saves_still_load(self, slots):
+        """Saves written before the summary block have no summary"""
+        meta = orjson.dumps({})
+        data = FILE_HEADER.pack(MAGIC, 1, 0, len(meta)) + meta
+        slots.directory.mkdir(exist_ok=True)
+        slots.path("old").write_bytes(data)
+        assert slots.list()[0].summary is None
+        with slots.open("old") as save:
+            assert save.version == 1 and len(save) == 0
+
+    def test_invalid_slot_name(self, slots):
+        with pytest.raises(ValueError):
+            slots.path("../escape")
@@ -0,0 +1,102 @@
+import pytest
+from pathlib import Path
+import tempfile
+import shutil
+import time
+import os
+import stat
+from modules.storage import StorageService
+
+
+class TestStorageService:
+    @pytest.fixture
+    def storage_dir(self):
+        path = Path(tempfile.mkdtemp())
+        yield path
+        shutil.rmtree(path)
+
+    @pytest.fixture
+    def service(self):
+        service = StorageService(commit_interval=60)
+        yield service
+        service.close()
+
+    def test_read_your_writes(self, service, storage_dir):
+        """Staged documents are visible before they are committed"""
+        path = storage_dir / "config.json"
+        service.put_json(path, {"slots": 3})
+        assert not path.exists()
+        assert service.exists(path)
+        assert service.read_json(path) == {"slots": 3}
+
+        assert service.commit()
+        assert service.read_json(path) == {"slots": 3}
+        assert not list(storage_dir.glob("*.tmp"))
+
+    def test_coalesced_group_commit(self, service, storage_dir, monkeypatch):
+        """Repeated writes collapse; a batch syncs each file and its directory once"""
+        syncs = []
+        fsync = os.fsync
+        monkeypatch.setattr(os, "fsync",
+                            lambda fd: syncs.append(stat.S_ISDIR(os.fstat(fd).st_mode)) or fsync(fd))
+        for i in range(10):
+            service.put_json(storage_dir / "a.json", {"i": i})
+            service.put_json(storage_dir / "b.json", {"i": -i})
+
+        assert service.commit()
+        # Windows has no directory fsync
+        assert sorted(syncs) == [False, False] + ([] if os.name == "nt" else [True])
+        assert service.read_json(storage_dir / "a.json") == {"i": 9}
+        assert service.read_json(storage_dir / "b.json") == {"i": -9}
+
+    def test_durable_put_commits_batch(self, service, storage_dir):
+        service.put(storage_dir / "queued.bin", b"queued")
+        assert service.put(storage_dir / "now.bin", b"now", durable=True)
+        assert (storage_dir / "queued.bin").read_bytes() == b"queued"
+        assert (storage_dir / "now.bin").read_bytes() == b"now"
+
+    def test_failed_rename_keeps_target(self, service, storage_dir, monkeypatch):
+        """A commit that fails mid-way never leaves a partial document"""
+        path = storage_dir / "save.json"
+        path.write_text('{"old": true}')
+        service.put_json(path, {"new": True})
+        monkeypatch.setattr(Path, "replace", lambda self, target: (_ for _ in ()).throw(OSError("disk")))
+
+        assert not service.commit()
+        assert path.read_text() == '{"old": true}'
+        assert not list(storage_dir.glob("*.tmp"))
+
+    def test_visible_during_commit(self, service, storage_dir, monkeypatch):
+        """Readers see the new contents while the batch is being renamed"""
+        first, second = storage_dir / "first.json", storage_dir / "second.json"
+        second.write_text('{"v": 0}')
+        service.put_json(first, {"v": 1})
+        service.put_json(second, {"v": 1})
+
+        seen = []
+        replace = Path.replace
+
+        def observe(tmp, target):
+            seen.append((service.read_json(first), service.read_json(second)))
+            return replace(tmp, target)
+
+        monkeypatch.setattr(Path, "replace", observe)
+        assert service.commit()
+        assert seen == [({"v": 1}, {"v": 1})] * 2
+        assert service.staged(first) is None and service.staged(second) is None
+
+    def test_background_commit(self, storage_dir):
+        service = StorageService(commit_interval=0.05)
+        service.put(storage_dir / "bg.txt", "hello")
+        deadline = time.monotonic() + 2
+        while not (storage_dir / "bg.txt").exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert (storage_dir / "bg.txt").read_text() == "hello"
+        service.close()
+
+    def test_close_commits_pending(self, storage_dir):
+        service = StorageService(commit_interval=60)
+        service.put(storage_dir / "late.txt", "bye")
+        assert service.close()
+        assert (storage_dir / "late.txt").read_text() == "bye"
+
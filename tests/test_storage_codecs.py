@@ -0,0 +1,92 @@
+import pytest
+from pathlib import Path
+import tempfile
+import shutil
+from modules.storage_codecs import (
+    CodecRegistry, CodecType, FileClass, StorageCodec,
+    select_codec, train_dictionary, format_report
+)
+
+
+def make_run(i: int) -> dict:
+    return {
+        "timestamp": f"2025-05-03T15:00:{i % 60:02d}",
+        "traits": [
+            {"name": "Nullcore", "tier": 1, "point_value": 7,
+             "effects": [{"text": "+20% Resilience", "rarity": "common"},
+                         {"text": f"-{i % 10}% HP", "rarity": "common"}]}
+        ],
+        "mutations": [{"name": f"Mutation {i % 7}", "effect": "+5% HP"}],
+        "reflection_points": i % 5,
+        "survival_seconds": 20 + i
+    }
+
+
+class TestStorageCodecs:
+    @pytest.fixture
+    def codec_dir(self):
+        path = Path(tempfile.mkdtemp())
+        yield path
+        shutil.rmtree(path)
+
+    @pytest.fixture
+    def samples(self):
+        return [make_run(i) for i in range(200)]
+
+    @pytest.mark.parametrize("codec", [c for c in CodecType if c != CodecType.ZSTD_DICT])
+    def test_round_trip(self, codec, samples):
+        """Every codec decodes what it encodes"""
+        storage_codec = StorageCodec(codec)
+        for record in samples[:10]:
+            assert storage_codec.decode(storage_codec.encode(record)) == record
+
+    def test_dictionary_round_trip(self, samples):
+        """Dictionary codec decodes its own frames and beats plain zstd on small records"""
+        dictionary = train_dictionary(samples, dict_size=4096)
+        assert dictionary is not None
+
+        with_dict = StorageCodec(CodecType.ZSTD_DICT, dictionary=dictionary)
+        plain = StorageCodec(CodecType.ZSTD)
+        assert with_dict.decode(with_dict.encode(samples[0])) == samples[0]
+
+        dict_size = sum(len(with_dict.encode(r)) for r in samples)
+        plain_size = sum(len(plain.encode(r)) for r in samples)
+        assert dict_size < plain_size
+
+    def test_legacy_json_decode(self):
+        """Plain JSON documents are still readable"""
+        assert StorageCodec().decode(b'{"a": [1, 2]}') == {"a": [1, 2]}
+
+    def test_too_few_samples(self):
+        assert train_dictionary([make_run(0)]) is None
+
+    def test_dictionary_sized_to_samples(self):
+        """Small sample sets get a smaller dictionary, or none at all"""
+        assert train_dictionary([make_run(i) for i in range(10)]) is None
+        dictionary = train_dictionary([make_run(i) for i in range(100)], dict_size=64 * 1024)
+        assert dictionary is not None
+        assert len(dictionary.as_bytes()) < 64 * 1024
+
+    def test_calibrate_persists_profile(self, codec_dir, samples):
+        """Calibration stores the selected codec and reloads it"""
+        registry = CodecRegistry(codec_dir)
+        results = registry.calibrate(FileClass.RUNS, samples)
+        assert {r.codec for r in results} == set(CodecType)
+
+        reloaded = CodecRegistry(codec_dir)
+        codec = reloaded.codec_for(FileClass.RUNS)
+        assert codec.codec == select_codec(results)
+        payload = registry.codec_for(FileClass.RUNS).encode(samples[3])
+        assert reloaded.codec_for(FileClass.RUNS).decode(payload) == samples[3]
+        assert "runs" in format_report({"runs": results})
+
+    def test_retrained_dictionary_reads_old_frames(self, codec_dir, samples):
+        """Frames written with an older dictionary survive recalibration"""
+        registry = CodecRegistry(codec_dir)
+        registry.calibrate(FileClass.RUNS, samples)
+        registry.profiles["runs"]["codec"] = CodecType.ZSTD_DICT.name
+        registry._codecs.clear()
+        old_payload = registry.codec_for(FileClass.RUNS).encode(samples[0])
+
+        registry.calibrate(FileClass.RUNS, [make_run(i * 3) for i in range(300)])
+        assert CodecRegistry(codec_dir).codec_for(FileClass.RUNS).decode(old_payload) == samples[0]
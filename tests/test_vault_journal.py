@@ -0,0 +1,101 @@
+import pytest
+from pathlib import Path
+import tempfile
+import shutil
+import json
+from modules import vault_journal
+from modules.vault import VaultManager
+from modules.vault_journal import VaultJournal, journal_for
+
+
+def make_trait(i: int) -> dict:
+    return {"name": f"Trait {i}", "tier": 1, "point_value": i,
+            "effects": [{"text": f"+{i}% HP", "rarity": "common"}]}
+
+
+class TestVaultJournal:
+    @pytest.fixture
+    def vault_dir(self):
+        path = Path(tempfile.mkdtemp())
+        yield path
+        shutil.rmtree(path)
+
+    def test_journal_replay(self, vault_dir):
+        """Operations append to the journal and replay on load"""
+        path = vault_dir / "vault.json"
+        path.write_text(json.dumps([make_trait(0), make_trait(1)]))
+        snapshot = path.read_bytes()
+
+        journal = VaultJournal(path)
+        journal.add(make_trait(2))
+        journal.remove(0)
+        journal.merge([0, 1], make_trait(9))
+        journal.close()
+
+        # Mutations never touch the snapshot
+        assert path.read_bytes() == snapshot
+        assert VaultJournal(path).traits == [make_trait(9)]
+
+    def test_torn_entry_dropped(self, vault_dir):
+        path = vault_dir / "vault.json"
+        journal = VaultJournal(path)
+        journal.add(make_trait(0))
+        journal.close()
+        with open(journal.journal_path, "a") as f:
+            f.write('{"op":"add","tra')
+
+        reopened = VaultJournal(path)
+        assert reopened.traits == [make_trait(0)]
+        reopened.add(make_trait(1))
+        reopened.close()
+        assert VaultJournal(path).traits == [make_trait(0), make_trait(1)]
+
+    def test_compaction(self, vault_dir):
+        path = vault_dir / "vault.json"
+        journal = VaultJournal(path, compact_threshold=5)
+        for i in range(5):
+            journal.add(make_trait(i))
+        journal.close()
+
+        assert json.loads(path.read_text()) == [make_trait(i) for i in range(5)]
+        assert not journal.journal_path.exists()
+        assert journal.pending_ops == 0
+        assert VaultJournal(path).traits == [make_trait(i) for i in range(5)]
+
+    def test_interrupted_compaction(self, vault_dir):
+        """A frozen journal is replayed only if the snapshot predates it"""
+        path = vault_dir / "vault.json"
+        journal = VaultJournal(path)
+        journal.add(make_trait(0))
+        journal.close()
+        frozen = journal.journal_path.with_name(journal.journal_path.name + ".00000000-0")
+
+        # Crash after freezing the journal but before the snapshot was written
+        journal.journal_path.replace(frozen)
+        assert VaultJournal(path).traits == [make_trait(0)]
+        assert not frozen.exists()
+
+        # Crash after the snapshot was written but before cleanup
+        frozen.write_text(json.dumps({"op": "add", "trait": make_trait(1)}) + "\n")
+        assert VaultJournal(path).traits == [make_trait(0)]
+
+    def test_shared_per_path(self, vault_dir, monkeypatch):
+        monkeypatch.setattr(vault_journal, "_journals", {})
+        assert journal_for(vault_dir / "v.json") is journal_for(vault_dir / "." / "v.json")
+
+
+class TestVaultManagerJournal:
+    def test_add_trait_is_journaled(self, monkeypatch):
+        path = Path(tempfile.mkdtemp())
+        try:
+            monkeypatch.setattr(vault_journal, "_journals", {})
+            monkeypatch.setattr(VaultManager, "VAULT_PATH", path / "vault.json")
+            manager = VaultManager()
+            assert manager.add_trait(make_trait(1))
+            assert manager.vault == [make_trait(1)]
+            assert not (path / "vault.json").exists()
+
+            monkeypatch.setattr(vault_journal, "_journals", {})
+            assert VaultManager().vault == [make_trait(1)]
+        finally:
+            shutil.rmtree(path)
@@ -0,0 +1,69 @@
+import argparse
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from modules.constants import DATA_DIR
+from modules.highlight_ring import HighlightRing
+from modules.run_store import RunHistoryStore
+from modules.storage_codecs import (
+    CodecRegistry, FileClass, format_report, select_codec, train_dictionary
+)
+
+
+def load_samples() -> dict:
+    """Collect sample records for each file class from the data directory"""
+    samples = {}
+
+    runs = []
+    for path in sorted((DATA_DIR / "runs").glob("*.json")):
+        with open(path, encoding='utf-8') as f:
+            runs.append(json.load(f))
+    history_dir = DATA_DIR / "runs" / "history"
+    if history_dir.exists():
+        runs.extend(RunHistoryStore(history_dir, background=False))
+    samples[FileClass.RUNS.value] = runs
+
+    # Trait dicts come from run loadouts and the vault
+    traits = [trait for run in runs for trait in run.get("traits", [])]
+    vault_path = DATA_DIR / "vault.json"
+    if vault_path.exists():
+        with open(vault_path, encoding='utf-8') as f:
+            traits.extend(json.load(f))
+    samples[FileClass.TRAITS.value] = traits
+
+    ring_path = DATA_DIR / "highlights" / "highlights.ring"
+    highlights_path = DATA_DIR / "highlights" / "highlights.json"
+    if ring_path.exists():
+        samples[FileClass.HIGHLIGHTS.value] = HighlightRing(ring_path).records()
+    elif highlights_path.exists():
+        with open(highlights_path, encoding='utf-8') as f:
+            samples[FileClass.HIGHLIGHTS.value] = json.load(f)
+
+    return {k: v for k, v in samples.items() if v}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare storage codecs on game data")
+    parser.add_argument("--apply", action="store_true",
+                        help="Persist the selected codec and dictionary per file class")
+    args = parser.parse_args()
+
+    registry = CodecRegistry()
+    results, selected = {}, {}
+
+    for file_class, records in load_samples().items():
+        if args.apply:
+            results[file_class] = registry.calibrate(file_class, records)
+        else:
+            results[file_class] = registry.benchmark(records, train_dictionary(records))
+        selected[file_class] = select_codec(results[file_class])
+
+    print(format_report(results, selected))
+    print("\n* = selected codec")
+
+
+if __name__ == "__main__":
+    main()